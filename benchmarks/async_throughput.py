@@ -0,0 +1,120 @@
+"""
+Scenario throughput: sync page objects one at a time vs. async page objects
+on one event loop with up to N contexts in flight.
+
+    python -m benchmarks.async_throughput --rounds 3 --concurrency 4
+    python -m benchmarks.async_throughput --scenario simple_form_demo --rounds 10
+
+Both modes use one browser and a fresh context per scenario run.
+"""
+import argparse
+import asyncio
+import time
+
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
+
+from src.pages.aio.scenarios import SCENARIOS
+from src.pages.drag_drop_sliders_page import DragDropSlidersPage
+from src.pages.input_form_submit_page import InputFormSubmitPage
+from src.pages.selenium_playground_home import SeleniumPlaygroundHome
+from src.pages.simple_form_demo_page import SimpleFormDemoPage
+from src.utils.aio_runner import AsyncScenarioRunner, failures
+from src.utils.config import Settings
+
+
+def _sync_simple_form_demo(page, base_url, timeout_ms):
+    SeleniumPlaygroundHome(page, base_url=base_url, default_timeout_ms=timeout_ms).open().open_simple_form_demo()
+    simple = SimpleFormDemoPage(page, base_url=base_url, default_timeout_ms=timeout_ms)
+    simple.assert_url_contains().enter_message("Welcome to TestMu AI").click_get_checked_value()
+    simple.assert_message_displayed("Welcome to TestMu AI")
+
+
+def _sync_drag_drop_sliders(page, base_url, timeout_ms):
+    SeleniumPlaygroundHome(page, base_url=base_url, default_timeout_ms=timeout_ms).open().open_drag_drop_sliders()
+    sliders = DragDropSlidersPage(page, base_url=base_url, default_timeout_ms=timeout_ms)
+    sliders.set_default_value_15_slider_to(95).assert_default_value_15_is(95)
+
+
+def _sync_input_form_submit(page, base_url, timeout_ms):
+    SeleniumPlaygroundHome(page, base_url=base_url, default_timeout_ms=timeout_ms).open().open_input_form_submit()
+    form = InputFormSubmitPage(page, base_url=base_url, default_timeout_ms=timeout_ms)
+    form.submit_blank_and_assert_error()
+    form.fill_form_and_submit()
+
+
+_SYNC = {
+    "simple_form_demo": _sync_simple_form_demo,
+    "drag_drop_sliders": _sync_drag_drop_sliders,
+    "input_form_submit": _sync_input_form_submit,
+}
+
+
+def _plan(names, rounds):
+    return [(f"{n}#{r}", n) for r in range(rounds) for n in names]
+
+
+def _run_sync(settings: Settings, plan, headless: bool):
+    failed = 0
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless)
+        try:
+            t0 = time.perf_counter()
+            for _, name in plan:
+                ctx = browser.new_context()
+                try:
+                    page = ctx.new_page()
+                    page.set_default_timeout(settings.timeout_ms)
+                    _SYNC[name](page, settings.base_url, settings.timeout_ms)
+                except Exception:
+                    failed += 1
+                finally:
+                    ctx.close()
+            return time.perf_counter() - t0, failed
+        finally:
+            browser.close()
+
+
+def _run_async(settings: Settings, plan, headless: bool, concurrency: int):
+    loop = asyncio.new_event_loop()
+    try:
+        pw = loop.run_until_complete(async_playwright().start())
+        browser = loop.run_until_complete(pw.chromium.launch(headless=headless))
+        try:
+            runner = AsyncScenarioRunner(loop, browser, concurrency, timeout_ms=settings.timeout_ms)
+            results = runner.run({
+                key: (lambda page, fn=SCENARIOS[name]: fn(page, settings.base_url, settings.timeout_ms))
+                for key, name in plan
+            })
+            return runner.wall_s, len(failures(results))
+        finally:
+            loop.run_until_complete(browser.close())
+            loop.run_until_complete(pw.stop())
+    finally:
+        loop.close()
+
+
+def main() -> None:
+    settings = Settings.load()
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rounds", type=int, default=2, help="runs of each scenario per mode")
+    ap.add_argument("--concurrency", type=int, default=settings.async_concurrency)
+    ap.add_argument("--scenario", choices=sorted(SCENARIOS), action="append")
+    ap.add_argument("--headed", action="store_true")
+    args = ap.parse_args()
+
+    plan = _plan(args.scenario or list(SCENARIOS), args.rounds)
+    headless = not args.headed
+    sync_s, sync_failed = _run_sync(settings, plan, headless)
+    async_s, async_failed = _run_async(settings, plan, headless, args.concurrency)
+
+    n = len(plan)
+    print(f"{'mode':<22}{'runs':>6}{'failed':>8}{'wall s':>10}{'runs/min':>10}")
+    print(f"{'sync':<22}{n:>6}{sync_failed:>8}{sync_s:>10.1f}{n / sync_s * 60:>10.1f}")
+    label = f"async (x{args.concurrency})"
+    print(f"{label:<22}{n:>6}{async_failed:>8}{async_s:>10.1f}{n / async_s * 60:>10.1f}")
+    print(f"speedup: {sync_s / async_s:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Per-test setup/teardown latency: fresh context per test vs. ContextPool.
+
+    python -m benchmarks.context_pool_bench --iterations 30
+    python -m benchmarks.context_pool_bench --url https://www.testmu.ai/selenium-playground/
+
+Both modes record video, HAR and a trace like the `context` fixture does.
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+from src.utils.context_pool import ContextPool
+
+_PAGE = "data:text/html,<title>bench</title><input id=msg><button>Go</button>"
+
+
+def _ms(t0: float) -> float:
+    return (time.perf_counter() - t0) * 1000
+
+
+def _unpooled(browser, out: Path, url: str, iterations: int):
+    setup, teardown = [], []
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        ctx = browser.new_context(
+            record_video_dir=str(out / "videos"),
+            record_har_path=str(out / f"unpooled_{i}.har"),
+            record_har_omit_content=False,
+        )
+        ctx.tracing.start(screenshots=True, snapshots=True, sources=True)
+        page = ctx.new_page()
+        setup.append(_ms(t0))
+
+        page.goto(url)
+
+        t0 = time.perf_counter()
+        page.close()
+        ctx.tracing.stop(path=str(out / f"unpooled_{i}.zip"))
+        ctx.close()
+        teardown.append(_ms(t0))
+    return setup, teardown
+
+
+def _pooled(browser, out: Path, url: str, iterations: int, size: int):
+    pool = ContextPool(browser, size, context_options={"record_video_dir": str(out / "videos")})
+    setup, teardown = [], []
+    try:
+        for i in range(iterations):
+            t0 = time.perf_counter()
+            ctx = pool.acquire(har_path=out / f"pooled_{i}.har")
+            page = ctx.new_page()
+            setup.append(_ms(t0))
+
+            page.goto(url)
+
+            t0 = time.perf_counter()
+            page.close()
+            pool.release(ctx, trace_path=out / f"pooled_{i}.zip")
+            teardown.append(_ms(t0))
+    finally:
+        pool.close()
+    return setup, teardown
+
+
+def _row(label: str, samples) -> str:
+    s = sorted(samples)
+    p95 = s[min(len(s) - 1, int(round(0.95 * (len(s) - 1))))]
+    return f"{label:<20}{statistics.mean(s):>10.1f}{statistics.median(s):>10.1f}{p95:>10.1f}"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--iterations", type=int, default=20)
+    ap.add_argument("--pool-size", type=int, default=2)
+    ap.add_argument("--url", default=_PAGE)
+    ap.add_argument("--headed", action="store_true")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, sync_playwright() as p:
+        out = Path(tmp)
+        browser = p.chromium.launch(headless=not args.headed)
+        try:
+            # warm-up so the first launch-related costs don't skew either mode
+            _unpooled(browser, out, args.url, 1)
+            u_setup, u_teardown = _unpooled(browser, out, args.url, args.iterations)
+            p_setup, p_teardown = _pooled(browser, out, args.url, args.iterations, args.pool_size)
+        finally:
+            browser.close()
+
+    print(f"{'ms per test':<20}{'mean':>10}{'median':>10}{'p95':>10}")
+    print(_row("unpooled setup", u_setup))
+    print(_row("pooled setup", p_setup))
+    print(_row("unpooled teardown", u_teardown))
+    print(_row("pooled teardown", p_teardown))
+    total_u = statistics.mean(u_setup) + statistics.mean(u_teardown)
+    total_p = statistics.mean(p_setup) + statistics.mean(p_teardown)
+    print(f"setup+teardown: unpooled {total_u:.1f} ms, pooled {total_p:.1f} ms ({total_u - total_p:+.1f} ms saved per test)")
+
+
+if __name__ == "__main__":
+    main()
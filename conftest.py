@@ -1,36 +1,578 @@
 # conftest.py
+import asyncio
+import json
 import os
+import time
 import pytest
+from dataclasses import asdict
 from pathlib import Path
 from datetime import datetime
 from playwright.sync_api import sync_playwright
-from src.utils.config import Settings
+from playwright.async_api import async_playwright
+from src.utils.config import Settings, _parse_workers
 from src.utils.logger import get_logger
+from src.utils.artifacts import ARTIFACTS_ROOT, artifacts_root
+from src.utils import parallel
+from src.utils import matrix
+from src.utils import history
+from src.utils.history import HISTORY
+from src.utils.data_source import DataSource, DataStats, data_report, report_record
+from src.utils.context_pool import ContextPool
+from src.utils import capture
+from src.utils.har_store import HarStore
+from src.utils.network_policy import NetworkFilter
+from src.utils.waits import WAIT_STATS, flag_fixed_sleeps
+from src.utils.locator_resolver import RESOLVER
+from src.utils.aio_runner import AsyncScenarioRunner
+from src.utils.steps import STEPS, slowest_steps
+from src.utils import benchmark
+from src.utils.warm_state import FIRST_PAINT_JS, WarmState, first_paint_ms
+from src.pages.selenium_playground_home import SeleniumPlaygroundHome
+from src.utils.route_map import ROUTES
+from src.utils.console_capture import ConsoleBuffer, ConsoleWriter
+from src.utils.blob_store import BlobStore
+from src.utils.finalizer import ArtifactFinalizer, prune
+from src.utils.browser_daemon import BrowserDaemon
+from src.utils.checkpoints import CHECKPOINTS, Checkpoints, ResumeStats, resume_report
+from src.utils.perf_metrics import PERF_HISTORY, PerfCollector, medians, perf_report, trend_samples
 
 # -----------------------------------------------------------------------------
-# Artifact folders
+# Artifact folders (namespaced per worker in parallel mode)
 # -----------------------------------------------------------------------------
-_ARTIFACTS = Path("artifacts")
+_ARTIFACTS = artifacts_root()
 (_ARTIFACTS / "screenshots").mkdir(parents=True, exist_ok=True)
 (_ARTIFACTS / "videos").mkdir(parents=True, exist_ok=True)
 (_ARTIFACTS / "har").mkdir(parents=True, exist_ok=True)
 (_ARTIFACTS / "trace").mkdir(parents=True, exist_ok=True)
 (_ARTIFACTS / "console").mkdir(parents=True, exist_ok=True)
+(_ARTIFACTS / "steps").mkdir(parents=True, exist_ok=True)
+(_ARTIFACTS / "perf").mkdir(parents=True, exist_ok=True)
 
 logger = get_logger()
 
+# -----------------------------------------------------------------------------
+# Parallel mode: --workers N (or WORKERS=N / auto) forks N pytest workers,
+# each with its own sync_playwright() + browser, and shards tests across them
+# -----------------------------------------------------------------------------
+def pytest_addoption(parser):
+    parser.addoption(
+        "--workers",
+        action="store",
+        default=None,
+        help="Run tests in N worker processes ('auto' = one per CPU). Defaults to WORKERS env / 1.",
+    )
+    group = parser.getgroup("benchmark", "scenario benchmark mode")
+    group.addoption("--benchmark", action="store_true", help="Repeat every scenario and compare timings with a baseline.")
+    group.addoption("--benchmark-runs", type=int, default=5, help="Measured runs per scenario (default 5).")
+    group.addoption("--benchmark-warmup", type=int, default=1, help="Unmeasured warm-up runs per scenario (default 1).")
+    group.addoption("--benchmark-baseline", default="benchmarks/baseline.json", help="Baseline JSON to compare with / save to.")
+    group.addoption("--benchmark-save", action="store_true", help="Write this run's results as the new baseline.")
+    group.addoption("--benchmark-threshold", type=float, default=20.0, help="Allowed median slowdown in percent (default 20).")
+
+def _requested_workers(config) -> int:
+    if config.getoption("benchmark"):
+        return 1  # concurrent workers would skew the timings
+    opt = config.getoption("workers")
+    if opt is not None:
+        return _parse_workers(opt, 1)
+    s = config._pw_settings
+    # BROWSERS matrix: at least one worker per engine so the engines run side by side
+    return max(s.workers, len(s.browsers))
+
+_worker_stats = parallel.WorkerStats(worker=os.environ[parallel.WORKER_ID_ENV]) \
+    if parallel.is_worker() else None
+
+# (nodeid, bytes written, seconds) per test, for the terminal summary
+_artifact_totals = []
+# (nodeid, hits, misses, recorded) per test in replay mode
+_replay_totals = []
+# (nodeid, requests blocked, bytes saved) per test with NETWORK_FILTER
+_filter_totals = []
+# step -> total ms spent in WaitEngine conditions; (nodeid, step, sleep) for fixed sleeps
+_wait_totals = {}
+_fixed_sleeps = []
+# "Class.method" -> span durations (ms) across the session
+_step_durations = {}
+# (nodeid, first paint ms) per test with WARM_STATE
+_first_paint_totals = []
+# ArtifactFinalizer summary line, shown under the artifacts section
+_finalizer_summary = []
+# PERF_METRICS samples (one per navigation) and (nodeid, violation) pairs
+_perf_samples = []
+_perf_violations = []
+# BROWSER_DAEMON connect vs cold start line
+_daemon_summary = []
+# worker id -> DataStats for @pytest.mark.records tests (this process' entry is "main" / its worker id)
+_data_stats = {}
+# engine -> matrix.EngineStats with BROWSERS=a,b,... (merged from workers in parallel mode)
+_engine_stats = {}
+# TEST_HISTORY run id / rows written and the SCHEDULE=lpt balance line
+_history_summary = []
+# CHECKPOINTS captures and resumed reruns (merged from workers in parallel mode)
+_resume_stats = ResumeStats()
+
+def pytest_configure(config):
+    config._pw_pool_results = None
+    config._pw_benchmark = benchmark.BenchmarkRecorder() if config.getoption("benchmark") else None
+    config._pw_regressions = []
+    # env settings parsed once here; the `settings` fixture loads its own copy
+    s = config._pw_settings = Settings.load()
+    config._pw_browsers = s.browsers
+    config._pw_data_limit = s.data_limit
+    config._pw_history = s.test_history
+    config._pw_schedule = s.schedule
+    config._pw_started = time.time()
+    config._pw_warm_state = None
+
+# -----------------------------------------------------------------------------
+# Browser matrix: BROWSERS=chromium,firefox,webkit parametrizes every browser
+# test with a session-scoped `browser_name`; workers are assigned per engine
+# -----------------------------------------------------------------------------
+def _parametrize_engines(metafunc):
+    browsers = metafunc.config._pw_browsers
+    if len(browsers) > 1 and "browser" in metafunc.fixturenames:
+        metafunc.parametrize("browser_name", browsers, ids=list(browsers), scope="session")
+
+def _record_engine(report):
+    engine = matrix.report_engine(report)
+    if engine is not None:
+        _engine_stats.setdefault(engine, matrix.EngineStats()).record(report)
+
+# -----------------------------------------------------------------------------
+# Test history: every phase's duration goes to artifacts/history.sqlite; with
+# SCHEDULE=lpt the parent packs tests onto workers longest-first from it
+# (record tests are already sharded at collection unless there is a matrix)
+# -----------------------------------------------------------------------------
+def _record_history(item, rep):
+    if item.config._pw_history:
+        worker = _worker_stats.worker if _worker_stats else "main"
+        HISTORY.add(item.nodeid, worker, rep.when, rep.outcome, rep.duration)
+
+def _plan_schedule(items, count: int, config) -> Path:
+    if len(config._pw_browsers) == 1:
+        items = [it for it in items if it.get_closest_marker("records") is None]
+    nodeids = [it.nodeid for it in items]
+    durations = history.with_defaults(nodeids, HISTORY.expected_durations(nodeids))
+    groups = {None: list(range(count))}
+    if len(config._pw_browsers) > 1:
+        groups.update(matrix.engine_workers(config._pw_browsers, count))
+    by_group = {}
+    for it in items:
+        engine = matrix.engine_of(it)
+        by_group.setdefault(engine if engine in groups else None, {})[it.nodeid] = durations[it.nodeid]
+    assignment = {}
+    for group, planned in by_group.items():
+        assignment.update(history.lpt(planned, groups[group]))
+    _history_summary.append(history.balance_report(assignment, durations))
+    return history.write_schedule(ARTIFACTS_ROOT / "schedule.json", assignment, durations)
+
+def _scheduled_share(items, index: int, count: int):
+    """This worker's items per the parent's plan; items missing from it go round-robin."""
+    plan = history.read_schedule(Path(os.environ[history.SCHEDULE_ENV]))
+    planned = [it for it in items if it.nodeid in plan]
+    unplanned = [it for it in items if it.nodeid not in plan]
+    return [it for it in planned if plan[it.nodeid]["worker"] == index] + parallel.shard(unplanned, index, count)
+
+def _finish_history(session):
+    config = session.config
+    if not config._pw_history:
+        return
+    try:
+        rows = HISTORY.flush(1, config.invocation_params.args, started=config._pw_started)
+    except Exception as e:  # a locked / unwritable DB must not fail the run
+        logger.warning(f"Could not write test history to {HISTORY.path}: {e}")
+        return
+    if rows and not parallel.is_worker():
+        _history_summary.insert(0, f"run #{HISTORY.run_id}: {rows} phase results written to {HISTORY.path}")
+
+# -----------------------------------------------------------------------------
+# Data-driven tests: @pytest.mark.records("tests/data/x.csv") streams record
+# refs (offset + id) at collection and reads one record per test at setup.
+# Workers only collect their own share of the records.
+# -----------------------------------------------------------------------------
+def _parametrize_records(metafunc):
+    marker = metafunc.definition.get_closest_marker("records")
+    if marker is None or "record" not in metafunc.fixturenames:
+        return
+    config = metafunc.config
+    source = DataSource(Path(config.rootpath) / marker.args[0], id_field=marker.kwargs.get("id_field", "id"))
+    index, count = 0, 1
+    if parallel.is_worker() and len(config._pw_browsers) == 1:
+        # with a browser matrix the (test, engine) assignment decides instead
+        index, count = parallel.worker_index(), parallel.worker_count()
+    refs = list(source.refs(limit=config._pw_data_limit, index=index, count=count))
+    metafunc.parametrize("record", refs, ids=[r.id for r in refs], indirect=True)
+
+@pytest.fixture()
+def record(request):
+    # One row of the @pytest.mark.records file, read on demand
+    return request.param.load()
+
+def _record_data(report):
+    if report_record(report) is not None:
+        _data_stats.setdefault(_worker_stats.worker if _worker_stats else "main", DataStats()).record(report)
+
+# -----------------------------------------------------------------------------
+# Benchmark mode: --benchmark repeats every browser scenario warm-up + runs
+# times; measured runs feed per-phase stats that are compared with a baseline
+# -----------------------------------------------------------------------------
+def pytest_generate_tests(metafunc):
+    _parametrize_records(metafunc)
+    _parametrize_engines(metafunc)
+    config = metafunc.config
+    if not config.getoption("benchmark"):
+        return
+    if not {"page", "aio"} & set(metafunc.fixturenames):
+        return
+    warmup = max(0, config.getoption("benchmark_warmup"))
+    runs = max(1, config.getoption("benchmark_runs"))
+    metafunc.fixturenames.append("bench_round")
+    metafunc.parametrize(
+        "bench_round",
+        range(warmup + runs),
+        ids=[f"warmup{i + 1}" if i < warmup else f"run{i - warmup + 1}" for i in range(warmup + runs)],
+    )
+
+def _record_benchmark(item):
+    recorder = item.config._pw_benchmark
+    callspec = getattr(item, "callspec", None)
+    if recorder is None or callspec is None or "bench_round" not in callspec.params:
+        return
+    if callspec.params["bench_round"] < item.config.getoption("benchmark_warmup"):
+        return
+    reps = [getattr(item, f"rep_{when}", None) for when in ("setup", "call", "teardown")]
+    if any(r is None or not r.passed for r in reps):
+        return  # failed runs are reported as failures, not timings
+    phases = {r.when: r.duration * 1000 for r in reps}
+    phases[benchmark.TOTAL] = sum(phases.values())
+    for span in STEPS.spans:
+        if span.depth == 0:
+            phases[span.step] = phases.get(span.step, 0.0) + span.ms
+    recorder.add(_benchmark_key(item), phases)
+
+def _benchmark_key(item) -> str:
+    # item.name without the round: every record / engine parametrization stays its own scenario
+    base, _, ids = item.name.partition("[")
+    params = ids[:-1].rsplit("-", 1)  # bench_round is parametrized last, so its id is the last part
+    return f"{base}[{params[0]}]" if len(params) == 2 else base
+
+def _finish_benchmark(session):
+    config = session.config
+    recorder = config._pw_benchmark
+    if recorder is None or not recorder.samples:
+        return
+    recorder.save(_ARTIFACTS / "benchmark" / "results.json")
+    baseline_path = Path(config.getoption("benchmark_baseline"))
+    if config.getoption("benchmark_save"):
+        recorder.save(baseline_path)
+        logger.info(f"Benchmark baseline written to {baseline_path}")
+        return
+    baseline = benchmark.load_baseline(baseline_path)
+    if baseline is None:
+        logger.warning(f"No benchmark baseline at {baseline_path}; run with --benchmark-save to create one")
+        return
+    config._pw_regressions = benchmark.regressions(
+        recorder.stats(), baseline, config.getoption("benchmark_threshold")
+    )
+    if config._pw_regressions and session.exitstatus == 0:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+def pytest_collection_modifyitems(config, items):
+    for it in items:
+        engine = matrix.engine_of(it)
+        if engine is not None:
+            it.user_properties.append(("browser", engine))
+        callspec = getattr(it, "callspec", None)
+        if callspec is not None and "record" in callspec.params:
+            it.user_properties.append(("record", callspec.params["record"].id))
+    if not parallel.is_worker():
+        return
+    index, count = parallel.worker_index(), parallel.worker_count()
+    if len(config._pw_browsers) > 1:
+        if os.getenv(history.SCHEDULE_ENV):
+            keep = _scheduled_share(items, index, count)
+        else:
+            keep = matrix.shard_by_engine(items, config._pw_browsers, index, count)
+    else:
+        # record tests were already sharded while collecting (see _parametrize_records)
+        records = [it for it in items if it.get_closest_marker("records") is not None]
+        others = [it for it in items if it.get_closest_marker("records") is None]
+        if os.getenv(history.SCHEDULE_ENV):
+            keep = records + _scheduled_share(others, index, count)
+        else:
+            keep = records + parallel.shard(others, index, count)
+    kept = set(id(it) for it in keep)
+    deselected = [it for it in items if id(it) not in kept]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = keep
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session):
+    config = session.config
+    if parallel.is_worker() or config.option.collectonly or not session.items:
+        return None
+    count = min(_requested_workers(config), len(session.items))
+    if count <= 1:
+        return None
+
+    reporter = config.pluginmanager.getplugin("terminalreporter")
+    logger.info(f"Parallel mode: {count} workers for {len(session.items)} tests")
+    env = {}
+    if config._pw_history:
+        run_id = HISTORY.ensure_run(count, config.invocation_params.args, started=config._pw_started)
+        env[history.RUN_ID_ENV] = str(run_id)
+        _history_summary.append(f"run #{run_id}: phase results written by the workers to {HISTORY.path}")
+    if config._pw_schedule == "lpt":
+        env[history.SCHEDULE_ENV] = str(_plan_schedule(session.items, count, config))
+    pool = parallel.WorkerPool(
+        count,
+        config.invocation_params.args,
+        cwd=config.invocation_params.dir,
+        write_line=reporter.write_line,
+        env=env,
+    )
+    results = pool.run()
+    config._pw_pool_results = results
+    matrix.merge_json(_engine_stats, ((e, raw) for r in results for e, raw in r.engines.items()))
+    _data_stats.update({r.worker: DataStats(**r.data) for r in results if r.data})
+    for r in results:
+        if r.checkpoints:
+            _resume_stats.merge(ResumeStats(**r.checkpoints))
+        _perf_samples.extend(r.perf)
+    # Crashed workers (no stats, non-test exit codes) count as failures too
+    session.testsfailed = sum(
+        s.failed or (1 if s.exit_code not in (0, 1, 5) else 0) for s in results
+    )
+    return True
+
+def pytest_runtest_logreport(report):
+    if _worker_stats is not None:
+        _worker_stats.record(report)
+    _record_engine(report)
+    _record_data(report)
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    if _worker_stats is not None:
+        _worker_stats.engines = matrix.to_json(_engine_stats)
+        if _worker_stats.worker in _data_stats:
+            _worker_stats.data = asdict(_data_stats[_worker_stats.worker])
+        _worker_stats.checkpoints = asdict(_resume_stats)
+        _worker_stats.perf = trend_samples(_perf_samples)
+        _worker_stats.save()
+    RESOLVER.save()
+    ROUTES.save()
+    # earlier runs only: the summary compares this run against them
+    session.config._pw_perf_history = PERF_HISTORY.load()
+    if not parallel.is_worker():
+        # one history point per run: the parent holds the samples of all workers by now
+        PERF_HISTORY.save(medians(_perf_samples))
+    _finish_history(session)
+    _finish_benchmark(session)
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = getattr(config, "_pw_pool_results", None)
+    if results:
+        terminalreporter.section("worker utilization")
+        for line in parallel.utilization_report(results):
+            terminalreporter.write_line(line)
+
+    if _engine_stats:
+        terminalreporter.section("browser matrix")
+        for line in matrix.matrix_report(_engine_stats, time.time() - config._pw_started):
+            terminalreporter.write_line(line)
+
+    if _history_summary:
+        terminalreporter.section("test history")
+        for line in _history_summary:
+            terminalreporter.write_line(line)
+
+    if _resume_stats.captures or _resume_stats.retries:
+        terminalreporter.section("checkpoints")
+        for line in resume_report(_resume_stats):
+            terminalreporter.write_line(line)
+
+    if _data_stats:
+        terminalreporter.section("data records")
+        for line in data_report(_data_stats):
+            terminalreporter.write_line(line)
+
+    if _artifact_totals:
+        terminalreporter.section("artifacts")
+        for nodeid, nbytes, seconds in _artifact_totals:
+            terminalreporter.write_line(f"{nbytes / 1024:>10.1f} KiB {seconds * 1000:>8.0f} ms  {nodeid}")
+        total_b = sum(b for _, b, _ in _artifact_totals)
+        total_s = sum(s for _, _, s in _artifact_totals)
+        terminalreporter.write_line(f"{total_b / 1024:>10.1f} KiB {total_s * 1000:>8.0f} ms  total")
+        for line in _finalizer_summary:
+            terminalreporter.write_line(line)
+
+    if _replay_totals:
+        terminalreporter.section("har replay")
+        for nodeid, hits, misses, recorded in _replay_totals:
+            terminalreporter.write_line(f"hits={hits:<5} misses={misses:<5} recorded={recorded:<5} {nodeid}")
+
+    if _filter_totals:
+        terminalreporter.section("network filter")
+        for nodeid, blocked, saved in _filter_totals:
+            if saved is None:  # live mode: no HAR store to size blocked responses
+                terminalreporter.write_line(f"blocked={blocked:<5} {nodeid}")
+            else:
+                terminalreporter.write_line(f"blocked={blocked:<5} saved~{saved / 1024:>8.1f} KiB  {nodeid}")
+
+    resolver_lines = RESOLVER.report()
+    if resolver_lines:
+        terminalreporter.section("locator fallbacks")
+        for line in resolver_lines:
+            terminalreporter.write_line(line)
+
+    if _step_durations:
+        terminalreporter.section("slowest steps")
+        for line in slowest_steps(_step_durations):
+            terminalreporter.write_line(line)
+
+    recorder = getattr(config, "_pw_benchmark", None)
+    if recorder is not None and recorder.samples:
+        terminalreporter.section("benchmark")
+        for line in recorder.report():
+            terminalreporter.write_line(line)
+        for line in config._pw_regressions:
+            terminalreporter.write_line(f"REGRESSION {line}", red=True)
+
+    if _daemon_summary:
+        terminalreporter.section("browser daemon")
+        for line in _daemon_summary:
+            terminalreporter.write_line(line)
+
+    if _perf_samples:
+        terminalreporter.section("page performance")
+        for line in perf_report(_perf_samples, getattr(config, "_pw_perf_history", {})):
+            terminalreporter.write_line(line)
+        for nodeid, violation in _perf_violations:
+            terminalreporter.write_line(f"BUDGET {violation} ({nodeid})", yellow=True)
+
+    nav_lines = ROUTES.report()
+    if nav_lines:
+        terminalreporter.section("navigation")
+        for line in nav_lines:
+            terminalreporter.write_line(line)
+
+    if _first_paint_totals or config._pw_warm_state is not None:
+        terminalreporter.section("warm state")
+        warm = config._pw_warm_state
+        if warm is not None and None not in (warm.cold_first_paint_ms, warm.warm_first_paint_ms):
+            terminalreporter.write_line(
+                f"{warm.base_url} first paint: cold {warm.cold_first_paint_ms:.0f} ms, "
+                f"warm {warm.warm_first_paint_ms:.0f} ms "
+                f"({warm.cold_first_paint_ms - warm.warm_first_paint_ms:+.0f} ms saved, same session)"
+            )
+        for nodeid, fcp in _first_paint_totals:
+            terminalreporter.write_line(f"first paint {fcp:>7.0f} ms  {nodeid}")
+
+    if _wait_totals or _fixed_sleeps:
+        terminalreporter.section("waits")
+        for step, ms in sorted(_wait_totals.items(), key=lambda kv: -kv[1]):
+            terminalreporter.write_line(f"{ms:>10.0f} ms  {step}")
+        for nodeid, step, sleep in _fixed_sleeps:
+            terminalreporter.write_line(f"FIXED SLEEP {sleep} in {step} ({nodeid})", yellow=True)
+
 # -----------------------------------------------------------------------------
 # Settings (loaded once per session)
 # -----------------------------------------------------------------------------
 @pytest.fixture(scope="session")
-def settings() -> Settings:
+def settings(request) -> Settings:
     s = Settings.load()
     logger.info(
         f"Settings: base_url={s.base_url}, headless={s.headless}, "
-        f"slow_mo={s.slow_mo}, timeout_ms={s.timeout_ms}"
+        f"slow_mo={s.slow_mo}, timeout_ms={s.timeout_ms}, "
+        f"capture(video={s.video}, har={s.har}, trace={s.trace}, console={s.console}), "
+        f"network_mode={s.network_mode}, nav_mode={s.nav_mode}"
     )
+    if request.config.getoption("benchmark") and s.network_mode == "live":
+        logger.warning("Benchmarking against a live site; use NETWORK_MODE=replay or a local BASE_URL for stable numbers")
     return s
 
+# -----------------------------------------------------------------------------
+# Content-addressed blobs (artifacts/blobs/<sha256>), shared by all workers:
+# replay bodies always live here; with ARTIFACT_STORE=true kept HARs and
+# trace zips are packed into it as <test>.har.ref.json / <test>.trace.ref.json
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def blob_store():
+    store = BlobStore(ARTIFACTS_ROOT / "blobs")
+    yield store
+    if store.new_blobs or store.deduped_bytes:
+        logger.info(store.summary())
+
+# -----------------------------------------------------------------------------
+# Artifact finalization off the test path: once Playwright has written a file,
+# renaming, packing, deleting and indexing (artifacts/index.jsonl) run on
+# FINALIZER_WORKERS threads; flushed (and pruned to ARTIFACT_MAX_MB) at session end
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def finalizer(settings: Settings, blob_store):
+    fin = ArtifactFinalizer(
+        _ARTIFACTS / "index.jsonl",
+        workers=settings.finalizer_workers,
+        max_pending=settings.finalizer_max_pending,
+        blobs=blob_store if settings.artifact_store else None,
+    )
+    yield fin
+    t0 = time.perf_counter()
+    fin.close()
+    line = f"{fin.summary()}, session-end flush {(time.perf_counter() - t0) * 1000:.0f} ms"
+    if settings.artifact_max_mb > 0:
+        dirs = [_ARTIFACTS / d for d in ("videos", "har", "trace", "screenshots")]
+        freed = prune(dirs, settings.artifact_max_mb * 1024 * 1024)
+        line += f", pruned {freed / 1024 / 1024:.1f} MiB"
+    logger.info(line)
+    _finalizer_summary.append(line)
+
+def _keep_file(ledger, fin, item, kind: str, path: Path, rename_to: Path = None):
+    # size as written by Playwright; packing may store fewer new bytes (see index.jsonl)
+    ledger.kept_file(kind, path)
+    fin.keep(item.nodeid, kind, path, rename_to=rename_to)
+
+# -----------------------------------------------------------------------------
+# Offline replay: NETWORK_MODE=replay | record-missing serves every context
+# from an indexed store built out of the recorded artifacts/**/*.har files
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def har_store(settings: Settings, blob_store):
+    if settings.network_mode == "live":
+        return None
+    return HarStore(
+        Path(settings.har_store),
+        sources=[ARTIFACTS_ROOT],
+        record_missing=settings.network_mode == "record-missing",
+        blobs=blob_store,
+    ).load()
+
+# -----------------------------------------------------------------------------
+# Network layer per context: HAR replay route first, then the page-object
+# request filter (NETWORK_FILTER=true) which falls back to it for allowed requests
+# -----------------------------------------------------------------------------
+def _attach_network(context, settings: Settings, har_store):
+    replay = har_store.attach(context) if har_store is not None else None
+    flt = None
+    if settings.network_filter:
+        flt = NetworkFilter(context, size_hint=har_store.size_of if har_store is not None else None)
+    return replay, flt
+
+def _finish_network(item, replay, flt):
+    if flt is not None:
+        flt.detach()
+        item.user_properties.append(("requests_blocked", flt.blocked))
+        logger.info(f"Network filter for {item.name}: {flt.summary()}")
+        _filter_totals.append((item.nodeid, flt.blocked, flt.bytes_saved))
+    if replay is not None:
+        replay.detach()
+        item.user_properties.append(("har_hits", replay.hits))
+        item.user_properties.append(("har_misses", replay.misses))
+        logger.info(f"HAR replay for {item.name}: {replay.summary()}")
+        _replay_totals.append((item.nodeid, replay.hits, replay.misses, replay.recorded))
+
 # -----------------------------------------------------------------------------
 # Playwright / Browser lifetime
 # -----------------------------------------------------------------------------
@@ -39,79 +581,379 @@ def playwright_instance():
     with sync_playwright() as p:
         yield p
 
+def _connect_daemon(playwright_instance, settings: Settings):
+    """Attach to the shared browser daemon; None (cold launch) if that fails."""
+    daemon = BrowserDaemon(idle_timeout_s=settings.browser_daemon_idle)
+    try:
+        state = daemon.ensure(playwright_instance.chromium.executable_path, settings.headless)
+        t0 = time.perf_counter()
+        browser = playwright_instance.chromium.connect_over_cdp(state["endpoint"], slow_mo=settings.slow_mo)
+        connect_ms = (time.perf_counter() - t0) * 1000
+    except Exception as e:
+        logger.error(f"Browser daemon unavailable, launching a local browser: {e}")
+        return None, None, None
+    line = (
+        f"connected to pid {state['pid']} in {connect_ms:.0f} ms; cold start {state['cold_start_ms']:.0f} ms "
+        f"({state['cold_start_ms'] - connect_ms:+.0f} ms saved)"
+    )
+    logger.info(f"Browser daemon: {line}")
+    _daemon_summary.append(line)
+    return browser, daemon, daemon.acquire_lease()
+
+@pytest.fixture(scope="session")
+def browser_name(settings: Settings) -> str:
+    # Parametrized per engine when BROWSERS lists more than one
+    return settings.browsers[0]
+
 @pytest.fixture(scope="session")
-def browser(playwright_instance, settings: Settings):
+def browser(playwright_instance, settings: Settings, browser_name):
+    # BROWSER_DAEMON=true: reuse a long-lived Chromium across pytest runs
+    if settings.browser_daemon and browser_name == "chromium":
+        browser, daemon, lease = _connect_daemon(playwright_instance, settings)
+        if browser is not None:
+            yield browser
+            # disconnects and drops our contexts; the daemon keeps running
+            browser.close()
+            daemon.release_lease(lease)
+            return
     # Local, headed/ headless based on Settings
-    browser = playwright_instance.chromium.launch(
+    t0 = time.perf_counter()
+    browser = getattr(playwright_instance, browser_name).launch(
         headless=settings.headless,
         slow_mo=settings.slow_mo
     )
+    launch_s = time.perf_counter() - t0
+    logger.info(f"Launched {browser_name} {browser.version} in {launch_s * 1000:.0f} ms")
+    if len(settings.browsers) > 1:
+        _engine_stats.setdefault(browser_name, matrix.EngineStats()).launch_s += launch_s
     yield browser
     browser.close()
 
 # -----------------------------------------------------------------------------
-# Context per test (video, HAR, tracing)
+# Asyncio flavor: one event loop + async browser per session; the `aio` runner
+# drives up to ASYNC_CONCURRENCY contexts at once (see src/pages/aio/).
+# Started lazily, so sync-only runs never launch the second browser.
 # -----------------------------------------------------------------------------
-@pytest.fixture()
-def context(request, browser, settings: Settings):
-    test_name = request.node.name.replace("/", "_")
+@pytest.fixture(scope="session")
+def aio_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
 
-    har_path = (_ARTIFACTS / "har" / f"{test_name}.har").resolve()
-    context = browser.new_context(
-        record_video_dir=str((_ARTIFACTS / "videos").resolve()),
-        record_har_path=str(har_path),
-        record_har_omit_content=False,   # keep content for easier debugging
+@pytest.fixture(scope="session")
+def async_browser(aio_loop, settings: Settings):
+    pw = aio_loop.run_until_complete(async_playwright().start())
+    browser = aio_loop.run_until_complete(
+        pw.chromium.launch(headless=settings.headless, slow_mo=settings.slow_mo)
     )
-    # Enable tracing (viewable with `playwright show-trace trace.zip`)
-    context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    yield browser
+    aio_loop.run_until_complete(browser.close())
+    aio_loop.run_until_complete(pw.stop())
 
-    yield context
+@pytest.fixture()
+def aio(request, aio_loop, async_browser, settings: Settings):
+    STEPS.reset()
+    runner = AsyncScenarioRunner(
+        aio_loop,
+        async_browser,
+        settings.async_concurrency,
+        timeout_ms=settings.timeout_ms,
+        trace_policy=settings.trace,
+        trace_dir=_ARTIFACTS / "trace",
+    )
+    yield runner
+    _report_steps(request.node)
+    request.node.user_properties.append(("async_scenarios", len(runner.results)))
+    logger.info(f"Async runner for {request.node.name}: {runner.summary()}")
 
-    trace_zip = _ARTIFACTS / "trace" / f"{test_name}.zip"
+# -----------------------------------------------------------------------------
+# Warm session: WARM_STATE=true (opt-in) visits the site once per session (accepting
+# the cookie consent), saves storage_state and seeds every test context from it.
+# Shared by workers; rebuilt when BASE_URL changes or after WARM_STATE_TTL s.
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def warm_state(request, browser, settings: Settings, har_store):
+    if not settings.warm_state:
+        return None
+
+    def warm_up(page):
+        home = SeleniumPlaygroundHome(page, base_url=settings.base_url, default_timeout_ms=settings.timeout_ms).open()
+        home.waits.network_idle()
+        home.accept_cookies()
+
+    state = WarmState(ARTIFACTS_ROOT / "warm_state", settings.base_url, settings.warm_state_ttl)
+    prepare = lambda ctx: _attach_network(ctx, settings, har_store)
     try:
-        context.tracing.stop(path=str(trace_zip))
+        state.ensure(browser, warm_up, prepare=prepare)
     except Exception as e:
-        logger.error(f"Failed to save trace: {e}")
+        logger.error(f"Warm-up failed, tests start from a cold context: {e}")
+        return None
+    try:
+        # same URL, same session: the only difference is the seeded storage_state
+        state.compare(browser, settings.base_url, prepare=prepare)
+    except Exception as e:
+        logger.warning(f"Warm state: cold/warm first paint comparison failed: {e}")
+    request.config._pw_warm_state = state
+    return state
+
+# -----------------------------------------------------------------------------
+# Context per test (video, HAR, tracing)
+# CONTEXT_POOL=N reuses up to N reset contexts; @pytest.mark.isolated opts out.
+# VIDEO / HAR / TRACE / CONSOLE select a capture policy per artifact.
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def context_pool(browser, settings: Settings, warm_state):
+    if settings.context_pool <= 0:
+        yield None
+        return
+    options = {}
+    if settings.video != capture.OFF:
+        options["record_video_dir"] = str((_ARTIFACTS / "videos").resolve())
+    pool = ContextPool(
+        browser,
+        settings.context_pool,
+        context_options=options,
+        trace=settings.trace != capture.OFF,
+        storage_state=warm_state.state if warm_state is not None else None,
+    )
+    yield pool
+    logger.info(pool.summary())
+    pool.close()
+
+def _finish_file(ledger, fin, item, kind: str, path: Path, keep: bool):
+    if not path.exists():
+        return
+    if keep:
+        _keep_file(ledger, fin, item, kind, path)
+    else:
+        fin.discard(kind, path)
+        ledger.discarded_file(kind)
+
+@pytest.fixture()
+def context(request, browser, settings: Settings, context_pool, har_store, warm_state, finalizer):
+    item = request.node
+    test_name = item.name.replace("/", "_")
+    har_path = (_ARTIFACTS / "har" / f"{test_name}.har").resolve()
+    trace_zip = _ARTIFACTS / "trace" / f"{test_name}.zip"
+    ledger = capture.ledger_for(item)
+    record_har = capture.should_record(settings.har, item)
+    record_trace = capture.should_record(settings.trace, item)
 
-    context.close()
+    if context_pool is not None and item.get_closest_marker("isolated") is None:
+        context = context_pool.acquire(har_path=har_path if record_har else None)
+        network = _attach_network(context, settings, har_store)
+        yield context
+        _finish_network(item, *network)
+        keep_trace = capture.should_keep(settings.trace, item)
+        with ledger.timed():
+            context_pool.release(context, trace_path=trace_zip if keep_trace else None)
+            if keep_trace and trace_zip.exists():
+                _keep_file(ledger, finalizer, item, "trace", trace_zip)
+            _finish_file(ledger, finalizer, item, "har", har_path, capture.should_keep(settings.har, item))
+        return
+
+    options = {}
+    if warm_state is not None:
+        options["storage_state"] = warm_state.state
+    if capture.should_record(settings.video, item):
+        options["record_video_dir"] = str((_ARTIFACTS / "videos").resolve())
+    if record_har:
+        options["record_har_path"] = str(har_path)
+        options["record_har_omit_content"] = False   # keep content for easier debugging
+    context = browser.new_context(**options)
+    if record_trace:
+        # Enable tracing (viewable with `playwright show-trace trace.zip`)
+        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    network = _attach_network(context, settings, har_store)
+
+    yield context
+
+    _finish_network(item, *network)
+
+    with ledger.timed():
+        if record_trace:
+            try:
+                if capture.should_keep(settings.trace, item):
+                    context.tracing.stop(path=str(trace_zip))
+                    _keep_file(ledger, finalizer, item, "trace", trace_zip)
+                else:
+                    # no path: the trace buffer is dropped without touching disk
+                    context.tracing.stop()
+                    ledger.discarded_file("trace")
+            except Exception as e:
+                logger.error(f"Failed to save trace: {e}")
+
+        context.close()
+        if record_har:
+            _finish_file(ledger, finalizer, item, "har", har_path, capture.should_keep(settings.har, item))
+
+# -----------------------------------------------------------------------------
+# Wait instrumentation: time spent in BasePage.waits per step + fixed sleeps
+# -----------------------------------------------------------------------------
+def _report_waits(item):
+    per_step = WAIT_STATS.per_step()
+    item.user_properties.append(("wait_ms", round(WAIT_STATS.total_ms)))
+    if per_step:
+        steps = ", ".join(f"{k}={v:.0f}ms" for k, v in sorted(per_step.items(), key=lambda kv: -kv[1]))
+        logger.info(f"Waits for {item.name}: {steps}")
+    for step, ms in per_step.items():
+        _wait_totals[step] = _wait_totals.get(step, 0.0) + ms
+    for r in WAIT_STATS.fixed_sleeps():
+        logger.warning(f"Fixed sleep in {item.name}: {r.step} -> {r.condition}")
+        _fixed_sleeps.append((item.nodeid, r.step, r.condition))
+
+# -----------------------------------------------------------------------------
+# Step spans: every page-object method is timed (src/utils/steps.py); spans
+# are written to artifacts/steps/<test>.jsonl and feed the slowest-steps summary
+# -----------------------------------------------------------------------------
+def _report_steps(item):
+    test_name = item.name.replace("/", "_")
+    STEPS.write(_ARTIFACTS / "steps" / f"{test_name}.jsonl", item.nodeid)
+    for step, ms in STEPS.durations().items():
+        _step_durations.setdefault(step, []).extend(ms)
+    top = [s for s in STEPS.spans if s.depth == 0]
+    if top:
+        logger.info(f"Steps for {item.name}: " + ", ".join(f"{s.step}={s.ms:.0f}ms/{s.pw_calls} calls" for s in top))
+
+# -----------------------------------------------------------------------------
+# Page metrics: PERF_METRICS=true samples Navigation Timing, paints, long tasks
+# and CDP Performance.getMetrics after every page-object navigation and checks
+# the target page object's PERF_BUDGETS (PERF_BUDGETS=warn | enforce | off)
+# -----------------------------------------------------------------------------
+def _finish_perf(item, perf):
+    if perf is None:
+        return
+    perf.detach()
+    test_name = item.name.replace("/", "_")
+    if perf.samples:
+        with (_ARTIFACTS / "perf" / f"{test_name}.jsonl").open("w", encoding="utf-8") as fh:
+            for sample in perf.samples:
+                fh.write(json.dumps({"test": item.nodeid, **sample}) + "\n")
+    _perf_samples.extend(perf.samples)
+    item.user_properties.append(("perf_violations", len(perf.violations)))
+    for violation in perf.violations:
+        logger.warning(f"Performance budget for {item.name}: {violation}")
+        _perf_violations.append((item.nodeid, violation))
+
+def _report_first_paint(item, page, warm_state):
+    fcp = first_paint_ms(page)
+    if fcp is None or warm_state is None:
+        return
+    item.user_properties.append(("first_paint_ms", round(fcp)))
+    _first_paint_totals.append((item.nodeid, fcp))
 
 # -----------------------------------------------------------------------------
-# Page per test + console logging
+# Console pipeline: event handlers only append to a per-test ring buffer;
+# kept buffers are written as JSONL by a background thread (rotated file)
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def console_writer(settings: Settings):
+    if settings.console == capture.OFF:
+        yield None
+        return
+    writer = ConsoleWriter(
+        _ARTIFACTS / "console" / "console.jsonl",
+        max_bytes=settings.console_max_bytes,
+        backups=settings.console_backups,
+    )
+    yield writer
+    writer.close()
+    logger.info(f"Console writer: {writer.summary()}")
+
+def _finish_console(item, buffer, writer, settings: Settings, ledger):
+    if buffer is None:
+        return
+    item.user_properties.append(("console_messages", buffer.seen))
+    if buffer.dropped:
+        item.user_properties.append(("console_dropped", buffer.dropped))
+        logger.warning(f"Console capture for {item.name}: dropped {buffer.dropped} of {buffer.seen} messages (cap {buffer.records.maxlen})")
+    if writer is None or not capture.should_keep(settings.console, item):
+        ledger.discarded_file("console")
+        return
+    if writer.submit(buffer):
+        ledger.kept_stream("console", writer.path)
+    else:
+        logger.warning(f"Console writer queue full, dropped {len(buffer.records)} records of {item.name}")
+
+# -----------------------------------------------------------------------------
+# Page per test
 # -----------------------------------------------------------------------------
 @pytest.fixture()
-def page(request, context, settings: Settings):
+def page(request, context, settings: Settings, warm_state, console_writer, finalizer):
+    item = request.node
     p = context.new_page()
     p.set_default_timeout(settings.timeout_ms)
+    p.add_init_script(FIRST_PAINT_JS)
+    # Deep-link into scenarios unless NAV_MODE=click or the test covers the nav itself
+    ROUTES.enabled = settings.nav_mode == "deep-link" and item.get_closest_marker("nav_coverage") is None
+    WAIT_STATS.reset()
+    STEPS.reset()
+    flag_fixed_sleeps(p)
+    perf = PerfCollector(p, mode=settings.perf_budgets) if settings.perf_metrics else None
 
-    test_name = request.node.name.replace("/", "_")
-    console_path = (_ARTIFACTS / "console" / f"{test_name}.log")
-    console_file = console_path.open("a", encoding="utf-8")
-
-    def _log(msg):
-        # NOTE: ConsoleMessage API uses methods .type() and .text()
-        try:
-            console_file.write(f"{msg.type()}: {msg.text()}\n")
-            console_file.flush()
-        except Exception:
-            # swallow logging errors; do not break the test
-            pass
-
-    p.on("console", _log)
+    console = None
+    if capture.should_record(settings.console, item):
+        console = ConsoleBuffer(
+            item.nodeid,
+            settings.console_max_messages,
+            min_level=settings.console_level,
+            events=settings.console_events,
+        )
+        console.attach(p)
 
     yield p
 
-    try:
+    ROUTES.enabled = False
+    _report_waits(item)
+    _report_steps(item)
+    _report_first_paint(item, p, warm_state)
+    _finish_perf(item, perf)
+
+    ledger = capture.ledger_for(item)
+    with ledger.timed():
         p.close()
-    finally:
-        console_file.close()
+        if p.video is not None:
+            video_path = Path(p.video.path())
+            if capture.should_keep(settings.video, item):
+                # Playwright names videos by page guid; the finalizer renames them per test
+                test_name = item.name.replace("/", "_")
+                _keep_file(ledger, finalizer, item, "video", video_path,
+                           rename_to=video_path.with_name(f"{test_name}{video_path.suffix}"))
+            else:
+                # Chromium encodes video while recording; drop the file on pass
+                p.video.delete()
+                ledger.discarded_file("video")
+
+        _finish_console(item, console, console_writer, settings, ledger)
+
+# -----------------------------------------------------------------------------
+# Step checkpoints: with CHECKPOINTS=true, steps run through `checkpoints.step`
+# are checkpointed and a rerun (pytest-rerunfailures) resumes after the last one
+# -----------------------------------------------------------------------------
+@pytest.fixture()
+def checkpoints(request, page, settings: Settings):
+    item = request.node
+    cp = Checkpoints(
+        page,
+        item.nodeid,
+        CHECKPOINTS,
+        _resume_stats,
+        retry=capture.retry_count(item) > 0,
+        enabled=settings.checkpoints,
+    )
+    yield cp
+    cp.finish(passed=not capture.item_failed(item))
 
 # -----------------------------------------------------------------------------
-# On failure: capture screenshot automatically
+# Reports: remember per-phase results (capture policies read them at teardown),
+# capture a screenshot on failure and log artifact cost per test
 # -----------------------------------------------------------------------------
 @pytest.hookimpl(hookwrapper=True, tryfirst=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
+    _record_history(item, rep)
 
     if rep.when == "call" and rep.failed:
         page = item.funcargs.get("page")
@@ -119,8 +961,27 @@ def pytest_runtest_makereport(item, call):
             ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
             name = item.name.replace("/", "_")
             path = _ARTIFACTS / "screenshots" / f"{name}_{ts}.png"
+            ledger = capture.ledger_for(item)
+            fin = item.funcargs.get("finalizer")
             try:
-                page.screenshot(path=str(path))
+                with ledger.timed():
+                    if fin is not None:
+                        # capture on the test thread, write on the finalizer
+                        data = page.screenshot()
+                        fin.write(item.nodeid, "screenshot", path, data)
+                        ledger.kept_bytes("screenshot", path, len(data))
+                    else:
+                        page.screenshot(path=str(path))
+                        ledger.kept_file("screenshot", path)
                 logger.error(f"Saved failure screenshot: {path}")
             except Exception as e:
-                logger.error(f"Failed to capture screenshot: {e}")
\ No newline at end of file
+                logger.error(f"Failed to capture screenshot: {e}")
+
+    if rep.when == "teardown":
+        _record_benchmark(item)
+        ledger = getattr(item, "_artifact_ledger", None)
+        if ledger is not None:
+            rep.user_properties.append(("artifact_bytes", ledger.bytes_written))
+            rep.user_properties.append(("artifact_ms", round(ledger.seconds * 1000)))
+            logger.info(f"Artifacts for {item.name}: {ledger.summary()}")
+            _artifact_totals.append((item.nodeid, ledger.bytes_written, ledger.seconds))
@@ -0,0 +1,73 @@
+import re
+from typing import Dict, Mapping, Optional, Sequence
+
+from playwright.async_api import Locator, Page, expect
+
+from ...utils.bulk_fill import FieldDescriptor, bulk_fill_async
+from ...utils.locator_resolver import RESOLVER, Strategy
+from ...utils.steps import instrument
+from ...utils.waits import AsyncWaitEngine
+
+
+class BasePage:
+    """
+    playwright.async_api counterpart of src.pages.base_page.BasePage.
+
+    Same constructor and helpers; every step that talks to the browser is a
+    coroutine, so several scenarios can share one event loop and one browser.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        # Every page object's public methods are timed as nested step spans (src/utils/steps.py)
+        super().__init_subclass__(**kwargs)
+        instrument(cls)
+
+    def __init__(self, page: Page, base_url: Optional[str] = None, default_timeout_ms: int = 30000):
+        self.page = page
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.page.set_default_timeout(default_timeout_ms)
+        self.waits = AsyncWaitEngine(page)
+
+    async def resolve(
+        self,
+        element: str,
+        candidates: Sequence[Strategy],
+        root: Optional[Locator] = None,
+        required: bool = True,
+    ) -> Optional[Locator]:
+        """See the sync BasePage.resolve; the winner cache is shared with it."""
+        loc, winner = await RESOLVER.resolve_async(self.page, type(self).__name__, element, candidates, root=root)
+        if winner is None and not required:
+            return None
+        return loc
+
+    async def fill_fields(
+        self,
+        fields: Mapping[FieldDescriptor, object],
+        root: Optional[Locator] = None,
+        strict: bool = True,
+    ) -> Dict[str, dict]:
+        """See the sync BasePage.fill_fields."""
+        report = await bulk_fill_async(self.page, fields, root=root)
+        failed = {k: v["error"] for k, v in report.items() if not v["ok"]}
+        if strict and failed:
+            raise AssertionError(f"Could not fill fields {failed}. URL: {self.page.url}")
+        return report
+
+    async def goto(self, path: str = "/"):
+        if path.startswith("http"):
+            url = path
+        else:
+            if not self.base_url:
+                raise ValueError("Base URL is not configured for this page.")
+            url = f"{self.base_url}{path}"
+        await self.page.goto(url)
+        return self
+
+    async def should_have_url_containing(self, fragment: str):
+        pattern = re.compile(rf".*{re.escape(fragment)}.*")
+        await expect(self.page).to_have_url(pattern)
+        return self
+
+
+instrument(BasePage)
@@ -0,0 +1,56 @@
+from .base_page import BasePage
+from .range_slider import RangeSlider
+from playwright.async_api import expect
+
+class DragDropSlidersPage(BasePage):
+    DEFAULT_15 = "Default value 15"
+
+    async def _get_slider_container(self, label: str = DEFAULT_15):
+        """Innermost element holding both the slider title and a range input"""
+        container = self.page.locator(
+            f"section:has-text('{label}'):has(input[type='range']), "
+            f"div:has-text('{label}'):has(input[type='range']), "
+            f".slider-container:has-text('{label}')"
+        ).last
+        await container.wait_for(state="visible", timeout=5000)
+        return container
+
+    async def _slider(self, label: str = DEFAULT_15):
+        group = await self._get_slider_container(label)
+        slider = group.locator("input[type='range'], input[role='slider'], input.range-slider").first
+        await slider.wait_for(state="visible", timeout=5000)
+        return slider
+
+    async def _display(self, label: str = DEFAULT_15):
+        g = await self._get_slider_container(label)
+        disp = g.locator(
+            "output, "
+            ".value, "
+            ".range-value, "
+            "#range, "
+            "span[id*='range'], "
+            "#rangeSuccess"
+        ).first
+        if await disp.count() > 0:
+            return disp
+        return g.locator("text=/^\\d+$/").first
+
+    async def slider(self, label: str = DEFAULT_15) -> RangeSlider:
+        return RangeSlider(await self._slider(label), self.waits, display=await self._display(label))
+
+    async def set_slider_to(self, label: str, target: int, mode: str = "dispatch"):
+        await (await self.slider(label)).set_value(target, mode=mode)
+        return self
+
+    async def set_default_value_15_slider_to(self, target: int, mode: str = "dispatch"):
+        return await self.set_slider_to(self.DEFAULT_15, target, mode=mode)
+
+    async def assert_default_value_15_is(self, expected: int):
+        display = await self._display()
+        await display.wait_for(state="visible", timeout=5000)
+        actual_text = (await display.inner_text()).strip()
+        actual_value = int("".join(ch for ch in actual_text if ch.isdigit()))
+        # Same ±1 tolerance as the sync page object
+        if abs(actual_value - expected) > 1:
+            await expect(display).to_have_text(str(expected), timeout=10000)
+        return self
@@ -0,0 +1,178 @@
+# src/pages/aio/input_form_submit_page.py
+import re
+from playwright.async_api import expect, Error as PWError
+from .base_page import BasePage
+from ..input_form_submit_page import InputFormSubmitPage as _SyncPage
+
+_ERROR_BANNER = ",".join([
+    "[role='alert']",
+    ".alert",
+    ".alert-danger",
+    ".errors",
+    ".error",
+    ".validation-summary-errors",
+    ".toast, .snackbar, .notification",
+])
+
+_FORM_VALIDITY_JS = """form => {
+    const invalids = Array.from(form.querySelectorAll(':invalid'));
+    return {valid: form.checkValidity(), count: invalids.length};
+}"""
+
+
+class InputFormSubmitPage(BasePage):
+    # Same fallback chains as the sync page object
+    SUBMIT_BUTTON = _SyncPage.SUBMIT_BUTTON
+    FORM = _SyncPage.FORM
+    COUNTRY_SELECT = _SyncPage.COUNTRY_SELECT
+    NAME = _SyncPage.NAME
+    EMAIL = _SyncPage.EMAIL
+    PASSWORD = _SyncPage.PASSWORD
+    COMPANY = _SyncPage.COMPANY
+    WEBSITE = _SyncPage.WEBSITE
+    CITY = _SyncPage.CITY
+    ADDRESS1 = _SyncPage.ADDRESS1
+    ADDRESS2 = _SyncPage.ADDRESS2
+    STATE = _SyncPage.STATE
+    ZIPCODE = _SyncPage.ZIPCODE
+    COOKIE_ACCEPT = _SyncPage.COOKIE_ACCEPT
+
+    # ---------- Utilities: main form, banner, overlays ----------
+
+    async def _form(self):
+        return (await self.resolve("form", self.FORM)).first
+
+    async def _dismiss_cookie_banner(self):
+        try:
+            el = await self.resolve("cookie_accept", self.COOKIE_ACCEPT, required=False)
+            if el is not None:
+                await el.first.click(timeout=1000, force=True)
+        except Exception:
+            pass
+
+    def _error_banner(self):
+        return self.page.locator(_ERROR_BANNER).filter(
+            has_text=re.compile(r"Please\s+fill\s+in\s+the\s+fields", re.I)
+        )
+
+    async def _close_error_banner_if_present(self):
+        banner = self._error_banner()
+        if not await banner.count():
+            return
+        close = banner.locator(
+            "button:has-text('×'), button.close, [aria-label='Close'], [data-dismiss='alert']"
+        )
+        try:
+            if await close.count():
+                await close.first.click(force=True, timeout=1000)
+            else:
+                await banner.first.evaluate("n => { n.style.display='none'; }")
+        except Exception:
+            pass
+
+    async def _submit_button_scoped(self):
+        return (await self.resolve("submit", self.SUBMIT_BUTTON, root=await self._form())).first
+
+    def _success_banner(self):
+        return self.page.get_by_text(
+            "Thanks for contacting us, we will get back to you shortly.", exact=False
+        )
+
+    async def _click_submit(self):
+        # Click with one retry if re-render detaches the node
+        submit = await self._submit_button_scoped()
+        await expect(submit).to_be_attached(timeout=5000)
+        for attempt in range(2):
+            try:
+                await submit.scroll_into_view_if_needed()
+                await submit.click()
+                break
+            except PWError as e:
+                submit = await self._submit_button_scoped()
+                if "not attached" in str(e).lower() and attempt == 0:
+                    continue
+                await submit.click(force=True)
+                break
+
+    # ---------- Steps 2 & 3: Blank submit + assert validation ----------
+
+    async def submit_blank_and_assert_error(self):
+        await self._dismiss_cookie_banner()
+        await self.waits.dom_settled()
+
+        frm = await self._form()
+        await frm.scroll_into_view_if_needed()
+        await self.waits.element_stable(frm)
+        await expect(frm).to_be_attached(timeout=5000)
+
+        await self._click_submit()
+
+        # (A) Assignment banner
+        try:
+            await expect(self._error_banner()).to_be_visible(timeout=2500)
+            await self._close_error_banner_if_present()
+            return self
+        except AssertionError:
+            pass
+
+        # (B) Native HTML5 validation (no DOM banner)
+        info = await frm.evaluate(_FORM_VALIDITY_JS)
+        if info and (info.get("valid") is False) and (info.get("count", 0) > 0):
+            return self
+
+        # (C) Generic fallback
+        generic = self.page.get_by_text(re.compile(r"Please\s+fill", re.I))
+        try:
+            await expect(generic).to_be_visible(timeout=1500)
+            await self._close_error_banner_if_present()
+            return self
+        except AssertionError:
+            raise AssertionError(
+                "No error banner and no native invalid fields detected after blank Submit. "
+                f"URL: {self.page.url}"
+            )
+
+    # ---------- Steps 4–7: Fill all fields & final submit ----------
+
+    async def fill_form_and_submit(
+        self,
+        name="Madhira Sirisha",
+        email="sirisha@example.com",
+        password="Secure@1234",
+        company="Contoso QA",
+        website="https://example.com",
+        country_label="United States",
+        city="Hyderabad",
+        address1="Road No 1",
+        address2="Banjara Hills",
+        state="Telangana",
+        zipcode="500034",
+    ):
+        await self._close_error_banner_if_present()
+
+        self.last_fill_report = await self.fill_fields(
+            {
+                self.NAME: name,
+                self.EMAIL: email,
+                self.PASSWORD: password,
+                self.COMPANY: company,
+                self.WEBSITE: website,
+                self.COUNTRY_SELECT: country_label,
+                self.CITY: city,
+                self.ADDRESS1: address1,
+                self.ADDRESS2: address2,
+                self.STATE: state,
+                self.ZIPCODE: zipcode,
+            },
+            root=await self._form(),
+        )
+
+        await self._click_submit()
+
+        success_banner = self._success_banner()
+        await success_banner.wait_for(state="attached", timeout=8000)
+        try:
+            await expect(success_banner).to_contain_text("Thanks for contacting us", timeout=5000)
+        except AssertionError:
+            await expect(success_banner).to_be_visible(timeout=3000)
+        return self
@@ -0,0 +1,45 @@
+from typing import Optional
+
+from playwright.async_api import Locator
+
+from ..range_slider import _BOUNDS_JS, _DISPATCH_JS, RangeSlider as _SyncSlider
+from ...utils.steps import instrument
+from ...utils.waits import AsyncWaitEngine, _VALUE_JS
+
+
+class RangeSlider:
+    """Async counterpart of src.pages.range_slider.RangeSlider (same JS, same key plan)."""
+
+    snap = staticmethod(_SyncSlider.snap)
+    key_plan = staticmethod(_SyncSlider.key_plan)
+
+    def __init__(self, slider: Locator, waits: AsyncWaitEngine, display: Optional[Locator] = None):
+        self.slider = slider
+        self.display = display
+        self.waits = waits
+
+    async def bounds(self) -> dict:
+        return await self.slider.evaluate(_BOUNDS_JS)
+
+    async def set_value(self, target: float, mode: str = "dispatch", timeout: int = 5000) -> float:
+        b = await self.bounds()
+        value = self.snap(target, b)
+        if value == b["value"]:
+            return value
+
+        watch = self.display if self.display is not None else self.slider
+        if mode == "keys":
+            await self.slider.focus()
+            for key in self.key_plan(b["value"], value, b):
+                await self.slider.press(key)
+        else:
+            await self.slider.evaluate(_DISPATCH_JS, value)
+
+        if await self.waits.value_is(watch, value, timeout=timeout) is None:
+            shown = await watch.evaluate(_VALUE_JS)
+            if any(ch.isdigit() for ch in shown) or (await self.bounds())["value"] != value:
+                raise AssertionError(f"Range slider expected {value}, display shows {shown!r}")
+        return value
+
+
+instrument(RangeSlider)
@@ -0,0 +1,45 @@
+"""
+The three playground scenarios as coroutines over an async Page, in the same
+steps as tests/test_*.py. Used by tests/test_async_scenarios.py and the
+throughput benchmark.
+"""
+from playwright.async_api import Page
+
+from .drag_drop_sliders_page import DragDropSlidersPage
+from .input_form_submit_page import InputFormSubmitPage
+from .selenium_playground_home import SeleniumPlaygroundHome
+from .simple_form_demo_page import SimpleFormDemoPage
+
+
+async def simple_form_demo(page: Page, base_url: str, timeout_ms: int = 30000) -> None:
+    home = await SeleniumPlaygroundHome(page, base_url=base_url, default_timeout_ms=timeout_ms).open()
+    await home.open_simple_form_demo()
+    simple = SimpleFormDemoPage(page, base_url=base_url, default_timeout_ms=timeout_ms)
+    await simple.assert_url_contains()
+    message = "Welcome to TestMu AI"
+    await simple.enter_message(message)
+    await simple.click_get_checked_value()
+    await simple.assert_message_displayed(message)
+
+
+async def drag_drop_sliders(page: Page, base_url: str, timeout_ms: int = 30000) -> None:
+    home = await SeleniumPlaygroundHome(page, base_url=base_url, default_timeout_ms=timeout_ms).open()
+    await home.open_drag_drop_sliders()
+    sliders = DragDropSlidersPage(page, base_url=base_url, default_timeout_ms=timeout_ms)
+    await sliders.set_default_value_15_slider_to(95)
+    await sliders.assert_default_value_15_is(95)
+
+
+async def input_form_submit(page: Page, base_url: str, timeout_ms: int = 30000) -> None:
+    home = await SeleniumPlaygroundHome(page, base_url=base_url, default_timeout_ms=timeout_ms).open()
+    await home.open_input_form_submit()
+    form = InputFormSubmitPage(page, base_url=base_url, default_timeout_ms=timeout_ms)
+    await form.submit_blank_and_assert_error()
+    await form.fill_form_and_submit()
+
+
+SCENARIOS = {
+    "simple_form_demo": simple_form_demo,
+    "drag_drop_sliders": drag_drop_sliders,
+    "input_form_submit": input_form_submit,
+}
@@ -0,0 +1,51 @@
+# src/pages/aio/selenium_playground_home.py
+import re
+from playwright.async_api import expect
+from .base_page import BasePage
+from ..selenium_playground_home import SeleniumPlaygroundHome as _SyncHome
+
+
+class SeleniumPlaygroundHome(BasePage):
+    """
+    Async Selenium Playground home page.
+
+    Usage:
+        home = await SeleniumPlaygroundHome(page, base_url=settings.base_url).open()
+        await home.open_simple_form_demo()
+    """
+
+    ABSOLUTE_HOME = _SyncHome.ABSOLUTE_HOME
+    PATH = _SyncHome.PATH
+
+    async def open(self):
+        target = self.PATH if self.base_url else self.ABSOLUTE_HOME
+        await self.goto(target)
+        await expect(self.page).to_have_url(re.compile(r".*/selenium-playground/?", re.I))
+        return self
+
+    async def assert_on_home(self):
+        await expect(self.page).to_have_url(re.compile(r".*/selenium-playground/?", re.I))
+        return self
+
+    async def _click_nav_and_assert(self, link_name_regex: str, url_regex: str):
+        await self.page.get_by_role("link", name=re.compile(link_name_regex, re.I)).click()
+        await expect(self.page).to_have_url(re.compile(url_regex, re.I))
+        return self
+
+    async def open_simple_form_demo(self):
+        return await self._click_nav_and_assert(
+            r"^\s*Simple\s*Form\s*Demo\s*$",
+            r".*simple-form-demo.*",
+        )
+
+    async def open_drag_drop_sliders(self):
+        return await self._click_nav_and_assert(
+            r"^\s*Drag\s*&\s*Drop\s*Sliders\s*$",
+            r".*drag-drop-range-sliders-demo.*",
+        )
+
+    async def open_input_form_submit(self):
+        return await self._click_nav_and_assert(
+            r"^\s*Input\s*Form\s*Submit\s*$",
+            r".*(input-form).*",
+        )
@@ -0,0 +1,41 @@
+from .base_page import BasePage
+from ..simple_form_demo_page import SimpleFormDemoPage as _SyncPage
+from playwright.async_api import expect
+
+class SimpleFormDemoPage(BasePage):
+    # Same fallback chains as the sync page object
+    MESSAGE_INPUT = _SyncPage.MESSAGE_INPUT
+    GET_VALUE_BUTTON = _SyncPage.GET_VALUE_BUTTON
+
+    async def assert_url_contains(self):
+        await self.should_have_url_containing("simple-form-demo")
+        return self
+
+    async def enter_message(self, message: str):
+        await self.waits.dom_settled()
+        input_field = (await self.resolve("message_input", self.MESSAGE_INPUT)).first
+        await input_field.scroll_into_view_if_needed()
+        await self.waits.element_stable(input_field)
+        await input_field.click()
+        await input_field.fill(message)
+        return self
+
+    async def click_get_checked_value(self):
+        button = (await self.resolve("get_value_button", self.GET_VALUE_BUTTON)).first
+        await button.scroll_into_view_if_needed()
+        await self.waits.element_stable(button)
+        await button.click()
+        return self
+
+    async def assert_message_displayed(self, message: str):
+        result = self.page.locator(
+            "#message, "
+            "#display, "
+            "#message-one, "
+            "[role='status'], "
+            ".result, "
+            "p:has-text('Your Message:')"
+        ).first
+        await result.wait_for(state="attached", timeout=5000)
+        await expect(result).to_contain_text(message, timeout=10000)
+        return self
@@ -1,14 +1,79 @@
 import re
-from playwright.sync_api import Page, expect
-from typing import Optional
+from playwright.sync_api import Locator, Page, expect
+from typing import Dict, Mapping, Optional, Sequence
+from ..utils.bulk_fill import FieldDescriptor, bulk_fill
+from ..utils.locator_resolver import RESOLVER, Strategy
+from ..utils.network_policy import NetworkFilter, NetworkPolicy
+from ..utils.perf_metrics import PerfCollector, register_budgets
+from ..utils.steps import instrument
+from ..utils.waits import WaitEngine
 
 class BasePage:
+    # Request allow/deny rules applied while this page object is active
+    # (only when the context has a NetworkFilter, i.e. NETWORK_FILTER=true)
+    NETWORK_POLICY: Optional[NetworkPolicy] = None
+    # Limits on the metrics of navigations that land on this page object
+    # (see src/utils/perf_metrics.py; checked when PERF_METRICS=true)
+    PERF_BUDGETS: Dict[str, float] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        # Every page object's public methods are timed as nested step spans (src/utils/steps.py)
+        super().__init_subclass__(**kwargs)
+        instrument(cls)
+        register_budgets(cls.__name__, cls.PERF_BUDGETS)
+
     def __init__(self, page: Page, base_url: Optional[str] = None, default_timeout_ms: int = 30000):
         self.page = page
         self.base_url = base_url.rstrip("/") if base_url else None
         self.page.set_default_timeout(default_timeout_ms)
+        # Event-driven readiness conditions; use these instead of wait_for_timeout
+        self.waits = WaitEngine(page)
+        self._apply_network_policy()
+
+    def _apply_network_policy(self):
+        flt = NetworkFilter.for_context(self.page.context)
+        if flt is not None and self.NETWORK_POLICY is not None:
+            flt.use(self.NETWORK_POLICY)
+
+    def resolve(
+        self,
+        element: str,
+        candidates: Sequence[Strategy],
+        root: Optional[Locator] = None,
+        required: bool = True,
+    ) -> Optional[Locator]:
+        """
+        Probe all fallback strategies for `element` in one in-page evaluation
+        and return the winner's locator. The winner is remembered per page
+        object + element + URL, so the next lookup (and the next run) tries it
+        first. With required=False, returns None when nothing matches.
+        """
+        loc, winner = RESOLVER.resolve(self.page, type(self).__name__, element, candidates, root=root)
+        if winner is None and not required:
+            return None
+        return loc
 
-    def goto(self, path: str = "/"):
+    def fill_fields(
+        self,
+        fields: Mapping[FieldDescriptor, object],
+        root: Optional[Locator] = None,
+        strict: bool = True,
+    ) -> Dict[str, dict]:
+        """
+        Resolve and fill many fields in one round trip. Keys are a label text,
+        a Strategy or a fallback chain of Strategies; selects are matched by
+        option label/value. Returns {field: {ok, strategy, error}}, a repeated
+        field name getting a "#<position>" suffix; with strict=True any field
+        that could not be filled raises AssertionError.
+        """
+        report = bulk_fill(self.page, fields, root=root)
+        failed = {k: v["error"] for k, v in report.items() if not v["ok"]}
+        if strict and failed:
+            raise AssertionError(f"Could not fill fields {failed}. URL: {self.page.url}")
+        return report
+
+    def goto(self, path: str = "/", page_object: Optional[str] = None):
+        """Open `path`; its metrics are attributed to `page_object` (default: this one)."""
         if path.startswith("http"):
             url = path
         else:
@@ -16,9 +81,18 @@ class BasePage:
                 raise ValueError("Base URL is not configured for this page.")
             url = f"{self.base_url}{path}"
         self.page.goto(url)
+        self._collect_perf(page_object or type(self).__name__)
         return self
 
+    def _collect_perf(self, page_object: str):
+        collector = PerfCollector.for_page(self.page)
+        if collector is not None:
+            collector.collect(page_object)
+
     def should_have_url_containing(self, fragment: str):
         pattern = re.compile(rf".*{re.escape(fragment)}.*")
         expect(self.page).to_have_url(pattern)
         return self
+
+
+instrument(BasePage)
@@ -1,34 +1,43 @@
 from .base_page import BasePage
+from .range_slider import RangeSlider
+from ..utils.network_policy import PLAYGROUND_POLICY
+from ..utils.perf_metrics import PLAYGROUND_BUDGETS
 from playwright.sync_api import expect
 
 class DragDropSlidersPage(BasePage):
-    def _get_slider_container(self):
-        """Get the specific container for 'Default value 15' slider"""
-        # Try multiple selector strategies
+    NETWORK_POLICY = PLAYGROUND_POLICY
+    PERF_BUDGETS = PLAYGROUND_BUDGETS
+
+    DEFAULT_15 = "Default value 15"
+
+    def _get_slider_container(self, label: str = DEFAULT_15):
+        """Get the container of the slider titled `label` (e.g. 'Default value 15')"""
+        # Try multiple selector strategies; the innermost element holding both
+        # the title and a range input is the last match in document order
         container = self.page.locator(
-            "section:has-text('Default value 15'), "
-            "div:has-text('Default value 15'), "
-            ".slider-container:has-text('Default value 15')"
-        ).first
+            f"section:has-text('{label}'):has(input[type='range']), "
+            f"div:has-text('{label}'):has(input[type='range']), "
+            f".slider-container:has-text('{label}')"
+        ).last
         
         # Wait for container to be visible
         container.wait_for(state="visible", timeout=5000)
         return container
 
-    def _group(self):
+    def _group(self, label: str = DEFAULT_15):
         """Get the slider group within the container"""
-        return self._get_slider_container()
+        return self._get_slider_container(label)
 
-    def _slider(self):
+    def _slider(self, label: str = DEFAULT_15):
         """Get the slider input element from the container"""
-        group = self._group()
+        group = self._group(label)
         slider = group.locator("input[type='range'], input[role='slider'], input.range-slider").first
         slider.wait_for(state="visible", timeout=5000)
         return slider
 
-    def _display(self):
+    def _display(self, label: str = DEFAULT_15):
         """Get the display element showing current value"""
-        g = self._group()
+        g = self._group(label)
         
         # Try multiple selectors for the display value
         disp = g.locator(
@@ -46,100 +55,20 @@ class DragDropSlidersPage(BasePage):
         # Fallback: find any element with just digits
         return g.locator("text=/^\\d+$/").first
 
-    def set_default_value_15_slider_to(self, target: int):
-        """Set slider to target value using keyboard arrows"""
-        slider = self._slider()
-        display = self._display()
-        
-        # Scroll slider into view
-        slider.scroll_into_view_if_needed()
-        self.page.wait_for_timeout(500)
-        
-        # Focus on the slider
-        slider.focus()
-        self.page.wait_for_timeout(300)
-        
-        def current_value() -> int:
-            """Get current slider value"""
-            try:
-                # Try to get from display text first
-                txt = display.inner_text().strip()
-                if txt:
-                    return int("".join(ch for ch in txt if ch.isdigit()))
-            except:
-                pass
-            
-            # Fallback: get from slider value attribute
-            try:
-                v = slider.get_attribute("value") or slider.get_attribute("aria-valuenow") or "0"
-                return int(v)
-            except:
-                return 0
+    def slider(self, label: str = DEFAULT_15) -> RangeSlider:
+        """Positioning engine for the slider titled `label`"""
+        return RangeSlider(self._slider(label), self.waits, display=self._display(label))
 
-        # Get initial value
-        cur = current_value()
-        initial_value = cur
-        print(f"Initial slider value: {cur}, Target: {target}")
-        
-        # Calculate direction and steps needed
-        steps = 0
-        max_steps = 500  # Increased max steps for safety
-        
-        if cur < target:
-            # Move right to increase value
-            while cur < target and steps < max_steps:
-                slider.press("ArrowRight")
-                self.page.wait_for_timeout(50)  # Small delay between presses
-                new_cur = current_value()
-                
-                # Break if value not changing
-                if new_cur == cur and steps > 10:
-                    print(f"Warning: Slider stuck at {cur}")
-                    # Try clicking slider at a position
-                    try:
-                        slider.click()
-                        self.page.wait_for_timeout(200)
-                    except:
-                        pass
-                
-                cur = new_cur
-                steps += 1
-                
-                # Log progress every 10 steps
-                if steps % 10 == 0:
-                    print(f"Progress: Current value = {cur}, Steps = {steps}")
-        
-        elif cur > target:
-            # Move left to decrease value
-            while cur > target and steps < max_steps:
-                slider.press("ArrowLeft")
-                self.page.wait_for_timeout(50)
-                new_cur = current_value()
-                
-                # Break if value not changing
-                if new_cur == cur and steps > 10:
-                    print(f"Warning: Slider stuck at {cur}")
-                    try:
-                        slider.click()
-                        self.page.wait_for_timeout(200)
-                    except:
-                        pass
-                
-                cur = new_cur
-                steps += 1
-                
-                if steps % 10 == 0:
-                    print(f"Progress: Current value = {cur}, Steps = {steps}")
-        
-        final_value = current_value()
-        print(f"Final slider value: {final_value} (took {steps} steps)")
-        
-        # Verify we reached target
-        if abs(final_value - target) > 1:
-            print(f"Warning: Could not reach exact target. Got {final_value}, expected {target}")
-        
+    def set_slider_to(self, label: str, target: int, mode: str = "dispatch"):
+        """Set any slider on the page in one round trip ('dispatch') or the shortest key sequence ('keys', one press per key)"""
+        value = self.slider(label).set_value(target, mode=mode)
+        print(f"Slider '{label}' set to {value}")
         return self
 
+    def set_default_value_15_slider_to(self, target: int, mode: str = "dispatch"):
+        """Set the 'Default value 15' slider to target"""
+        return self.set_slider_to(self.DEFAULT_15, target, mode=mode)
+
     def assert_default_value_15_is(self, expected: int):
         """Assert the slider display shows expected value"""
         display = self._display()
@@ -2,34 +2,59 @@
 import re
 from playwright.sync_api import expect, TimeoutError as PWTimeout, Error as PWError
 from .base_page import BasePage
+from .selenium_playground_home import SeleniumPlaygroundHome
+from ..utils.locator_resolver import css, label, role
+from ..utils.network_policy import PLAYGROUND_POLICY
+from ..utils.perf_metrics import PLAYGROUND_BUDGETS
 
 
 class InputFormSubmitPage(BasePage):
+    # Consent-manager scripts are blocked by the shared policy, so the cookie
+    # banner may never render and _dismiss_cookie_banner has nothing to do
+    NETWORK_POLICY = PLAYGROUND_POLICY
+    PERF_BUDGETS = PLAYGROUND_BUDGETS
+
     # ---------- Utilities: main form, banner, overlays ----------
 
+    # Fallback chains, probed in one evaluation by BasePage.resolve
+    SUBMIT_BUTTON = (
+        role("button", r"^\s*submit\s*$"),
+        css("button[type='submit']"),
+    )
+    FORM = (
+        css("form", has=SUBMIT_BUTTON[0]),
+        css("form"),
+    )
+    COUNTRY_SELECT = (
+        label("Country"),
+        css("select#country"),
+        css("select[name='country']"),
+        css("select"),
+    )
+    # Form fields: label first, CSS fallback
+    NAME = (label("Name"), css("#name, input[name='name']"))
+    EMAIL = (label("Email"), css("#email, input[name='email']"))
+    PASSWORD = (label("Password"), css("#password, input[name='password']"))
+    COMPANY = (label("Company"), css("#company, input[name='company']"))
+    WEBSITE = (label("Website"), css("#website, input[name='website']"))
+    CITY = (label("City"), css("#city, input[name='city']"))
+    ADDRESS1 = (label("Address 1"), css("#address1, input[name='address_line1'], input[name='address1']"))
+    ADDRESS2 = (label("Address 2"), css("#address2, input[name='address_line2'], input[name='address2']"))
+    STATE = (label("State"), css("#state, input[name='state']"))
+    ZIPCODE = (label("Zip code"), css("#zip, #zipcode, input[name='zip'], input[name='zipcode']"))
+    COOKIE_ACCEPT = SeleniumPlaygroundHome.COOKIE_ACCEPT
+
     def _form(self):
-        forms = self.page.locator("form")
-        if forms.count() > 1:
-            for i in range(min(forms.count(), 5)):
-                frm = forms.nth(i)
-                if frm.get_by_role("button", name=re.compile(r"^\s*submit\s*$", re.I)).count():
-                    return frm
-        return forms.first
+        return self.resolve("form", self.FORM).first
 
     def _dismiss_cookie_banner(self):
-        for sel in [
-            "button:has-text('Accept All')",
-            "button:has-text('Accept')",
-            "button:has-text('I Agree')",
-            "[aria-label='accept cookies']",
-        ]:
-            try:
-                el = self.page.locator(sel)
-                if el.count():
-                    el.first.click(timeout=1000, force=True)
-                    break
-            except Exception:
-                pass
+        # With WARM_STATE the consent cookie is already set and this is a single no-match probe
+        try:
+            el = self.resolve("cookie_accept", self.COOKIE_ACCEPT, required=False)
+            if el is not None:
+                el.first.click(timeout=1000, force=True)
+        except Exception:
+            pass
 
     def _error_banner(self):
         # Banner that contains the assignment message
@@ -66,20 +91,10 @@ class InputFormSubmitPage(BasePage):
     # ---------- Scoped getters ----------
 
     def _submit_button_scoped(self):
-        frm = self._form()
-        btn = frm.get_by_role("button", name=re.compile(r"^\s*submit\s*$", re.I))
-        return btn.first if btn.count() else frm.locator("button[type='submit']").first
+        return self.resolve("submit", self.SUBMIT_BUTTON, root=self._form()).first
 
     def _country_select_scoped(self):
-        frm = self._form()
-        for loc in [
-            frm.get_by_label("Country", exact=False),
-            frm.locator("select#country"),
-            frm.locator("select[name='country']"),
-        ]:
-            if loc.count():
-                return loc
-        return frm.locator("select").first
+        return self.resolve("country", self.COUNTRY_SELECT, root=self._form()).first
 
     def _success_banner(self):
         return self.page.get_by_text(
@@ -91,14 +106,13 @@ class InputFormSubmitPage(BasePage):
     def submit_blank_and_assert_error(self):
         self._dismiss_cookie_banner()
         
-        # Wait for page to be fully loaded
-        self.page.wait_for_load_state("domcontentloaded")
-        self.page.wait_for_timeout(1000)
+        # Wait for the page to load and stop re-rendering
+        self.waits.dom_settled()
 
         frm = self._form()
         # Scroll form into view
         frm.scroll_into_view_if_needed()
-        self.page.wait_for_timeout(500)
+        self.waits.element_stable(frm)
         
         # Check if form is attached rather than visible (might be hidden initially)
         expect(frm).to_be_attached(timeout=5000)
@@ -181,40 +195,23 @@ class InputFormSubmitPage(BasePage):
         # If banner re-appeared or was sticky, remove again
         self._close_error_banner_if_present()
 
-        frm = self._form()
-
-        def _fill(label, value, alt_css=None):
-            try:
-                frm.get_by_label(label, exact=False).fill(value)
-            except Exception:
-                if alt_css:
-                    frm.locator(alt_css).first.fill(value)
-                else:
-                    frm.locator("input[type='text']").first.fill(value)
-
-        _fill("Name", name, alt_css="#name, input[name='name']")
-        _fill("Email", email, alt_css="#email, input[name='email']")
-        _fill("Password", password, alt_css="#password, input[name='password']")
-        _fill("Company", company, alt_css="#company, input[name='company']")
-        _fill("Website", website, alt_css="#website, input[name='website']")
-
-        # Country selection
-        select = self._country_select_scoped()
-        try:
-            select.select_option(label=country_label)
-        except Exception:
-            try:
-                select.click()
-                self.page.keyboard.type(country_label)
-                self.page.keyboard.press("Enter")
-            except Exception:
-                select.select_option("US")
-
-        _fill("City", city, alt_css="#city, input[name='city']")
-        _fill("Address 1", address1, alt_css="#address1, input[name='address_line1'], input[name='address1']")
-        _fill("Address 2", address2, alt_css="#address2, input[name='address_line2'], input[name='address2']")
-        _fill("State", state, alt_css="#state, input[name='state']")
-        _fill("Zip code", zipcode, alt_css="#zip, #zipcode, input[name='zip'], input[name='zipcode']")
+        # All fields (label first, CSS fallback) resolved and set in one round trip
+        self.last_fill_report = self.fill_fields(
+            {
+                self.NAME: name,
+                self.EMAIL: email,
+                self.PASSWORD: password,
+                self.COMPANY: company,
+                self.WEBSITE: website,
+                self.COUNTRY_SELECT: country_label,
+                self.CITY: city,
+                self.ADDRESS1: address1,
+                self.ADDRESS2: address2,
+                self.STATE: state,
+                self.ZIPCODE: zipcode,
+            },
+            root=self._form(),
+        )
 
         # Re-resolve submit and click; retry once if detached
         submit = self._submit_button_scoped()
@@ -237,8 +234,7 @@ class InputFormSubmitPage(BasePage):
         
         # Wait for the element to be attached and text to be present
         success_banner.wait_for(state="attached", timeout=8000)
-        self.page.wait_for_timeout(1000)
-        
+
         # Check if the success message text is present (even if visually hidden)
         try:
             expect(success_banner).to_contain_text("Thanks for contacting us", timeout=5000)
@@ -0,0 +1,102 @@
+import math
+from typing import Optional
+
+from playwright.sync_api import Locator
+
+from ..utils.steps import instrument
+from ..utils.waits import WaitEngine, read_value
+
+# min / max / step / value of an <input type=range> in one round trip
+_BOUNDS_JS = """
+el => ({
+  min: el.min === '' ? 0 : Number(el.min),
+  max: el.max === '' ? 100 : Number(el.max),
+  step: (el.step === '' || el.step === 'any') ? 1 : Number(el.step),
+  value: Number(el.value),
+})
+"""
+
+# Set the value through the native setter (so framework bindings notice it)
+# and fire the events a user drag would produce
+_DISPATCH_JS = """
+(el, v) => {
+  const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+  setter.call(el, String(v));
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+  return Number(el.value);
+}
+"""
+
+
+class RangeSlider:
+    """
+    Positioning engine for any `input[type=range]`.
+
+    Reads min/max/step once, moves the thumb either with a single input/change
+    dispatch ("dispatch", default) or real keypresses ("keys": the shortest
+    arrow sequence, possibly after Home/End; one press per key, since only
+    trusted key events move a range input), and verifies the result by waiting
+    for the display element (or the input itself when there is no separate
+    display) to show the snapped target.
+    """
+
+    def __init__(self, slider: Locator, waits: WaitEngine, display: Optional[Locator] = None):
+        self.slider = slider
+        self.display = display
+        self.waits = waits
+
+    def bounds(self) -> dict:
+        return self.slider.evaluate(_BOUNDS_JS)
+
+    @staticmethod
+    def snap(target: float, b: dict) -> float:
+        """Clamp `target` to [min, max] and round it to the nearest step (halves up, as browsers do)."""
+        value = min(max(target, b["min"]), b["max"])
+        # the last step that still fits below max when max - min is not a whole number of steps
+        steps = min(math.floor((value - b["min"]) / b["step"] + 0.5), math.floor((b["max"] - b["min"]) / b["step"]))
+        value = round(b["min"] + steps * b["step"], 10)  # 0.1 * 3 -> 0.3
+        return int(value) if float(value).is_integer() else value
+
+    @staticmethod
+    def key_plan(current: float, value: float, b: dict):
+        """Shortest keypress sequence: from the current value, or from Home/End."""
+        step = b["step"]
+        options = [
+            ([], current),
+            (["Home"], b["min"]),
+            (["End"], b["max"]),
+        ]
+        best = None
+        for prefix, start in options:
+            n = round(abs(value - start) / step)
+            arrow = "ArrowRight" if value >= start else "ArrowLeft"
+            keys = prefix + [arrow] * n
+            if best is None or len(keys) < len(best):
+                best = keys
+        return best
+
+    def set_value(self, target: float, mode: str = "dispatch", timeout: int = 5000) -> float:
+        b = self.bounds()
+        value = self.snap(target, b)
+        if value == b["value"]:
+            return value
+
+        watch = self.display if self.display is not None else self.slider
+        if mode == "keys":
+            self.slider.focus()
+            for key in self.key_plan(b["value"], value, b):
+                self.slider.press(key)
+        else:
+            self.slider.evaluate(_DISPATCH_JS, value)
+
+        # wait for the target itself: with "keys" the display passes through every intermediate value
+        if self.waits.value_is(watch, value, timeout=timeout) is None:
+            shown = read_value(watch)
+            # a display without a number cannot be checked; the input's own value decides then
+            if any(ch.isdigit() for ch in shown) or self.bounds()["value"] != value:
+                raise AssertionError(f"Range slider expected {value}, display shows {shown!r}")
+        return value
+
+
+instrument(RangeSlider)
@@ -2,6 +2,10 @@
 import re
 from playwright.sync_api import expect
 from .base_page import BasePage
+from ..utils.locator_resolver import css
+from ..utils.network_policy import PLAYGROUND_POLICY
+from ..utils.perf_metrics import PLAYGROUND_BUDGETS
+from ..utils.route_map import ROUTES
 
 
 class SeleniumPlaygroundHome(BasePage):
@@ -13,12 +17,31 @@ class SeleniumPlaygroundHome(BasePage):
         home.open_simple_form_demo()
         home.open_drag_drop_sliders()
         home.open_input_form_submit()
+
+    Navigation modes (NAV_MODE, see src/utils/route_map.py):
+        deep-link: open() is deferred and open_*() jumps straight to the
+                   scenario URL learned from an earlier click; the home page is
+                   only loaded when the route is not known yet.
+        click:     always load home and click the left-nav link (also forced by
+                   @pytest.mark.nav_coverage).
     """
 
     # Absolute fallback if base_url is not injected when constructing this page
     ABSOLUTE_HOME = "https://www.testmu.ai/selenium-playground/"
     # Relative path used when base_url is provided
     PATH = "/"
+    # Only the left-nav links are needed here
+    NETWORK_POLICY = PLAYGROUND_POLICY
+    PERF_BUDGETS = PLAYGROUND_BUDGETS
+    # Cookie-consent accept button, first match wins (see BasePage.resolve)
+    COOKIE_ACCEPT = (
+        css("button", text="Accept All"),
+        css("button", text="Accept"),
+        css("button", text="I Agree"),
+        css("[aria-label='accept cookies']"),
+    )
+    # Home URL still to be loaded (deep-link mode defers it until it is needed)
+    _home_pending = None
 
     # ---------------------------
     # Basic navigation helpers
@@ -29,24 +52,73 @@ class SeleniumPlaygroundHome(BasePage):
         Also asserts we landed on the playground.
         """
         target = self.PATH if self.base_url else self.ABSOLUTE_HOME
+        if ROUTES.enabled:
+            self._home_pending = target
+            return self
+        self._load_home(target)
+        return self
+
+    def _load_home(self, target: str):
         self.goto(target)
         # Accepts both hosts and optional trailing slash
         expect(self.page).to_have_url(re.compile(r".*/selenium-playground/?", re.I))
-        return self
+
+    def _ensure_home(self):
+        if self._home_pending is not None:
+            target, self._home_pending = self._home_pending, None
+            self._load_home(target)
 
     def assert_on_home(self):
         """Assert we are still on/returned to the playground home."""
+        self._ensure_home()
         expect(self.page).to_have_url(re.compile(r".*/selenium-playground/?", re.I))
         return self
 
-    def _click_nav_and_assert(self, link_name_regex: str, url_regex: str):
+    def accept_cookies(self):
+        """
+        Accept the cookie-consent banner if it is shown. Used by the session
+        warm-up, so the saved storage_state already carries the consent.
+        """
+        self._ensure_home()
+        button = self.resolve("cookie_accept", self.COOKIE_ACCEPT, required=False)
+        if button is not None:
+            try:
+                button.first.click(timeout=2000)
+                self.waits.dom_settled()
+            except Exception:
+                pass
+        return self
+
+    def _click_nav_and_assert(self, link_name_regex: str, url_regex: str, route: str = None, page_object: str = None):
         """
         Click a left-nav link by accessible name (regex) and assert URL with regex.
         This tolerates small text/route differences and host switches.
+        With a `route` name the resulting URL is remembered, and in deep-link
+        mode a remembered URL is opened directly instead of clicking.
+        Page metrics of the target are checked against `page_object`'s budgets.
         """
+        key = ROUTES.key(self.base_url or self.ABSOLUTE_HOME, route) if route else None
+        if key and ROUTES.enabled:
+            url = ROUTES.get(key)
+            if url:
+                self._home_pending = None
+                self.goto(url, page_object=page_object)
+                if re.search(url_regex, self.page.url, re.I):
+                    ROUTES.stats["deep_link"] += 1
+                    return self
+                # route moved: forget it and learn it again from the nav
+                ROUTES.forget(key)
+                ROUTES.stats["stale"] += 1
+                self._home_pending = self.PATH if self.base_url else self.ABSOLUTE_HOME
+
+        self._ensure_home()
         # Prefer exact role link; use regex name to be robust to spacing/casing
         self.page.get_by_role("link", name=re.compile(link_name_regex, re.I)).click()
         expect(self.page).to_have_url(re.compile(url_regex, re.I))
+        self._collect_perf(page_object or type(self).__name__)
+        ROUTES.stats["click"] += 1
+        if key:
+            ROUTES.learn(key, self.page.url)
         return self
 
     # ---------------------------
@@ -59,6 +131,8 @@ class SeleniumPlaygroundHome(BasePage):
         return self._click_nav_and_assert(
             r"^\s*Simple\s*Form\s*Demo\s*$",
             r".*simple-form-demo.*",
+            route="simple_form_demo",
+            page_object="SimpleFormDemoPage",
         )
 
     def open_drag_drop_sliders(self):
@@ -68,6 +142,8 @@ class SeleniumPlaygroundHome(BasePage):
         return self._click_nav_and_assert(
             r"^\s*Drag\s*&\s*Drop\s*Sliders\s*$",
             r".*drag-drop-range-sliders-demo.*",
+            route="drag_drop_sliders",
+            page_object="DragDropSlidersPage",
         )
 
     def open_input_form_submit(self):
@@ -78,4 +154,6 @@ class SeleniumPlaygroundHome(BasePage):
         return self._click_nav_and_assert(
             r"^\s*Input\s*Form\s*Submit\s*$",
             r".*(input-form).*",
+            route="input_form_submit",
+            page_object="InputFormSubmitPage",
         )
\ No newline at end of file
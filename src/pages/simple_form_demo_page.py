@@ -1,65 +1,55 @@
 from .base_page import BasePage
+from ..utils.locator_resolver import css, label, placeholder, role
+from ..utils.network_policy import PLAYGROUND_POLICY
+from ..utils.perf_metrics import PLAYGROUND_BUDGETS
 from playwright.sync_api import expect
 
 class SimpleFormDemoPage(BasePage):
+    NETWORK_POLICY = PLAYGROUND_POLICY
+    PERF_BUDGETS = PLAYGROUND_BUDGETS
+
+    # Fallback chains, probed in one evaluation by BasePage.resolve
+    MESSAGE_INPUT = (
+        placeholder("Please enter your Message"),
+        label("Enter Message"),
+        css("#get-input input[type='text'], .mb-10 input[type='text'], section input[type='text'], form input[type='text']"),
+        css("input[type='text']"),
+    )
+    GET_VALUE_BUTTON = (
+        role("button", "Get Checked Value"),
+        role("button", "Show Message"),
+        css("button", text=r"Get|Show"),
+    )
+
     def assert_url_contains(self):
         self.should_have_url_containing("simple-form-demo")
         return self
 
     def enter_message(self, message: str):
-        # Wait for page to be fully loaded
-        self.page.wait_for_load_state("domcontentloaded")
-        self.page.wait_for_timeout(1000)
-        
-        # Try to find the message input field
-        input_field = None
+        # Wait for the page to load and stop re-rendering
+        self.waits.dom_settled()
         
-        # Method 1: Try by placeholder
-        if self.page.get_by_placeholder("Please enter your Message").count():
-            input_field = self.page.get_by_placeholder("Please enter your Message")
-        # Method 2: Try by label
-        elif self.page.get_by_label("Enter Message", exact=False).count():
-            input_field = self.page.get_by_label("Enter Message", exact=False)
-        # Method 3: Look for input in the form section
-        else:
-            # Find the form or section containing the single input demo
-            form_section = self.page.locator("#get-input, .mb-10, section, form").first
-            if form_section.count():
-                input_field = form_section.locator("input[type='text']").first
-            else:
-                input_field = self.page.locator("input[type='text']").first
+        # Placeholder -> label -> text input inside the demo section, in one probe
+        input_field = self.resolve("message_input", self.MESSAGE_INPUT).first
         
         # Scroll into view and fill
         input_field.scroll_into_view_if_needed()
-        self.page.wait_for_timeout(500)
+        self.waits.element_stable(input_field)
         input_field.click()  # Ensure focus
         input_field.fill(message)
         return self
 
     def click_get_checked_value(self):
-        # Wait a bit after filling
-        self.page.wait_for_timeout(500)
-        
         # Try common button texts on this playground
-        button = None
-        if self.page.get_by_role("button", name="Get Checked Value").count():
-            button = self.page.get_by_role("button", name="Get Checked Value")
-        elif self.page.get_by_role("button", name="Show Message").count():
-            button = self.page.get_by_role("button", name="Show Message")
-        else:
-            # Fallback: find any button near the input
-            button = self.page.locator("button:has-text('Get'), button:has-text('Show')").first
+        button = self.resolve("get_value_button", self.GET_VALUE_BUTTON).first
         
         # Scroll and click
         button.scroll_into_view_if_needed()
-        self.page.wait_for_timeout(300)
+        self.waits.element_stable(button)
         button.click()
         return self
 
     def assert_message_displayed(self, message: str):
-        # Wait for the message to appear after button click
-        self.page.wait_for_timeout(1000)
-        
         # Try multiple selectors for the result display
         result = self.page.locator(
             "#message, "
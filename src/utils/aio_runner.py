@@ -0,0 +1,98 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+from playwright.async_api import Browser, Page
+
+from . import capture
+from .logger import get_logger
+
+logger = get_logger()
+
+Scenario = Callable[[Page], Awaitable[None]]
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    ok: bool
+    seconds: float
+    error: Optional[str] = None
+
+
+class AsyncScenarioRunner:
+    """
+    Runs scenario coroutines concurrently on one event loop and one async
+    browser, each in its own context, at most `concurrency` at a time.
+
+    Traces follow the TRACE capture policy per scenario: with
+    retain-on-failure only failing scenarios write a zip.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        browser: Browser,
+        concurrency: int,
+        timeout_ms: int = 30000,
+        trace_policy: str = capture.OFF,
+        trace_dir: Optional[Path] = None,
+    ):
+        self.loop = loop
+        self.browser = browser
+        self.concurrency = max(1, concurrency)
+        self.timeout_ms = timeout_ms
+        self.trace_policy = trace_policy
+        self.trace_dir = Path(trace_dir) if trace_dir else None
+        self.results: List[ScenarioResult] = []
+        self.wall_s = 0.0
+
+    async def _run_one(self, sem: asyncio.Semaphore, name: str, scenario: Scenario) -> ScenarioResult:
+        async with sem:
+            t0 = time.perf_counter()
+            context = await self.browser.new_context()
+            tracing = self.trace_policy in (capture.ON, capture.RETAIN_ON_FAILURE) and self.trace_dir is not None
+            if tracing:
+                await context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            error = None
+            try:
+                page = await context.new_page()
+                page.set_default_timeout(self.timeout_ms)
+                await scenario(page)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            finally:
+                if tracing:
+                    keep = self.trace_policy == capture.ON or error is not None
+                    await context.tracing.stop(path=str(self.trace_dir / f"{name}.zip") if keep else None)
+                await context.close()
+            return ScenarioResult(name, error is None, time.perf_counter() - t0, error)
+
+    async def _run_all(self, scenarios: Dict[str, Scenario]) -> List[ScenarioResult]:
+        sem = asyncio.Semaphore(self.concurrency)
+        return await asyncio.gather(*(self._run_one(sem, n, s) for n, s in scenarios.items()))
+
+    def run(self, scenarios: Dict[str, Scenario]) -> List[ScenarioResult]:
+        """Run {name: scenario} to completion; scenario failures are reported, not raised."""
+        t0 = time.perf_counter()
+        results = self.loop.run_until_complete(self._run_all(scenarios))
+        self.wall_s += time.perf_counter() - t0
+        self.results.extend(results)
+        for r in results:
+            log = logger.info if r.ok else logger.error
+            log(f"async scenario {r.name}: {'ok' if r.ok else r.error} in {r.seconds:.2f}s")
+        return results
+
+    def summary(self) -> str:
+        busy = sum(r.seconds for r in self.results)
+        rate = len(self.results) / self.wall_s if self.wall_s else 0.0
+        return (
+            f"{len(self.results)} scenarios, concurrency={self.concurrency}, wall={self.wall_s:.2f}s, "
+            f"sum={busy:.2f}s, {rate:.2f} scenarios/s"
+        )
+
+
+def failures(results: Sequence[ScenarioResult]) -> Dict[str, str]:
+    return {r.name: r.error for r in results if not r.ok}
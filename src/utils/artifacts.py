@@ -0,0 +1,26 @@
+import os
+from pathlib import Path
+from typing import Optional
+
+ARTIFACTS_ROOT = Path("artifacts")
+
+# Set by the parallel runner on every worker process it spawns
+WORKER_ID_ENV = "PW_WORKER_ID"
+
+
+def worker_id() -> Optional[str]:
+    """Id of the current worker (e.g. 'w0'), or None in a single-process run."""
+    return os.getenv(WORKER_ID_ENV) or None
+
+
+def artifacts_root() -> Path:
+    """Artifacts root for this process: artifacts/ or artifacts/<worker_id>/."""
+    wid = worker_id()
+    return ARTIFACTS_ROOT / wid if wid else ARTIFACTS_ROOT
+
+
+def artifacts_dir(*parts: str) -> Path:
+    """Return (and create) a folder under this process' artifacts root."""
+    path = artifacts_root().joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
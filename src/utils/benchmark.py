@@ -0,0 +1,88 @@
+import json
+import os
+import statistics
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .steps import percentile
+
+# Phases whose median moved less than this are never reported as regressions
+# (timer noise on sub-100ms steps easily exceeds any sane percentage)
+MIN_DELTA_MS = 50.0
+
+# end-to-end phase name: setup + call + teardown of one run
+TOTAL = "total"
+
+
+def describe(samples: List[float]) -> dict:
+    return {
+        "n": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 95),
+        "stddev": statistics.pstdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+class BenchmarkRecorder:
+    """
+    Samples (ms) per scenario and phase for `pytest --benchmark`. Phases are
+    the pytest setup/call/teardown durations, the end-to-end total and every
+    top-level page-object step of the run.
+    """
+
+    def __init__(self):
+        self.samples: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+
+    def add(self, scenario: str, phases: Dict[str, float]) -> None:
+        for phase, ms in phases.items():
+            self.samples[scenario][phase].append(ms)
+
+    def stats(self) -> Dict[str, Dict[str, dict]]:
+        return {
+            scenario: {phase: describe(ms) for phase, ms in sorted(phases.items())}
+            for scenario, phases in sorted(self.samples.items())
+        }
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.stats(), indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def report(self) -> List[str]:
+        lines = [f"{'min':>9}{'median':>9}{'p95':>9}{'stddev':>9}{'n':>4}  scenario / phase (ms)"]
+        for scenario, phases in self.stats().items():
+            for phase, s in phases.items():
+                lines.append(
+                    f"{s['min']:>9.0f}{s['median']:>9.0f}{s['p95']:>9.0f}{s['stddev']:>9.0f}{s['n']:>4}  "
+                    f"{scenario} / {phase}"
+                )
+        return lines
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, Dict[str, dict]]]:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def regressions(current: Dict[str, Dict[str, dict]], baseline: Dict[str, Dict[str, dict]], threshold_pct: float) -> List[str]:
+    """Phases whose median got slower than baseline by more than threshold_pct (and MIN_DELTA_MS)."""
+    out = []
+    for scenario, phases in current.items():
+        for phase, s in phases.items():
+            base = baseline.get(scenario, {}).get(phase)
+            if not base or base["median"] <= 0:
+                continue
+            delta = s["median"] - base["median"]
+            pct = delta / base["median"] * 100
+            if pct > threshold_pct and delta > MIN_DELTA_MS:
+                out.append(
+                    f"{scenario} / {phase}: median {base['median']:.0f} -> {s['median']:.0f} ms "
+                    f"(+{pct:.0f}%, threshold {threshold_pct:g}%)"
+                )
+    return out
@@ -0,0 +1,217 @@
+"""
+Content-addressed artifact store.
+
+    python -m src.utils.blob_store rebuild artifacts/trace/<test>.trace.ref.json   # -> <test>.zip
+    python -m src.utils.blob_store rebuild artifacts/har/<test>.har.ref.json       # -> <test>.har
+    python -m src.utils.blob_store stats
+"""
+import argparse
+import base64
+import hashlib
+import json
+import os
+import threading
+import zipfile
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+from .artifacts import ARTIFACTS_ROOT
+
+HAR_REF_SUFFIX = ".har.ref.json"
+TRACE_REF_SUFFIX = ".trace.ref.json"
+
+
+class BlobStore:
+    """
+    Stores each unique blob once as `<root>/<sha256>`. Writes are atomic, so
+    workers can share one store; putting a blob that already exists costs a
+    hash and a stat, no write.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.new_blobs = 0
+        self.new_bytes = 0
+        self.deduped_bytes = 0
+        self._lock = threading.Lock()
+
+    def path(self, sha: str) -> Path:
+        return self.root / sha
+
+    def put(self, data: bytes) -> Tuple[str, int]:
+        """Returns (sha, bytes written by this call); a blob that already exists writes 0."""
+        sha = hashlib.sha256(data).hexdigest()
+        path = self.path(sha)
+        if path.exists():
+            with self._lock:
+                self.deduped_bytes += len(data)
+            return sha, 0
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self.new_blobs += 1
+            self.new_bytes += len(data)
+        return sha, len(data)
+
+    def get(self, sha: str) -> bytes:
+        return self.path(sha).read_bytes()
+
+    def size(self, sha: str) -> int:
+        try:
+            return self.path(sha).stat().st_size
+        except OSError:
+            return 0
+
+    def summary(self) -> str:
+        return (
+            f"Blob store: {self.new_blobs} new blobs, {self.new_bytes / 1024:.1f} KiB written, "
+            f"{self.deduped_bytes / 1024:.1f} KiB deduplicated"
+        )
+
+
+def _write_json(path: Path, data) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# ---------- HAR ----------
+
+def _write_har(path: Path, head: dict, entries: Iterable[dict]) -> None:
+    """Write `head` (log.entries empty and last) with `entries` streamed into it."""
+    text = json.dumps(head)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("w", encoding="utf-8") as fh:
+        fh.write(text[: -len("]}}")])
+        for i, entry in enumerate(entries):
+            fh.write((", " if i else "") + json.dumps(entry))  # json.dumps separators
+        fh.write("]}}")
+    os.replace(tmp, path)
+
+
+def pack_har(har_path: Path, store: BlobStore) -> Tuple[Path, int]:
+    """
+    Move every response body of `har_path` into the store, write
+    `<name>.har.ref.json` (the same HAR with `content._blob` references) and
+    delete the HAR. Returns (ref path, bytes newly written to the store).
+    Entries are streamed, so memory is bounded by the largest single entry.
+    """
+    from .har_analyzer import har_head, iter_entries
+
+    har_path = Path(har_path)
+    written = 0
+
+    def entries():
+        nonlocal written
+        for entry in iter_entries(har_path):
+            content = entry.get("response", {}).get("content", {})
+            text = content.pop("text", None)
+            if text is not None:
+                base64_body = content.get("encoding") == "base64"
+                body = base64.b64decode(text) if base64_body else text.encode("utf-8")
+                content["_blob"], n = store.put(body)
+                written += n
+            yield entry
+
+    ref = har_path.with_name(har_path.name[: -len(".har")] + HAR_REF_SUFFIX)
+    _write_har(ref, har_head(har_path), entries())
+    har_path.unlink()
+    return ref, written
+
+
+def har_body(content: dict, store: BlobStore) -> Optional[bytes]:
+    """Body of a packed HAR entry, or None if it has no blob."""
+    sha = content.get("_blob")
+    return store.get(sha) if sha else None
+
+
+def unpack_har(ref_path: Path, store: BlobStore, out: Optional[Path] = None) -> Path:
+    """Rebuild a standard HAR (bodies inline) from a `.har.ref.json`."""
+    from .har_analyzer import har_head, iter_entries
+
+    ref_path = Path(ref_path)
+
+    def entries():
+        for entry in iter_entries(ref_path):
+            content = entry.get("response", {}).get("content", {})
+            body = har_body(content, store)
+            if body is not None:
+                content.pop("_blob")
+                if content.get("encoding") == "base64":
+                    content["text"] = base64.b64encode(body).decode("ascii")
+                else:
+                    content["text"] = body.decode("utf-8", errors="replace")
+            yield entry
+
+    out = Path(out) if out else ref_path.with_name(ref_path.name[: -len(HAR_REF_SUFFIX)] + ".har")
+    _write_har(out, har_head(ref_path), entries())
+    return out
+
+
+# ---------- trace zip ----------
+
+def pack_trace(zip_path: Path, store: BlobStore) -> Tuple[Path, int]:
+    """
+    Store every member of a trace zip (snapshots' resources/* are shared by
+    most tests) and replace the zip with `<name>.trace.ref.json`.
+    """
+    zip_path = Path(zip_path)
+    written = 0
+    members = []
+    with zipfile.ZipFile(zip_path) as zf:
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            sha, n = store.put(zf.read(info))
+            written += n
+            members.append({"name": info.filename, "blob": sha})
+    ref = zip_path.with_name(zip_path.name[: -len(".zip")] + TRACE_REF_SUFFIX)
+    _write_json(ref, {"members": members})
+    zip_path.unlink()
+    return ref, written
+
+
+def unpack_trace(ref_path: Path, store: BlobStore, out: Optional[Path] = None) -> Path:
+    """Rebuild the trace zip (`playwright show-trace` format) from a `.trace.ref.json`."""
+    ref_path = Path(ref_path)
+    data = json.loads(ref_path.read_text(encoding="utf-8"))
+    out = Path(out) if out else ref_path.with_name(ref_path.name[: -len(TRACE_REF_SUFFIX)] + ".zip")
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for m in data["members"]:
+            zf.writestr(m["name"], store.get(m["blob"]))
+    return out
+
+
+def rebuild(ref_path: Path, store: BlobStore) -> Path:
+    name = Path(ref_path).name
+    if name.endswith(HAR_REF_SUFFIX):
+        return unpack_har(ref_path, store)
+    if name.endswith(TRACE_REF_SUFFIX):
+        return unpack_trace(ref_path, store)
+    raise ValueError(f"Not a packed artifact: {ref_path}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--store", default=str(ARTIFACTS_ROOT / "blobs"))
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    rb = sub.add_parser("rebuild", help="rebuild standard HAR / trace zip files from .ref.json files")
+    rb.add_argument("refs", nargs="+")
+    sub.add_parser("stats", help="blob count and size")
+    args = ap.parse_args()
+
+    store = BlobStore(Path(args.store))
+    if args.cmd == "rebuild":
+        for ref in args.refs:
+            print(rebuild(Path(ref), store))
+        return
+    blobs = [p for p in store.root.iterdir() if p.is_file() and not p.name.endswith(".tmp")]
+    refs = list(ARTIFACTS_ROOT.rglob(f"*{HAR_REF_SUFFIX}")) + list(ARTIFACTS_ROOT.rglob(f"*{TRACE_REF_SUFFIX}"))
+    total = sum(p.stat().st_size for p in blobs)
+    print(f"{len(blobs)} blobs, {total / 1024 / 1024:.1f} MiB, referenced by {len(refs)} packed artifacts")
+
+
+if __name__ == "__main__":
+    main()
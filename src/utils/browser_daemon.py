@@ -0,0 +1,272 @@
+"""
+Long-lived Chromium shared by pytest runs (BROWSER_DAEMON=true).
+
+    python -m src.utils.browser_daemon status
+    python -m src.utils.browser_daemon stop
+
+The browser is Playwright's own Chromium started with a remote-debugging
+port; sessions attach with `connect_over_cdp`. A watchdog process stops it
+after BROWSER_DAEMON_IDLE seconds without an attached session.
+"""
+import argparse
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import Optional
+
+from .artifacts import ARTIFACTS_ROOT
+from .logger import get_logger
+
+logger = get_logger()
+
+STATE_PATH = ARTIFACTS_ROOT / "browser_daemon" / "state.json"
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _version(port: int, timeout: float = 1.0) -> Optional[dict]:
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version", timeout=timeout) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+    except Exception:
+        return None
+
+
+class BrowserDaemon:
+    """
+    State (endpoint, pid, cold start time) lives in `state_path`; every
+    attached pytest process holds a lease file next to it until its session
+    ends, and the watchdog only counts leases whose process is still alive.
+    """
+
+    def __init__(self, state_path: Path = STATE_PATH, idle_timeout_s: int = 900):
+        self.state_path = Path(state_path)
+        self.dir = self.state_path.parent
+        self.leases = self.dir / "leases"
+        self.idle_timeout_s = idle_timeout_s
+
+    # ---------- state ----------
+
+    def read_state(self) -> dict:
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write_state(self, state: dict) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        os.replace(tmp, self.state_path)
+
+    def healthy(self, state: dict, headless: bool) -> bool:
+        return (
+            bool(state)
+            and state.get("headless") == headless
+            and _pid_alive(state.get("pid"))
+            and _version(state.get("port", 0)) is not None
+        )
+
+    # ---------- start / stop ----------
+
+    def _lock(self, timeout: float = 60.0) -> Path:
+        # Workers may all try to start the daemon at once; one wins the lock
+        self.dir.mkdir(parents=True, exist_ok=True)
+        lock = self.dir / "start.lock"
+        deadline = time.time() + timeout
+        while True:
+            try:
+                os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return lock
+            except FileExistsError:
+                try:
+                    if time.time() - lock.stat().st_mtime > timeout:
+                        lock.unlink()  # stale lock from a crashed starter
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.time() > deadline:
+                    raise TimeoutError(f"Browser daemon start lock held: {lock}")
+                time.sleep(0.1)
+
+    def ensure(self, executable: str, headless: bool) -> dict:
+        """Return the state of a healthy daemon, (re)starting it if needed."""
+        state = self.read_state()
+        if self.healthy(state, headless):
+            return state
+        lock = self._lock()
+        try:
+            state = self.read_state()
+            if self.healthy(state, headless):
+                return state
+            if state:
+                logger.warning(f"Browser daemon unhealthy (pid={state.get('pid')}), restarting")
+                self.stop()
+            return self._start(executable, headless)
+        finally:
+            lock.unlink()
+
+    def _start(self, executable: str, headless: bool) -> dict:
+        port = _free_port()
+        profile = tempfile.mkdtemp(prefix="pw-daemon-")
+        args = [
+            executable,
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={profile}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-background-networking",
+            "--disable-dev-shm-usage",
+        ]
+        if headless:
+            args += ["--headless=new", "--hide-scrollbars", "--mute-audio"]
+        args.append("about:blank")
+
+        t0 = time.perf_counter()
+        proc = subprocess.Popen(
+            args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        deadline = time.time() + 30
+        while _version(port, timeout=0.5) is None:
+            if proc.poll() is not None or time.time() > deadline:
+                proc.kill()
+                raise RuntimeError(f"Browser daemon did not start ({executable})")
+            time.sleep(0.05)
+        state = {
+            "pid": proc.pid,
+            "port": port,
+            "endpoint": f"http://127.0.0.1:{port}",
+            "headless": headless,
+            "profile": profile,
+            "started": time.time(),
+            "cold_start_ms": (time.perf_counter() - t0) * 1000,
+            "last_used": time.time(),
+        }
+        self._write_state(state)
+        self._spawn_watchdog()
+        logger.info(f"Browser daemon started: pid={proc.pid}, port={port}, {state['cold_start_ms']:.0f} ms")
+        return state
+
+    def _spawn_watchdog(self) -> None:
+        subprocess.Popen(
+            [sys.executable, "-m", "src.utils.browser_daemon", "--state", str(self.state_path),
+             "watch", "--idle", str(self.idle_timeout_s)],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True, cwd=os.getcwd(),
+        )
+
+    def stop(self) -> None:
+        state = self.read_state()
+        pid = state.get("pid")
+        if _pid_alive(pid):
+            try:
+                # started in its own session: take the renderer/GPU children down too
+                if hasattr(os, "killpg"):
+                    os.killpg(pid, signal.SIGTERM)
+                else:
+                    os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+        if state.get("profile"):
+            shutil.rmtree(state["profile"], ignore_errors=True)
+        try:
+            self.state_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    # ---------- leases / idle ----------
+
+    def acquire_lease(self) -> Path:
+        self.leases.mkdir(parents=True, exist_ok=True)
+        lease = self.leases / str(os.getpid())
+        lease.write_text(str(time.time()), encoding="utf-8")
+        self.touch()
+        return lease
+
+    def release_lease(self, lease: Path) -> None:
+        try:
+            lease.unlink()
+        except FileNotFoundError:
+            pass
+        self.touch()
+
+    def touch(self) -> None:
+        state = self.read_state()
+        if state:
+            state["last_used"] = time.time()
+            self._write_state(state)
+
+    def active_leases(self) -> int:
+        if not self.leases.is_dir():
+            return 0
+        count = 0
+        for lease in self.leases.iterdir():
+            if lease.name.isdigit() and _pid_alive(int(lease.name)):
+                count += 1
+            else:
+                lease.unlink(missing_ok=True)
+        return count
+
+    def watch(self, poll_s: float = 5.0) -> None:
+        """Watchdog loop: stop the browser once idle for idle_timeout_s (or when it died)."""
+        pid = self.read_state().get("pid")
+        while True:
+            time.sleep(poll_s)
+            state = self.read_state()
+            if not state or state.get("pid") != pid or not _pid_alive(pid):
+                return  # replaced or gone
+            if self.active_leases():
+                continue
+            if time.time() - state.get("last_used", 0) > self.idle_timeout_s:
+                self.stop()
+                return
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--state", default=str(STATE_PATH))
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    w = sub.add_parser("watch", help=argparse.SUPPRESS)
+    w.add_argument("--idle", type=int, default=900)
+    sub.add_parser("status")
+    sub.add_parser("stop")
+    args = ap.parse_args()
+
+    daemon = BrowserDaemon(Path(args.state), idle_timeout_s=getattr(args, "idle", 900))
+    if args.cmd == "watch":
+        daemon.watch()
+    elif args.cmd == "stop":
+        daemon.stop()
+    else:
+        state = daemon.read_state()
+        alive = bool(state) and _pid_alive(state.get("pid")) and _version(state.get("port", 0)) is not None
+        print(json.dumps({**state, "alive": alive, "sessions": daemon.active_leases()}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
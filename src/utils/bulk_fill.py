@@ -0,0 +1,113 @@
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+from playwright.sync_api import Locator, Page
+
+from .locator_resolver import FIND_JS, Strategy, label
+
+# A field is a label text, one Strategy or a fallback chain of Strategies
+FieldDescriptor = Union[str, Strategy, Tuple[Strategy, ...]]
+
+# Resolve every field, set its value through the native setter and fire
+# input/change, all in one evaluation. Returns a report per field.
+_FILL_JS = """
+([root, fields]) => {
+  root = root || document;
+  const find = """ + FIND_JS + """;
+  const norm = s => (s || '').replace(/\\s+/g, ' ').trim();
+  const setNative = (el, v) => {
+    const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, v);
+  };
+  return fields.map(f => {
+    // Like Playwright's strict mode, prefer a candidate that matches exactly
+    // one element; an ambiguous match is only used if nothing unique exists
+    let el = null, strategy = null, loose = null;
+    for (const c of f.candidates) {
+      let hits = [];
+      try { hits = find(root, c); } catch (e) { /* bad selector */ }
+      if (hits.length === 1) { el = hits[0]; strategy = c.name; break; }
+      if (hits.length && !loose) loose = {el: hits[0], strategy: c.name};
+    }
+    if (!el && loose) ({el, strategy} = loose);
+    if (!el) return {field: f.field, ok: false, strategy: null, error: 'not found'};
+    try {
+      el.focus && el.focus();
+      if (el.tagName === 'SELECT') {
+        const opts = [...el.options];
+        const want = String(f.value);
+        const opt = opts.find(o => norm(o.label || o.text) === want)
+          || opts.find(o => o.value === want)
+          || opts.find(o => norm(o.text).toLowerCase().includes(want.toLowerCase()));
+        if (!opt) return {field: f.field, ok: false, strategy, error: `no option '${want}'`};
+        el.value = opt.value;
+      } else if (el.type === 'checkbox' || el.type === 'radio') {
+        el.checked = !!f.value && f.value !== 'false';
+      } else {
+        setNative(el, String(f.value));
+      }
+      el.dispatchEvent(new Event('input', {bubbles: true}));
+      el.dispatchEvent(new Event('change', {bubbles: true}));
+      el.blur && el.blur();
+      return {field: f.field, ok: true, strategy, error: null};
+    } catch (e) {
+      return {field: f.field, ok: false, strategy, error: String(e)};
+    }
+  });
+}
+"""
+_FILL_ON_ELEMENT_JS = "(el, f) => (" + _FILL_JS + ")([el, f])"
+
+
+def _candidates(descriptor: FieldDescriptor) -> Tuple[Strategy, ...]:
+    if isinstance(descriptor, str):
+        return (label(descriptor),)
+    if isinstance(descriptor, Strategy):
+        return (descriptor,)
+    return tuple(descriptor)
+
+
+def field_name(descriptor: FieldDescriptor) -> str:
+    if isinstance(descriptor, str):
+        return descriptor
+    return _candidates(descriptor)[0].name
+
+
+def _payload(fields: Mapping[FieldDescriptor, object]) -> List[dict]:
+    out, seen = [], set()
+    for i, (desc, value) in enumerate(fields.items()):
+        name = field_name(desc)
+        # descriptors sharing a first candidate would overwrite each other in the report
+        key = name if name not in seen else f"{name}#{i}"
+        seen.add(key)
+        out.append({
+            "field": key,
+            "value": value,
+            "candidates": [{"name": c.name, **c.to_json()} for c in _candidates(desc)],
+        })
+    return out
+
+
+def _report(results: List[dict]) -> Dict[str, dict]:
+    return {r["field"]: {k: r[k] for k in ("ok", "strategy", "error")} for r in results}
+
+
+def bulk_fill(
+    page: Page,
+    fields: Mapping[FieldDescriptor, object],
+    root: Optional[Locator] = None,
+) -> Dict[str, dict]:
+    """Fill all `fields` in a single round trip; returns {field: {ok, strategy, error}}."""
+    if root is not None:
+        results = root.evaluate(_FILL_ON_ELEMENT_JS, _payload(fields))
+    else:
+        results = page.evaluate(_FILL_JS, [None, _payload(fields)])
+    return _report(results)
+
+
+async def bulk_fill_async(page, fields: Mapping[FieldDescriptor, object], root=None) -> Dict[str, dict]:
+    """bulk_fill() for playwright.async_api pages/locators."""
+    if root is not None:
+        results = await root.evaluate(_FILL_ON_ELEMENT_JS, _payload(fields))
+    else:
+        results = await page.evaluate(_FILL_JS, [None, _payload(fields)])
+    return _report(results)
@@ -0,0 +1,101 @@
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Per-artifact capture policies (VIDEO / HAR / TRACE / CONSOLE in .env)
+OFF = "off"
+ON = "on"
+RETAIN_ON_FAILURE = "retain-on-failure"
+ON_FIRST_RETRY = "on-first-retry"
+POLICIES = (OFF, ON, RETAIN_ON_FAILURE, ON_FIRST_RETRY)
+
+
+def parse_policy(value: Optional[str], default: str) -> str:
+    if value is None:
+        return default
+    value = value.strip().lower().replace("_", "-")
+    return value if value in POLICIES else default
+
+
+def retry_count(item) -> int:
+    """0 on the first run; pytest-rerunfailures sets `execution_count` on reruns."""
+    return max(0, getattr(item, "execution_count", 1) - 1)
+
+
+def item_failed(item) -> bool:
+    """True once setup or call of `item` failed (reports are stored by pytest_runtest_makereport)."""
+    return any(
+        getattr(getattr(item, f"rep_{when}", None), "failed", False)
+        for when in ("setup", "call")
+    )
+
+
+def should_record(policy: str, item) -> bool:
+    if policy == OFF:
+        return False
+    if policy == ON_FIRST_RETRY:
+        return retry_count(item) == 1
+    return True
+
+
+def should_keep(policy: str, item) -> bool:
+    """Decide at teardown whether a recorded artifact is kept."""
+    if not should_record(policy, item):
+        return False
+    if policy == RETAIN_ON_FAILURE:
+        return item_failed(item)
+    return True
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size if path.is_file() else 0
+    except OSError:
+        return 0
+
+
+class ArtifactLedger:
+    """Bytes written and time spent on artifacts for one test."""
+
+    def __init__(self):
+        self.bytes_written = 0
+        self.seconds = 0.0
+        self.kept: Dict[str, List[str]] = {}
+        self.discarded: List[str] = []
+
+    @contextmanager
+    def timed(self):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds += time.perf_counter() - t0
+
+    def kept_file(self, kind: str, path) -> None:
+        path = Path(path)
+        self.bytes_written += _size(path)
+        self.kept.setdefault(kind, []).append(str(path))
+
+    def kept_bytes(self, kind: str, path, nbytes: int) -> None:
+        """A kept file that is written later (by the finalizer) from `nbytes` captured now."""
+        self.bytes_written += nbytes
+        self.kept.setdefault(kind, []).append(str(path))
+
+    def kept_stream(self, kind: str, path) -> None:
+        """Records appended to a shared file by a background writer (bytes not attributed per test)."""
+        self.kept.setdefault(kind, []).append(str(path))
+
+    def discarded_file(self, kind: str) -> None:
+        self.discarded.append(kind)
+
+    def summary(self) -> str:
+        kinds = ",".join(sorted(self.kept)) or "-"
+        return f"{self.bytes_written / 1024:.1f} KiB in {self.seconds * 1000:.0f} ms (kept: {kinds})"
+
+
+def ledger_for(item) -> ArtifactLedger:
+    ledger = getattr(item, "_artifact_ledger", None)
+    if ledger is None:
+        ledger = item._artifact_ledger = ArtifactLedger()
+    return ledger
@@ -0,0 +1,204 @@
+import time
+from dataclasses import dataclass, fields
+from typing import Callable, Dict, List, Optional
+
+from playwright.sync_api import Page
+
+from .logger import get_logger
+
+logger = get_logger()
+
+# sessionStorage and every input/select/textarea of the current document, in document order
+_CAPTURE_JS = """
+() => ({
+  session: (() => { try { return Object.entries(sessionStorage); } catch (e) { return []; } })(),
+  fields: Array.from(document.querySelectorAll('input, select, textarea'), el => ({
+    id: el.id || null, name: el.name || null, type: el.type, value: el.value, checked: !!el.checked,
+  })),
+})
+"""
+
+# localStorage of this origin (from storage_state) and sessionStorage; returns how many items were set
+_RESTORE_STORAGE_JS = """
+({origins, session}) => {
+  let n = 0;
+  for (const o of origins) {
+    if (o.origin !== location.origin) continue;
+    for (const item of o.localStorage || []) { localStorage.setItem(item.name, item.value); n++; }
+  }
+  for (const [k, v] of session) { sessionStorage.setItem(k, v); n++; }
+  return n;
+}
+"""
+
+# Field values back by position, only where id/name still match; fires input + change like typing would
+_RESTORE_FIELDS_JS = """
+(fields) => {
+  const els = document.querySelectorAll('input, select, textarea');
+  let n = 0;
+  fields.forEach((f, i) => {
+    const el = els[i];
+    if (!el || el.type === 'file' || (el.id || null) !== f.id || (el.name || null) !== f.name) return;
+    if (el.type === 'checkbox' || el.type === 'radio') {
+      if (el.checked === f.checked) return;
+      el.checked = f.checked;
+    } else {
+      if (el.value === f.value) return;
+      el.value = f.value;
+    }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    n++;
+  });
+  return n;
+}
+"""
+
+
+@dataclass
+class Checkpoint:
+    step: str
+    url: str
+    storage_state: dict
+    session: list
+    fields: list
+    step_ms: float  # how long the step took in the attempt that reached it
+
+    @property
+    def restorable(self) -> bool:
+        # a deferred step (e.g. home.open() in deep-link mode) leaves no document to come back to
+        return self.url.startswith("http")
+
+
+@dataclass
+class ResumeStats:
+    captures: int = 0
+    capture_ms: float = 0.0
+    retries: int = 0  # reruns of tests that use `checkpoints`
+    resumed: int = 0  # ... of which started from a checkpoint
+    skipped_steps: int = 0
+    skipped_ms: float = 0.0  # step time the resumed reruns did not repeat
+    restore_ms: float = 0.0
+    rerun_ms: float = 0.0  # resumed reruns, first step to teardown
+
+    def merge(self, other: "ResumeStats") -> None:
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+
+class Checkpoints:
+    """
+    Runs a test's page-object steps and checkpoints the URL, storage_state,
+    sessionStorage and form fields after each one. On a rerun of the same test
+    (pytest-rerunfailures) the steps up to the last checkpoint are skipped and
+    that checkpoint is restored instead. With enabled=False steps simply run.
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        key: str,
+        store: Dict[str, List[Checkpoint]],
+        stats: ResumeStats,
+        retry: bool = False,
+        enabled: bool = True,
+    ):
+        self.page = page
+        self.key = key
+        self.store = store
+        self.stats = stats
+        self.enabled = enabled
+        previous = store.get(key, []) if retry and enabled else []
+        last = max((i for i, cp in enumerate(previous) if cp.restorable), default=-1)
+        self.taken: List[Checkpoint] = []
+        if enabled:
+            store[key] = self.taken
+        # steps up to the last restorable checkpoint are skipped, that one is restored
+        self._resume = previous[: last + 1]
+        self._n = 0
+        self.resumed = False
+        self._t0: Optional[float] = None
+        if retry and enabled:
+            stats.retries += 1
+
+    def step(self, fn: Callable, *args, **kwargs):
+        """Run `fn(*args, **kwargs)` (a page-object method) unless a rerun resumes past it."""
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        if self._t0 is None:
+            self._t0 = time.perf_counter()
+        name = getattr(fn, "__qualname__", repr(fn))
+        i, self._n = self._n, self._n + 1
+        if i < len(self._resume):
+            saved = self._resume[i]
+            if saved.step != name:
+                raise RuntimeError(f"Checkpoint {i} of {self.key} is {saved.step}, this run's step is {name}")
+            self.taken.append(saved)
+            self.stats.skipped_steps += 1
+            self.stats.skipped_ms += saved.step_ms
+            if i == len(self._resume) - 1:
+                self._restore(saved)
+            return None
+        t0 = time.perf_counter()
+        result = fn(*args, **kwargs)
+        self._capture(name, (time.perf_counter() - t0) * 1000)
+        return result
+
+    def _capture(self, step: str, step_ms: float) -> None:
+        t0 = time.perf_counter()
+        state = self.page.evaluate(_CAPTURE_JS)
+        self.taken.append(Checkpoint(
+            step=step,
+            url=self.page.url,
+            storage_state=self.page.context.storage_state(),
+            session=state["session"],
+            fields=state["fields"],
+            step_ms=step_ms,
+        ))
+        self.stats.captures += 1
+        self.stats.capture_ms += (time.perf_counter() - t0) * 1000
+
+    def _restore(self, cp: Checkpoint) -> None:
+        t0 = time.perf_counter()
+        if cp.storage_state.get("cookies"):
+            self.page.context.add_cookies(cp.storage_state["cookies"])
+        self.page.goto(cp.url)
+        args = {"origins": cp.storage_state.get("origins", []), "session": cp.session}
+        if self.page.evaluate(_RESTORE_STORAGE_JS, args):
+            self.page.reload()  # let the page's scripts see the restored storage
+        restored = self.page.evaluate(_RESTORE_FIELDS_JS, cp.fields)
+        ms = (time.perf_counter() - t0) * 1000
+        self.resumed = True
+        self.stats.resumed += 1
+        self.stats.restore_ms += ms
+        logger.info(f"Resumed {self.key} after {cp.step} at {cp.url} ({restored} fields restored, {ms:.0f} ms)")
+
+    def finish(self, passed: bool) -> None:
+        """Call at teardown: a passed test drops its checkpoints, a failed one keeps them for the rerun."""
+        if not self.enabled:
+            return
+        if self.resumed:
+            self.stats.rerun_ms += (time.perf_counter() - self._t0) * 1000
+        if passed:
+            self.store.pop(self.key, None)
+
+
+def resume_report(stats: ResumeStats) -> List[str]:
+    """Lines for the pytest terminal summary."""
+    lines = [
+        f"{stats.captures} checkpoints taken in {stats.capture_ms / 1000:.2f}s; "
+        f"{stats.retries} reruns, {stats.resumed} resumed from a checkpoint ({stats.skipped_steps} steps skipped)"
+    ]
+    if stats.resumed:
+        full = stats.rerun_ms - stats.restore_ms + stats.skipped_ms
+        saved = full - stats.rerun_ms
+        lines.append(
+            f"resumed reruns took {stats.rerun_ms / 1000:.2f}s vs ~{full / 1000:.2f}s as full reruns: "
+            f"{saved / 1000:.2f}s saved ({saved / full if full else 0.0:.0%}), "
+            f"restores cost {stats.restore_ms / 1000:.2f}s"
+        )
+    return lines
+
+
+# nodeid -> checkpoints of its last attempt (reruns happen in the same process)
+CHECKPOINTS: Dict[str, List[Checkpoint]] = {}
@@ -1,6 +1,10 @@
 import os
 from dataclasses import dataclass
 from pathlib import Path
+from .capture import ON, parse_policy
+from .console_capture import parse_events, parse_level
+from .matrix import parse_browsers
+from .perf_metrics import WARN, parse_mode
 
 def _parse_bool(value: str, default: bool) -> bool:
     if value is None:
@@ -13,6 +17,12 @@ def _parse_int(value: str, default: int) -> int:
     except Exception:
         return default
 
+def _parse_workers(value: str, default: int) -> int:
+    # "auto" means one worker per CPU core
+    if value is not None and value.strip().lower() == "auto":
+        return os.cpu_count() or 1
+    return max(1, _parse_int(value, default))
+
 def _load_dotenv(dotenv_path: Path) -> None:
     if not dotenv_path.exists():
         return
@@ -34,6 +44,45 @@ class Settings:
     headless: bool = True
     slow_mo: int = 0
     timeout_ms: int = 30000
+    workers: int = 1
+    test_history: bool = True  # record phase durations in artifacts/history.sqlite
+    schedule: str = "lpt"  # parallel test assignment: lpt (longest first from history) | round-robin
+    # Page metrics per navigation and PERF_BUDGETS checks: off | warn | enforce
+    perf_metrics: bool = False
+    perf_budgets: str = WARN
+    data_limit: int = 0  # records per @pytest.mark.records file (0 = all)
+    browsers: tuple = ("chromium",)  # BROWSERS=chromium,firefox,webkit (or all) runs the matrix
+    browser_daemon: bool = False  # attach to a long-lived Chromium shared across runs
+    browser_daemon_idle: int = 900  # seconds without a session before the daemon exits
+    context_pool: int = 0  # 0 = fresh context per test
+    # Artifact capture policies: off | on | retain-on-failure | on-first-retry
+    video: str = ON
+    har: str = ON
+    trace: str = ON
+    console: str = ON
+    # Console pipeline: events (console,pageerror,requestfailed,response), minimum level,
+    # per-test message cap and rotation of artifacts/console/console.jsonl
+    console_events: tuple = ("console", "pageerror")
+    console_level: str = "debug"
+    console_max_messages: int = 1000
+    console_max_bytes: int = 5 * 1024 * 1024
+    console_backups: int = 3
+    artifact_store: bool = False  # pack kept HARs / traces into the content-addressed blob store
+    # Background artifact finalization: threads (0 = inline), queued jobs before
+    # tests wait, and a size cap for videos/har/trace/screenshots (0 = no pruning)
+    finalizer_workers: int = 2
+    finalizer_max_pending: int = 32
+    artifact_max_mb: int = 0
+    # Network: live | replay (serve from the HAR store only) | record-missing
+    network_mode: str = "live"
+    har_store: str = "artifacts/har_store"
+    network_filter: bool = False  # apply page-object NETWORK_POLICY rules
+    async_concurrency: int = 4  # contexts driven at once by the asyncio fixtures
+    warm_state: bool = False  # seed contexts from a session storage_state snapshot
+    warm_state_ttl: int = 3600  # seconds before the snapshot is rebuilt
+    # Scenario entry: click (always use the left nav) | deep-link (learned URLs, see route_map.py; opt-in)
+    nav_mode: str = "click"
+    checkpoints: bool = False  # checkpoint scenario steps so reruns (--reruns N) resume after the last good one
 
     @classmethod
     def load(cls) -> "Settings":
@@ -42,4 +91,77 @@ class Settings:
         headless = _parse_bool(os.getenv("HEADLESS"), cls.headless)
         slow_mo = _parse_int(os.getenv("SLOW_MO"), cls.slow_mo)
         timeout_ms = _parse_int(os.getenv("TIMEOUT"), cls.timeout_ms)
-        return cls(base_url=base_url, headless=headless, slow_mo=slow_mo, timeout_ms=timeout_ms)
+        workers = _parse_workers(os.getenv("WORKERS"), cls.workers)
+        test_history = _parse_bool(os.getenv("TEST_HISTORY"), cls.test_history)
+        schedule = os.getenv("SCHEDULE", cls.schedule).strip().lower()
+        if schedule not in {"lpt", "round-robin"}:
+            schedule = cls.schedule
+        perf_metrics = _parse_bool(os.getenv("PERF_METRICS"), cls.perf_metrics)
+        perf_budgets = parse_mode(os.getenv("PERF_BUDGETS"), cls.perf_budgets)
+        data_limit = max(0, _parse_int(os.getenv("DATA_LIMIT"), cls.data_limit))
+        browsers = parse_browsers(os.getenv("BROWSERS"), cls.browsers)
+        browser_daemon = _parse_bool(os.getenv("BROWSER_DAEMON"), cls.browser_daemon)
+        browser_daemon_idle = _parse_int(os.getenv("BROWSER_DAEMON_IDLE"), cls.browser_daemon_idle)
+        context_pool = _parse_int(os.getenv("CONTEXT_POOL"), cls.context_pool)
+        video = parse_policy(os.getenv("VIDEO"), cls.video)
+        har = parse_policy(os.getenv("HAR"), cls.har)
+        trace = parse_policy(os.getenv("TRACE"), cls.trace)
+        console = parse_policy(os.getenv("CONSOLE"), cls.console)
+        console_events = parse_events(os.getenv("CONSOLE_EVENTS"), cls.console_events)
+        console_level = parse_level(os.getenv("CONSOLE_LEVEL"), cls.console_level)
+        console_max_messages = _parse_int(os.getenv("CONSOLE_MAX_MESSAGES"), cls.console_max_messages)
+        console_max_bytes = _parse_int(os.getenv("CONSOLE_MAX_BYTES"), cls.console_max_bytes)
+        console_backups = _parse_int(os.getenv("CONSOLE_BACKUPS"), cls.console_backups)
+        artifact_store = _parse_bool(os.getenv("ARTIFACT_STORE"), cls.artifact_store)
+        finalizer_workers = max(0, _parse_int(os.getenv("FINALIZER_WORKERS"), cls.finalizer_workers))
+        finalizer_max_pending = max(1, _parse_int(os.getenv("FINALIZER_MAX_PENDING"), cls.finalizer_max_pending))
+        artifact_max_mb = max(0, _parse_int(os.getenv("ARTIFACT_MAX_MB"), cls.artifact_max_mb))
+        network_mode = os.getenv("NETWORK_MODE", cls.network_mode).strip().lower()
+        if network_mode not in {"live", "replay", "record-missing"}:
+            network_mode = cls.network_mode
+        har_store = os.getenv("HAR_STORE", cls.har_store)
+        network_filter = _parse_bool(os.getenv("NETWORK_FILTER"), cls.network_filter)
+        async_concurrency = max(1, _parse_int(os.getenv("ASYNC_CONCURRENCY"), cls.async_concurrency))
+        warm_state = _parse_bool(os.getenv("WARM_STATE"), cls.warm_state)
+        warm_state_ttl = _parse_int(os.getenv("WARM_STATE_TTL"), cls.warm_state_ttl)
+        nav_mode = os.getenv("NAV_MODE", cls.nav_mode).strip().lower()
+        if nav_mode not in {"deep-link", "click"}:
+            nav_mode = cls.nav_mode
+        checkpoints = _parse_bool(os.getenv("CHECKPOINTS"), cls.checkpoints)
+        return cls(
+            base_url=base_url,
+            headless=headless,
+            slow_mo=slow_mo,
+            timeout_ms=timeout_ms,
+            workers=workers,
+            test_history=test_history,
+            schedule=schedule,
+            perf_metrics=perf_metrics,
+            perf_budgets=perf_budgets,
+            data_limit=data_limit,
+            browsers=browsers,
+            browser_daemon=browser_daemon,
+            browser_daemon_idle=browser_daemon_idle,
+            context_pool=context_pool,
+            video=video,
+            har=har,
+            trace=trace,
+            console=console,
+            console_events=console_events,
+            console_level=console_level,
+            console_max_messages=console_max_messages,
+            console_max_bytes=console_max_bytes,
+            console_backups=console_backups,
+            artifact_store=artifact_store,
+            finalizer_workers=finalizer_workers,
+            finalizer_max_pending=finalizer_max_pending,
+            artifact_max_mb=artifact_max_mb,
+            network_mode=network_mode,
+            har_store=har_store,
+            network_filter=network_filter,
+            async_concurrency=async_concurrency,
+            warm_state=warm_state,
+            warm_state_ttl=warm_state_ttl,
+            nav_mode=nav_mode,
+            checkpoints=checkpoints,
+        )
@@ -0,0 +1,164 @@
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Iterable, List, Optional
+
+from .logger import get_logger
+
+logger = get_logger()
+
+# Page events that can be captured (CONSOLE_EVENTS); "response" records request timings
+EVENTS = ("console", "pageerror", "requestfailed", "response")
+
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+# ConsoleMessage.type -> level
+_CONSOLE_LEVELS = {
+    "debug": 10, "trace": 10,
+    "log": 20, "info": 20, "dir": 20, "dirxml": 20, "table": 20, "count": 20, "timeEnd": 20,
+    "warning": 30, "assert": 40, "error": 40,
+}
+
+
+def parse_events(value: Optional[str], default: Iterable[str]) -> tuple:
+    if value is None:
+        return tuple(default)
+    return tuple(e for e in (v.strip().lower() for v in value.split(",")) if e in EVENTS)
+
+
+def parse_level(value: Optional[str], default: str) -> str:
+    value = (value or "").strip().lower()
+    return value if value in LEVELS else default
+
+
+class ConsoleBuffer:
+    """
+    Per-test ring buffer filled from Playwright event handlers. Handlers only
+    build a small dict and append it; once `cap` records are held the oldest
+    is dropped (and counted) instead of growing or blocking.
+    """
+
+    def __init__(self, test: str, cap: int, min_level: str = "debug", events: Iterable[str] = ("console",)):
+        self.test = test
+        self.records: Deque[dict] = deque(maxlen=max(1, cap))
+        self.min_level = LEVELS[min_level]
+        self.events = set(events)
+        self.dropped = 0
+        self.seen = 0
+
+    def _add(self, level: int, record: dict) -> None:
+        if level < self.min_level:
+            return
+        self.seen += 1
+        if len(self.records) == self.records.maxlen:
+            self.dropped += 1
+        record["ts"] = time.time()
+        self.records.append(record)
+
+    def attach(self, page) -> None:
+        if "console" in self.events:
+            page.on("console", self._on_console)
+        if "pageerror" in self.events:
+            page.on("pageerror", self._on_pageerror)
+        if "requestfailed" in self.events:
+            page.on("requestfailed", self._on_requestfailed)
+        if "response" in self.events:
+            page.on("requestfinished", self._on_requestfinished)
+
+    def _on_console(self, msg) -> None:
+        try:
+            kind = msg.type
+            self._add(_CONSOLE_LEVELS.get(kind, 20), {"event": "console", "type": kind, "text": msg.text, "location": msg.location})
+        except Exception:
+            pass  # never break the test from a logging handler
+
+    def _on_pageerror(self, error) -> None:
+        try:
+            self._add(40, {"event": "pageerror", "text": str(error)})
+        except Exception:
+            pass
+
+    def _on_requestfailed(self, request) -> None:
+        try:
+            self._add(40, {"event": "requestfailed", "method": request.method, "url": request.url, "text": request.failure})
+        except Exception:
+            pass
+
+    def _on_requestfinished(self, request) -> None:
+        try:
+            timing = request.timing
+            self._add(20, {
+                "event": "response",
+                "method": request.method,
+                "url": request.url,
+                "resource_type": request.resource_type,
+                "ttfb_ms": round(timing["responseStart"] - timing["requestStart"], 1) if timing["responseStart"] >= 0 else None,
+                "ms": round(timing["responseEnd"], 1) if timing["responseEnd"] >= 0 else None,
+            })
+        except Exception:
+            pass
+
+
+class ConsoleWriter:
+    """
+    Background thread writing kept ConsoleBuffers to a rotating JSONL file
+    (`path`, `path.1` .. `path.<backups>`). `submit` never blocks: when the
+    queue is full the batch is dropped and counted.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = 5 * 1024 * 1024, backups: int = 3, queue_size: int = 256):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._queue: "queue.Queue[Optional[List[dict]]]" = queue.Queue(maxsize=queue_size)
+        self.written = 0
+        self.bytes_written = 0
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="console-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, buffer: ConsoleBuffer) -> int:
+        """Queue the buffer's records; returns how many were queued (0 if dropped)."""
+        batch = [{"test": buffer.test, **r} for r in buffer.records]
+        if not batch:
+            return 0
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full:
+            self.dropped += len(batch)
+            return 0
+        return len(batch)
+
+    def _rotate(self) -> None:
+        for i in range(self.backups, 0, -1):
+            src = self.path if i == 1 else self.path.with_name(f"{self.path.name}.{i - 1}")
+            if src.exists():
+                os.replace(src, self.path.with_name(f"{self.path.name}.{i}"))
+
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            try:
+                data = "".join(json.dumps(r, default=str) + "\n" for r in batch).encode("utf-8")
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                if self.path.exists() and self.path.stat().st_size + len(data) > self.max_bytes and self.backups > 0:
+                    self._rotate()
+                with self.path.open("ab") as fh:
+                    fh.write(data)
+                self.written += len(batch)
+                self.bytes_written += len(data)
+            except Exception as e:
+                logger.error(f"Console writer failed: {e}")
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Flush queued batches and stop the thread."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def summary(self) -> str:
+        return f"records={self.written}, bytes={self.bytes_written / 1024:.1f} KiB, dropped={self.dropped}"
@@ -0,0 +1,152 @@
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from playwright.sync_api import Browser, BrowserContext
+
+from .logger import get_logger
+
+logger = get_logger()
+
+# Empty storage state used to wipe cookies + storage between tests
+_EMPTY_STATE = {"cookies": [], "origins": []}
+
+
+class ContextPool:
+    """
+    Bounded pool of BrowserContexts that are reset between tests instead of
+    being closed and re-created.
+
+    Each pooled context starts tracing once; every test then records its own
+    trace chunk (`start_chunk`/`stop_chunk`). Per-test HAR files use
+    `tracing.start_har` where the installed Playwright supports it, because a
+    context-level `record_har_path` is only written when the context closes.
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        size: int,
+        context_options: Optional[dict] = None,
+        trace: bool = True,
+        storage_state: Optional[dict] = None,
+    ):
+        self.browser = browser
+        self.size = max(1, size)
+        self.context_options = dict(context_options or {})
+        self.trace = trace
+        # Reset target: the warm session snapshot, or an empty state
+        self.storage_state = storage_state
+        self._idle: List[BrowserContext] = []
+        self._chunk_open: Dict[int, bool] = {}
+        self._har_open: Dict[int, bool] = {}
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    # ---------- lifecycle ----------
+
+    def _new_context(self) -> BrowserContext:
+        options = dict(self.context_options)
+        if self.storage_state is not None:
+            options["storage_state"] = self.storage_state
+        ctx = self.browser.new_context(**options)
+        if self.trace:
+            # tracing.start() implicitly opens the first chunk
+            ctx.tracing.start(screenshots=True, snapshots=True, sources=True)
+            self._chunk_open[id(ctx)] = True
+        self.created += 1
+        return ctx
+
+    def acquire(self, har_path: Optional[Path] = None) -> BrowserContext:
+        if self._idle:
+            ctx = self._idle.pop()
+            self.reused += 1
+        else:
+            ctx = self._new_context()
+
+        if self.trace and not self._chunk_open.get(id(ctx)):
+            ctx.tracing.start_chunk()
+            self._chunk_open[id(ctx)] = True
+
+        if har_path is not None and hasattr(ctx.tracing, "start_har"):
+            ctx.tracing.start_har(str(har_path), content="embed")
+            self._har_open[id(ctx)] = True
+        return ctx
+
+    def release(self, ctx: BrowserContext, trace_path: Optional[Path] = None) -> None:
+        """
+        Save the test's trace chunk / HAR, reset state and return the context to
+        the pool. Without `trace_path` the chunk is dropped without writing it.
+        """
+        if self._chunk_open.get(id(ctx)):
+            try:
+                ctx.tracing.stop_chunk(path=str(trace_path) if trace_path else None)
+            except Exception as e:
+                logger.error(f"Failed to save trace chunk: {e}")
+            self._chunk_open[id(ctx)] = False
+
+        if self._har_open.pop(id(ctx), False):
+            try:
+                ctx.tracing.stop_har()
+            except Exception as e:
+                logger.error(f"Failed to save HAR: {e}")
+
+        if len(self._idle) >= self.size:
+            self._discard(ctx)
+            return
+        try:
+            self.reset(ctx)
+        except Exception as e:
+            logger.error(f"Context reset failed, discarding context: {e}")
+            self._discard(ctx)
+            return
+        self._idle.append(ctx)
+
+    def reset(self, ctx: BrowserContext) -> None:
+        """Close pages, wipe permissions and put cookies/storage back to the seed state."""
+        for p in list(ctx.pages):
+            p.close()
+        ctx.clear_permissions()
+        if hasattr(ctx, "set_storage_state"):
+            # Replaces cookies, localStorage and IndexedDB in one call
+            ctx.set_storage_state(self.storage_state or _EMPTY_STATE)
+            return
+        ctx.clear_cookies()
+        self._clear_local_storage(ctx)
+        if self.storage_state and self.storage_state.get("cookies"):
+            # older Playwright: only the snapshot's cookies are restored
+            ctx.add_cookies(self.storage_state["cookies"])
+
+    def _clear_local_storage(self, ctx: BrowserContext) -> None:
+        # Older Playwright: visit each origin that holds data via a stubbed
+        # document (no network) and clear its storage
+        origins = [o["origin"] for o in ctx.storage_state().get("origins", []) if o.get("localStorage")]
+        if not origins:
+            return
+        page = ctx.new_page()
+        try:
+            page.route("**/*", lambda route: route.fulfill(status=200, content_type="text/html", body=""))
+            for origin in origins:
+                page.goto(origin)
+                page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        finally:
+            page.close()
+
+    def _discard(self, ctx: BrowserContext) -> None:
+        self._chunk_open.pop(id(ctx), None)
+        self._har_open.pop(id(ctx), None)
+        self.discarded += 1
+        try:
+            ctx.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        while self._idle:
+            self._discard(self._idle.pop())
+
+    def summary(self) -> str:
+        return (
+            f"Context pool: size={self.size}, created={self.created}, "
+            f"reused={self.reused}, discarded={self.discarded}"
+        )
@@ -0,0 +1,143 @@
+"""
+Lazily streamed test data for `@pytest.mark.records(path)`.
+
+Collection only scans the file for record offsets and ids; a test's record
+is read (seek + one line) when its `record` fixture is set up. Files hold one
+record per line: CSV with a header row, or JSONL.
+"""
+import csv
+import json
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+
+@lru_cache(maxsize=None)
+def _csv_header(path: str) -> List[str]:
+    # utf-8-sig: a CSV saved by Excel starts with a BOM that would stick to the first column name
+    with open(path, "r", encoding="utf-8-sig", newline="") as fh:
+        return next(csv.reader(fh))
+
+
+def _parse(path: str, line: str) -> Dict[str, str]:
+    if path.endswith(".csv"):
+        return dict(zip(_csv_header(path), next(csv.reader([line]))))
+    return json.loads(line)
+
+
+class RecordRef:
+    """Where one record lives; what pytest keeps per parametrized test."""
+
+    __slots__ = ("path", "offset", "line", "id")
+
+    def __init__(self, path: str, offset: int, line: int, id: str):
+        self.path = path
+        self.offset = offset
+        self.line = line
+        self.id = id
+
+    def load(self) -> Dict[str, str]:
+        with open(self.path, "rb") as fh:
+            fh.seek(self.offset)
+            return _parse(self.path, fh.readline().decode("utf-8"))
+
+    def __repr__(self) -> str:
+        return f"RecordRef({self.path}:{self.line}, id={self.id})"
+
+
+class DataSource:
+    """
+    One CSV/JSONL file. Test ids come from `id_field` when the record has it,
+    else `<file stem>-<line>`; both stay stable when records are appended.
+    """
+
+    def __init__(self, path, id_field: str = "id"):
+        self.path = Path(path)
+        if self.path.suffix not in (".csv", ".jsonl"):
+            raise ValueError(f"Unsupported data file (csv or jsonl): {self.path}")
+        self.id_field = id_field
+
+    def refs(self, limit: int = 0, index: int = 0, count: int = 1) -> Iterator[RecordRef]:
+        """Stream refs of the first `limit` records (0 = all), keeping every `count`-th from `index`."""
+        path = str(self.path)
+        stream = self._scan(path)
+        if limit > 0:
+            stream = islice(stream, limit)
+        for i, ref in enumerate(stream):
+            if i % count == index:
+                yield ref
+
+    def _scan(self, path: str) -> Iterator[RecordRef]:
+        seen = set()
+        with open(path, "rb") as fh:
+            if self.path.suffix == ".csv":
+                fh.readline()  # header
+            line_no = 1 if self.path.suffix == ".csv" else 0
+            while True:
+                offset = fh.tell()
+                raw = fh.readline()
+                if not raw:
+                    return
+                line_no += 1
+                if not raw.strip():
+                    continue
+                rid = str(_parse(path, raw.decode("utf-8")).get(self.id_field) or f"{self.path.stem}-{line_no}")
+                if rid in seen:
+                    rid = f"{rid}-{line_no}"
+                seen.add(rid)
+                yield RecordRef(path, offset, line_no, rid)
+
+
+@dataclass
+class DataStats:
+    """Records finished by this process and the time their tests took (setup to teardown)."""
+
+    records: int = 0
+    failed: int = 0
+    busy_s: float = 0.0
+    started: float = 0.0
+    ended: float = 0.0
+    # not a field: last test counted as failed, so call + teardown failures count once
+    _failed_nodeid = None
+
+    def record(self, report) -> None:
+        now = time.time()
+        self.started = min(self.started or now, now - report.duration)
+        self.ended = now
+        self.busy_s += report.duration
+        if report.when == "call":
+            self.records += 1
+        if report.failed and report.nodeid != self._failed_nodeid:
+            self._failed_nodeid = report.nodeid
+            self.failed += 1
+
+    @property
+    def wall_s(self) -> float:
+        return self.ended - self.started if self.started else 0.0
+
+    @property
+    def per_second(self) -> float:
+        return self.records / self.wall_s if self.wall_s else 0.0
+
+
+def report_record(report) -> Optional[str]:
+    """Record id of a TestReport (tagged through item.user_properties at collection)."""
+    for key, value in getattr(report, "user_properties", ()):
+        if key == "record":
+            return value
+    return None
+
+
+def data_report(per_worker: Dict[str, DataStats]) -> List[str]:
+    """Lines for the pytest terminal summary."""
+    lines = [f"{'worker':<8}{'records':>9}{'failed':>8}{'wall s':>10}{'rec/s':>9}"]
+    for wid, s in sorted(per_worker.items()):
+        lines.append(f"{wid:<8}{s.records:>9}{s.failed:>8}{s.wall_s:>10.2f}{s.per_second:>9.2f}")
+    total = sum(s.records for s in per_worker.values())
+    starts = [s.started for s in per_worker.values() if s.started]
+    wall = max(s.ended for s in per_worker.values()) - min(starts) if starts else 0.0
+    lines.append(f"{total} records in {wall:.2f}s ({total / wall if wall else 0.0:.2f} rec/s overall)")
+    return lines
@@ -0,0 +1,164 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+from .blob_store import BlobStore, pack_har, pack_trace
+from .logger import get_logger
+
+logger = get_logger()
+
+_PACKERS: Dict[str, Callable] = {"har": pack_har, "trace": pack_trace}
+
+
+class ArtifactFinalizer:
+    """
+    Post-processing of finished artifacts on a small thread pool, so a test's
+    teardown only pays for the Playwright calls that must run on its thread
+    (tracing.stop, context/page close, screenshot capture).
+
+    Jobs rename, pack into the blob store, delete discarded files, write
+    screenshots and append to `index_path` (JSONL). At most `max_pending`
+    jobs are queued; beyond that `submit` waits (back-pressure) and the wait
+    is reported. `workers=0` runs every job inline.
+    """
+
+    def __init__(
+        self,
+        index_path: Path,
+        workers: int = 2,
+        max_pending: int = 32,
+        blobs: Optional[BlobStore] = None,
+    ):
+        self.index_path = Path(index_path)
+        self.blobs = blobs
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="finalizer") if workers > 0 else None
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._lock = threading.Lock()
+        self._futures: Set = set()  # queued / running jobs only; done ones drop out
+        self.jobs = 0
+        self.failed = 0
+        self.busy_s = 0.0
+        self.blocked_s = 0.0
+
+    # ---------- producer side (test thread) ----------
+
+    def _submit(self, fn: Callable, *args) -> None:
+        self.jobs += 1
+        if self._pool is None:
+            self._run(fn, *args)
+            return
+        t0 = time.perf_counter()
+        self._slots.acquire()
+        self.blocked_s += time.perf_counter() - t0
+        fut = self._pool.submit(self._run, fn, *args)
+        with self._lock:
+            self._futures.add(fut)
+        fut.add_done_callback(self._done)
+
+    def _done(self, fut) -> None:
+        self._slots.release()
+        with self._lock:
+            self._futures.discard(fut)
+
+    def keep(self, test: str, kind: str, path: Path, rename_to: Optional[Path] = None) -> None:
+        """Finalize a kept artifact: optional rename, pack (HAR/trace with a blob store), index."""
+        self._submit(self._keep, test, kind, Path(path), rename_to)
+
+    def discard(self, kind: str, path: Path) -> None:
+        self._submit(self._discard, kind, Path(path))
+
+    def write(self, test: str, kind: str, path: Path, data: bytes) -> None:
+        """Write bytes captured on the test thread (e.g. a screenshot) and index them."""
+        self._submit(self._write, test, kind, Path(path), data)
+
+    # ---------- jobs (pool threads) ----------
+
+    def _run(self, fn: Callable, *args) -> None:
+        t0 = time.perf_counter()
+        try:
+            fn(*args)
+        except Exception as e:
+            with self._lock:
+                self.failed += 1
+            logger.error(f"Artifact finalization failed ({fn.__name__} {args[1:3]}): {e}")
+        finally:
+            with self._lock:
+                self.busy_s += time.perf_counter() - t0
+
+    def _keep(self, test: str, kind: str, path: Path, rename_to: Optional[Path]) -> None:
+        if not path.exists():
+            return
+        if rename_to is not None and rename_to != path:
+            os.replace(path, rename_to)
+            path = rename_to
+        raw = path.stat().st_size
+        packer = _PACKERS.get(kind) if self.blobs is not None else None
+        new_bytes = raw
+        if packer is not None:
+            path, new_bytes = packer(path, self.blobs)
+        self._index(test, kind, path, raw, new_bytes)
+
+    def _discard(self, kind: str, path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _write(self, test: str, kind: str, path: Path, data: bytes) -> None:
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        self._index(test, kind, path, len(data), len(data))
+
+    def _index(self, test: str, kind: str, path: Path, raw: int, written: int) -> None:
+        line = json.dumps({"test": test, "kind": kind, "path": str(path), "bytes": raw, "written": written, "ts": time.time()})
+        with self._lock:
+            with self.index_path.open("a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+
+    # ---------- session end ----------
+
+    def flush(self) -> None:
+        """Wait for every queued job."""
+        while True:
+            with self._lock:
+                pending = [fut for fut in self._futures if not fut.done()]
+            if not pending:
+                return
+            for fut in pending:
+                fut.result()
+
+    def close(self) -> None:
+        self.flush()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+    def summary(self) -> str:
+        return (
+            f"finalizer: {self.jobs} jobs, {self.busy_s * 1000:.0f} ms off the test path, "
+            f"back-pressure waits {self.blocked_s * 1000:.0f} ms, failed={self.failed}"
+        )
+
+
+def prune(dirs: List[Path], max_bytes: int) -> int:
+    """Delete the oldest files under `dirs` until they total at most `max_bytes`; returns bytes freed."""
+    files = []
+    for d in dirs:
+        if d.is_dir():
+            files.extend(p for p in d.rglob("*") if p.is_file())
+    stats = sorted(((p.stat().st_mtime, p.stat().st_size, p) for p in files), key=lambda t: t[0])
+    total = sum(size for _, size, _ in stats)
+    freed = 0
+    for _, size, path in stats:
+        if total - freed <= max_bytes:
+            break
+        try:
+            path.unlink()
+            freed += size
+        except OSError:
+            pass
+    return freed
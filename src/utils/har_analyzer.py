@@ -0,0 +1,324 @@
+"""
+Request waterfall / slow-endpoint report over recorded HAR files.
+
+    python -m src.utils.har_analyzer                      # artifacts/**/*.har (+ packed .har.ref.json)
+    python -m src.utils.har_analyzer artifacts/w0/har --jobs 8 --top 30
+    python -m src.utils.har_analyzer --json artifacts/har_summary.json
+
+HAR files are stream-parsed: only the log.entries array is decoded, one
+entry at a time, so memory is bounded by the largest single entry (its
+body included), not the file. Files are analyzed in parallel processes and
+their aggregates merged: per-domain and per-URL timing phases, payload
+sizes and cache effectiveness, plus the slowest individual requests.
+"""
+import argparse
+import codecs
+import heapq
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .artifacts import ARTIFACTS_ROOT
+from .blob_store import HAR_REF_SUFFIX
+
+# HAR timing phases (ms); connect includes ssl per the HAR spec
+PHASES = ("blocked", "dns", "connect", "ssl", "send", "wait", "receive")
+
+_ENTRIES_RE = re.compile(r'(?<!\\)"entries"\s*:\s*\[')
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def har_head(path: Path, chunk_size: int = 1 << 16) -> dict:
+    """
+    The HAR with an empty log.entries, parsed from the text before the
+    entries array (Playwright writes entries last, after log.pages).
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buf = ""
+    with open(path, "rb") as fh:
+        while True:
+            m = _ENTRIES_RE.search(buf)
+            if m:
+                break
+            data = fh.read(chunk_size)
+            if not data:
+                raise ValueError(f"No log.entries array in {path}")
+            buf += utf8.decode(data)
+    head = json.loads(buf[:m.start()] + '"entries": []}}')
+    if list(head.get("log", {}))[-1:] != ["entries"]:
+        raise ValueError(f"log.entries is not the last key of {path}")
+    return head
+
+
+def iter_entries(path: Path, chunk_size: int = 1 << 20) -> Iterator[dict]:
+    """Yield the objects of log.entries one by one without loading the whole file."""
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with open(path, "rb") as fh:
+        buf, eof = "", False
+
+        def more(size: int) -> bool:
+            nonlocal buf, eof
+            data = fh.read(size)
+            if not data:
+                eof = True
+                return False
+            buf += utf8.decode(data)
+            return True
+
+        # 1) skip to the start of the entries array (log.pages comes first)
+        while True:
+            m = _ENTRIES_RE.search(buf)
+            if m:
+                buf = buf[m.end():]
+                break
+            buf = buf[-64:]  # the key may straddle two chunks
+            if not more(chunk_size):
+                return
+
+        # 2) decode one entry at a time
+        idx = 0
+        while True:
+            while idx < len(buf) and buf[idx] in " \t\r\n,":
+                idx += 1
+            if idx >= len(buf):
+                buf, idx = "", 0
+                if not more(chunk_size):
+                    return
+                continue
+            if buf[idx] == "]":
+                return
+            try:
+                entry, end = decoder.raw_decode(buf, idx)
+            except ValueError:
+                if eof:
+                    raise
+                # entry not complete yet: grow the buffer geometrically so a
+                # huge body is re-parsed O(log n) times, not once per chunk
+                buf, idx = buf[idx:], 0
+                more(max(chunk_size, len(buf)))
+                continue
+            yield entry
+            buf, idx = buf[end:], 0
+
+
+@dataclass
+class Agg:
+    """Totals for one domain or URL."""
+
+    n: int = 0
+    time_ms: float = 0.0
+    max_ms: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+    bytes: int = 0
+    errors: int = 0
+    cached: int = 0
+    cacheable: int = 0
+
+    def add(self, ms: float, phases: Dict[str, float], nbytes: int, error: bool, cached: bool, cacheable: bool) -> None:
+        self.n += 1
+        self.time_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        for name, value in phases.items():
+            self.phases[name] = self.phases.get(name, 0.0) + value
+        self.bytes += nbytes
+        self.errors += error
+        self.cached += cached
+        self.cacheable += cacheable
+
+    def merge(self, other: "Agg") -> None:
+        self.n += other.n
+        self.time_ms += other.time_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        for name, value in other.phases.items():
+            self.phases[name] = self.phases.get(name, 0.0) + value
+        self.bytes += other.bytes
+        self.errors += other.errors
+        self.cached += other.cached
+        self.cacheable += other.cacheable
+
+    def to_json(self) -> dict:
+        n = self.n or 1
+        return {
+            "n": self.n,
+            "avg_ms": round(self.time_ms / n, 1),
+            "max_ms": round(self.max_ms, 1),
+            "avg_phases_ms": {k: round(v / n, 1) for k, v in self.phases.items()},
+            "kb": round(self.bytes / 1024, 1),
+            "errors": self.errors,
+            "cache_hit_rate": round(self.cached / n, 3),
+            "cacheable_rate": round(self.cacheable / n, 3),
+        }
+
+
+@dataclass
+class HarSummary:
+    files: int = 0
+    entries: int = 0
+    file_bytes: int = 0
+    domains: Dict[str, Agg] = field(default_factory=dict)
+    urls: Dict[str, Agg] = field(default_factory=dict)
+    # (ms, method, url, status, wait ms, receive ms, file): min-heap of the `top` slowest requests
+    slowest: List[tuple] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    def keep_slow(self, row: tuple, top: int) -> None:
+        if len(self.slowest) < top:
+            heapq.heappush(self.slowest, row)
+        elif row[0] > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, row)
+
+    def merge(self, other: "HarSummary", top: int) -> None:
+        self.files += other.files
+        self.entries += other.entries
+        self.file_bytes += other.file_bytes
+        for mine, theirs in ((self.domains, other.domains), (self.urls, other.urls)):
+            for key, agg in theirs.items():
+                mine.setdefault(key, Agg()).merge(agg)
+        for row in other.slowest:
+            self.keep_slow(row, top)
+        self.errors.extend(other.errors)
+
+
+def _header(headers: Sequence[dict], name: str) -> str:
+    for h in headers or ():
+        if h.get("name", "").lower() == name:
+            return h.get("value", "")
+    return ""
+
+
+def _classify(entry: dict) -> Tuple[float, Dict[str, float], int, bool, bool, bool]:
+    resp = entry.get("response", {})
+    timings = entry.get("timings", {})
+    phases = {p: float(timings[p]) for p in PHASES if isinstance(timings.get(p), (int, float)) and timings[p] >= 0}
+    ms = float(entry.get("time") or sum(v for k, v in phases.items() if k != "ssl"))
+    status = int(resp.get("status") or 0)
+    nbytes = resp.get("_transferSize")
+    if not isinstance(nbytes, int) or nbytes < 0:
+        nbytes = max(0, resp.get("bodySize") or 0) + max(0, resp.get("headersSize") or 0)
+    headers = resp.get("headers", [])
+    cache_control = _header(headers, "cache-control").lower()
+    max_age = _MAX_AGE_RE.search(cache_control)
+    cacheable = "no-store" not in cache_control and bool(
+        (max_age and int(max_age.group(1)) > 0) or _header(headers, "etag") or _header(headers, "last-modified")
+        or _header(headers, "expires")
+    )
+    cached = status == 304 or bool(entry.get("_fromCache") or resp.get("_fromCache"))
+    error = status <= 0 or status >= 400
+    return ms, phases, nbytes, error, cached, cacheable
+
+
+def analyze_file(path: str, top: int = 20) -> HarSummary:
+    """Aggregate one HAR (or packed .har.ref.json) file."""
+    out = HarSummary(files=1)
+    try:
+        out.file_bytes = os.path.getsize(path)
+        for entry in iter_entries(Path(path)):
+            req = entry.get("request", {})
+            parts = urlsplit(req.get("url", ""))
+            domain = parts.hostname or "-"
+            url = f"{parts.scheme}://{parts.netloc}{parts.path}"
+            ms, phases, nbytes, error, cached, cacheable = _classify(entry)
+            out.entries += 1
+            out.domains.setdefault(domain, Agg()).add(ms, phases, nbytes, error, cached, cacheable)
+            out.urls.setdefault(url, Agg()).add(ms, phases, nbytes, error, cached, cacheable)
+            status = int(entry.get("response", {}).get("status") or 0)
+            row = (ms, req.get("method", "GET"), req.get("url", ""), status, phases.get("wait", 0.0), phases.get("receive", 0.0), path)
+            out.keep_slow(row, top)
+    except Exception as e:
+        out.errors.append(f"{path}: {type(e).__name__}: {e}")
+    return out
+
+
+def har_files(paths: Sequence[Path]) -> List[Path]:
+    files: List[Path] = []
+    for p in paths:
+        if p.is_file():
+            files.append(p)
+        elif p.is_dir():
+            files.extend(sorted(p.rglob("*.har")))
+            files.extend(sorted(p.rglob(f"*{HAR_REF_SUFFIX}")))
+    # largest first: keeps the pool busy until the end
+    return sorted(set(files), key=lambda f: -f.stat().st_size)
+
+
+def analyze(paths: Sequence[Path], jobs: int = 0, top: int = 20) -> HarSummary:
+    files = [str(f) for f in har_files(paths)]
+    total = HarSummary()
+    jobs = jobs or min(len(files), os.cpu_count() or 1)
+    if jobs <= 1 or len(files) <= 1:
+        for f in files:
+            total.merge(analyze_file(f, top), top)
+        return total
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for r in pool.map(analyze_file, files, [top] * len(files), chunksize=max(1, len(files) // (jobs * 4))):
+            total.merge(r, top)
+    return total
+
+
+def to_json(summary: HarSummary, top_urls: int = 50) -> dict:
+    """Compact run summary: totals, every domain, the slowest URLs (by average) and requests."""
+    urls = sorted(summary.urls.items(), key=lambda kv: -kv[1].time_ms / max(1, kv[1].n))[:top_urls]
+    return {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "files": summary.files,
+        "entries": summary.entries,
+        "file_mb": round(summary.file_bytes / 1024 / 1024, 1),
+        "domains": {k: v.to_json() for k, v in sorted(summary.domains.items(), key=lambda kv: -kv[1].time_ms)},
+        "slowest_urls": {k: v.to_json() for k, v in urls},
+        "slowest_requests": [
+            {"ms": round(ms, 1), "method": m, "url": u, "status": s, "wait_ms": round(w, 1), "receive_ms": round(r, 1), "file": f}
+            for ms, m, u, s, w, r, f in sorted(summary.slowest, reverse=True)
+        ],
+        "errors": summary.errors,
+    }
+
+
+def report(summary: HarSummary, top: int = 20) -> List[str]:
+    """Slowest-requests table plus the per-domain breakdown, for the console."""
+    lines = [f"{'ms':>8} {'wait':>7} {'recv':>7} {'status':>6}  request"]
+    for ms, method, url, status, wait, recv, _ in sorted(summary.slowest, reverse=True)[:top]:
+        lines.append(f"{ms:>8.0f} {wait:>7.0f} {recv:>7.0f} {status:>6}  {method} {url[:120]}")
+    lines.append("")
+    lines.append(f"{'domain':<36}{'n':>6}{'avg ms':>8}{'dns':>6}{'conn':>6}{'wait':>7}{'recv':>7}{'KiB':>9}{'cache':>7}")
+    for domain, agg in sorted(summary.domains.items(), key=lambda kv: -kv[1].time_ms)[:top]:
+        j = agg.to_json()
+        ph = j["avg_phases_ms"]
+        lines.append(
+            f"{domain[:35]:<36}{agg.n:>6}{j['avg_ms']:>8.0f}{ph.get('dns', 0):>6.0f}{ph.get('connect', 0):>6.0f}"
+            f"{ph.get('wait', 0):>7.0f}{ph.get('receive', 0):>7.0f}{j['kb']:>9.1f}{j['cache_hit_rate']:>7.0%}"
+        )
+    lines.append(
+        f"{summary.entries} requests in {summary.files} files ({summary.file_bytes / 1024 / 1024:.1f} MiB read), "
+        f"{len(summary.domains)} domains, {len(summary.urls)} URLs"
+    )
+    return lines
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("paths", nargs="*", default=[str(ARTIFACTS_ROOT)], help="HAR files or folders (default artifacts/).")
+    ap.add_argument("--jobs", type=int, default=0, help="Parallel processes (default one per CPU).")
+    ap.add_argument("--top", type=int, default=20, help="Rows in the slowest-requests table (default 20).")
+    ap.add_argument("--json", default=str(ARTIFACTS_ROOT / "har_summary.json"), help="Where to write the JSON summary.")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    summary = analyze([Path(p) for p in args.paths], jobs=args.jobs, top=args.top)
+    out = Path(args.json)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(to_json(summary), indent=1), encoding="utf-8")
+    print("\n".join(report(summary, args.top)))
+    for err in summary.errors:
+        print(f"SKIPPED {err}")
+    print(f"Summary written to {out} in {time.perf_counter() - t0:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
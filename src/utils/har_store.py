@@ -0,0 +1,231 @@
+import base64
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urldefrag
+
+from playwright.sync_api import BrowserContext, Route, Request
+
+from .artifacts import worker_id
+from .blob_store import HAR_REF_SUFFIX, BlobStore, har_body
+from .har_analyzer import iter_entries
+from .logger import get_logger
+
+logger = get_logger()
+
+# Hop-by-hop / encoding headers that no longer match a decoded, stored body
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def _key(method: str, url: str, post_data: Optional[bytes] = None) -> str:
+    url = urldefrag(url)[0]
+    key = f"{method.upper()} {url}"
+    if post_data:
+        key += " #" + hashlib.sha1(post_data).hexdigest()[:16]
+    return key
+
+
+def _headers(pairs: Iterable[dict]) -> Dict[str, str]:
+    out: Dict[str, str] = {}
+    for h in pairs:
+        name, value = h["name"], h["value"]
+        low = name.lower()
+        if low in _DROP_HEADERS or name.startswith(":"):
+            continue
+        # Playwright expects multiple Set-Cookie values joined by newlines
+        out[low] = f"{out[low]}\n{value}" if low in out and low == "set-cookie" else value
+    return out
+
+
+def _har_body(content: dict, har_dir: Path) -> bytes:
+    if content.get("_file"):
+        # record_har_content="attach": body stored next to the HAR
+        path = har_dir / content["_file"]
+        return path.read_bytes() if path.exists() else b""
+    text = content.get("text")
+    if text is None:
+        return b""
+    if content.get("encoding") == "base64":
+        return base64.b64decode(text)
+    return text.encode("utf-8")
+
+
+class ReplayStats:
+    """Hit / miss counters for one test's context."""
+
+    def __init__(self, context: BrowserContext, handler):
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self._context = context
+        self._handler = handler
+
+    def detach(self) -> None:
+        try:
+            self._context.unroute("**/*", self._handler)
+        except Exception:
+            pass
+
+    def summary(self) -> str:
+        return f"hits={self.hits}, misses={self.misses}, recorded={self.recorded}"
+
+
+class HarStore:
+    """
+    Indexed store of recorded responses, built from the HAR files under
+    artifacts/ and served to every context through `context.route`.
+
+    Layout of `root`:
+        index.json              key -> {status, headers, body}, plus source manifest
+        bodies/<sha256>         response bodies, stored once per unique content
+                                (or the shared artifact BlobStore passed as `blobs`)
+        recorded-<worker>.jsonl entries fetched live in record-missing mode
+
+    Sources are HAR files and packed `.har.ref.json` files (ARTIFACT_STORE);
+    the latter need `blobs` to be the store they were packed into.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        sources: Iterable[Path],
+        record_missing: bool = False,
+        blobs: Optional[BlobStore] = None,
+    ):
+        self.root = Path(root)
+        self.sources = [Path(s) for s in sources]
+        self.record_missing = record_missing
+        self._index: Dict[str, dict] = {}
+        self._by_url: Dict[str, str] = {}
+        self._manifest: Dict[str, List[float]] = {}
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.blobs = blobs or BlobStore(self.root / "bodies")
+        self._recorded_path = self.root / f"recorded-{worker_id() or 'main'}.jsonl"
+
+    # ---------- building ----------
+
+    def load(self) -> "HarStore":
+        index_path = self.root / "index.json"
+        if index_path.exists():
+            try:
+                data = json.loads(index_path.read_text(encoding="utf-8"))
+                if data.get("blobs", str(self.root / "bodies")) == str(self.blobs.root):
+                    self._index = data.get("entries", {})
+                    self._manifest = data.get("manifest", {})
+            except Exception as e:
+                logger.error(f"HAR store index unreadable, rebuilding: {e}")
+
+        changed = False
+        for har in self._har_files():
+            st = har.stat()
+            sig = [st.st_mtime, st.st_size]
+            if self._manifest.get(str(har)) == sig:
+                continue
+            try:
+                self._ingest_har(har)
+                self._manifest[str(har)] = sig
+                changed = True
+            except Exception as e:
+                logger.error(f"Skipping unreadable HAR {har}: {e}")
+
+        for rec in sorted(self.root.glob("recorded-*.jsonl")):
+            for line in rec.read_text(encoding="utf-8").splitlines():
+                if line.strip():
+                    entry = json.loads(line)
+                    self._index[entry.pop("key")] = entry
+
+        if changed:
+            self._save_index()
+        self._by_url = {k.split(" #", 1)[0]: k for k in self._index}
+        logger.info(f"HAR store: {len(self._index)} entries from {self.root}")
+        return self
+
+    def _har_files(self) -> List[Path]:
+        files = []
+        for src in self.sources:
+            if src.is_file():
+                files.append(src)
+            elif src.is_dir():
+                files.extend(sorted(src.rglob("*.har")))
+                files.extend(sorted(src.rglob(f"*{HAR_REF_SUFFIX}")))
+        return files
+
+    def _ingest_har(self, har: Path) -> None:
+        # streamed: recorded HARs carry full bodies and can be large
+        for entry in iter_entries(har):
+            req, resp = entry.get("request", {}), entry.get("response", {})
+            if resp.get("status", 0) <= 0:
+                continue  # aborted / failed requests carry no response
+            post = (req.get("postData") or {}).get("text")
+            key = _key(req.get("method", "GET"), req.get("url", ""), post.encode("utf-8") if post else None)
+            content = resp.get("content", {})
+            packed = har_body(content, self.blobs) if content.get("_blob") else None
+            body = packed if packed is not None else _har_body(content, har.parent)
+            self._index[key] = {
+                "status": resp["status"],
+                "headers": _headers(resp.get("headers", [])),
+                "body": self._put_body(body),
+            }
+
+    def _put_body(self, body: bytes) -> str:
+        return self.blobs.put(body)[0]
+
+    def _save_index(self) -> None:
+        path = self.root / "index.json"
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        data = {"blobs": str(self.blobs.root), "manifest": self._manifest, "entries": self._index}
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+
+    # ---------- serving ----------
+
+    def lookup(self, method: str, url: str, post_data: Optional[bytes] = None) -> Optional[dict]:
+        rec = self._index.get(_key(method, url, post_data))
+        if rec is None and post_data:
+            # same endpoint recorded with a different payload
+            alt = self._by_url.get(_key(method, url))
+            rec = self._index.get(alt) if alt else None
+        return rec
+
+    def size_of(self, method: str, url: str) -> int:
+        """Stored body size for a request, 0 when unknown."""
+        rec = self.lookup(method, url)
+        if rec is None:
+            return 0
+        return self.blobs.size(rec["body"])
+
+    def body(self, sha: str) -> bytes:
+        return self.blobs.get(sha)
+
+    def attach(self, context: BrowserContext) -> ReplayStats:
+        """Route every request of `context` through the store."""
+
+        def handler(route: Route, request: Request):
+            post = request.post_data_buffer
+            rec = self.lookup(request.method, request.url, post)
+            if rec is not None:
+                stats.hits += 1
+                route.fulfill(status=rec["status"], headers=rec["headers"], body=self.body(rec["body"]))
+                return
+            stats.misses += 1
+            if not self.record_missing:
+                route.abort("internetdisconnected")
+                return
+            resp = route.fetch(max_redirects=0)
+            body = resp.body()
+            self._record(_key(request.method, request.url, post), resp.status, resp.headers_array(), body)
+            stats.recorded += 1
+            route.fulfill(response=resp, body=body)
+
+        stats = ReplayStats(context, handler)
+        context.route("**/*", handler)
+        return stats
+
+    def _record(self, key: str, status: int, headers: List[dict], body: bytes) -> None:
+        entry = {"status": status, "headers": _headers(headers), "body": self._put_body(body)}
+        self._index[key] = entry
+        self._by_url.setdefault(key.split(" #", 1)[0], key)
+        with self._recorded_path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps({"key": key, **entry}) + "\n")
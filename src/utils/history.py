@@ -0,0 +1,249 @@
+"""
+Test duration history (artifacts/history.sqlite) and longest-first scheduling.
+
+    python -m src.utils.history runs
+    python -m src.utils.history slowest --runs 10 --top 20
+    python -m src.utils.history trend input_form --runs 20
+
+Every pytest process appends one row per test phase (setup / call /
+teardown) with its worker, outcome and duration, tagged with the run id the
+parent hands to its workers. In parallel mode the parent bin-packs tests onto
+workers longest-first (LPT) from the median duration of their recent runs.
+"""
+import argparse
+import heapq
+import json
+import os
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .artifacts import ARTIFACTS_ROOT
+
+RUN_ID_ENV = "PW_RUN_ID"
+SCHEDULE_ENV = "PW_SCHEDULE"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL NOT NULL,
+    workers INTEGER NOT NULL,
+    args TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    finished REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_nodeid ON results (nodeid, run_id);
+"""
+
+
+class ResultsDB:
+    """SQLite store shared by all workers (WAL mode; rows are buffered and written once per session)."""
+
+    def __init__(self, path: Path, history_runs: int = 5, keep_runs: int = 200):
+        self.path = Path(path)
+        self.history_runs = history_runs
+        self.keep_runs = keep_runs  # older runs are pruned when a run is written
+        self.run_id: Optional[int] = int(os.environ[RUN_ID_ENV]) if os.getenv(RUN_ID_ENV) else None
+        self._rows: List[tuple] = []
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def ensure_run(self, workers: int = 1, args: Sequence[str] = (), started: Optional[float] = None) -> int:
+        if self.run_id is None:
+            with self._connect() as conn:
+                cur = conn.execute(
+                    "INSERT INTO runs (started, workers, args) VALUES (?, ?, ?)",
+                    (started or time.time(), workers, " ".join(args)),
+                )
+                self.run_id = cur.lastrowid
+        return self.run_id
+
+    def add(self, nodeid: str, worker: str, phase: str, outcome: str, duration: float) -> None:
+        self._rows.append((nodeid, worker, phase, outcome, duration, time.time()))
+
+    def flush(self, workers: int = 1, args: Sequence[str] = (), started: Optional[float] = None) -> int:
+        """Write the buffered rows; returns how many (the run row is created on first use)."""
+        if not self._rows:
+            return 0
+        run_id = self.ensure_run(workers, args, started)
+        rows, self._rows = self._rows, []
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO results (run_id, nodeid, worker, phase, outcome, duration, finished) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, *r) for r in rows],
+            )
+            self._prune(conn)
+        return len(rows)
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Drop runs (and their results) older than the newest `keep_runs`."""
+        oldest = conn.execute(
+            "SELECT id FROM runs ORDER BY id DESC LIMIT 1 OFFSET ?", (self.keep_runs - 1,)
+        ).fetchone()
+        if oldest is not None:
+            conn.execute("DELETE FROM results WHERE run_id < ?", oldest)
+            conn.execute("DELETE FROM runs WHERE id < ?", oldest)
+
+    # ---------- queries ----------
+
+    def _per_run_totals(self, runs: int) -> Dict[str, List[Tuple[int, float]]]:
+        """nodeid -> [(run_id, setup+call+teardown seconds)] over the last `runs` runs, newest first."""
+        if not self.path.exists():
+            return {}
+        out: Dict[str, List[Tuple[int, float]]] = {}
+        with self._connect() as conn:
+            for nodeid, run_id, total in conn.execute(
+                "SELECT nodeid, run_id, SUM(duration) FROM results "
+                "WHERE run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?) "
+                "GROUP BY nodeid, run_id ORDER BY run_id DESC",
+                (runs,),
+            ):
+                out.setdefault(nodeid, []).append((run_id, total))
+        return out
+
+    def expected_durations(self, nodeids: Iterable[str]) -> Dict[str, float]:
+        """Median total duration over each test's last `history_runs` runs (known tests only)."""
+        if not self.path.exists():
+            return {}
+        totals: Dict[str, List[float]] = {}
+        with self._connect() as conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (nodeid TEXT PRIMARY KEY)")
+            conn.execute("DELETE FROM wanted")
+            conn.executemany("INSERT OR IGNORE INTO wanted VALUES (?)", ((n,) for n in nodeids))
+            # per test, only its newest `history_runs` runs (walked backwards on the (nodeid, run_id) index)
+            for nodeid, total in conn.execute(
+                "SELECT w.nodeid, SUM(x.duration) FROM wanted w JOIN results x ON x.nodeid = w.nodeid "
+                "AND x.run_id IN (SELECT DISTINCT run_id FROM results WHERE nodeid = w.nodeid "
+                "ORDER BY run_id DESC LIMIT ?) GROUP BY w.nodeid, x.run_id",
+                (self.history_runs,),
+            ):
+                totals.setdefault(nodeid, []).append(total)
+        return {nodeid: statistics.median(values) for nodeid, values in totals.items()}
+
+    def runs(self, limit: int = 20) -> List[tuple]:
+        if not self.path.exists():
+            return []
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT r.id, r.started, r.workers, COUNT(DISTINCT x.nodeid), "
+                "SUM(x.phase = 'call' AND x.outcome = 'failed'), MAX(x.finished) - r.started "
+                "FROM runs r LEFT JOIN results x ON x.run_id = r.id GROUP BY r.id ORDER BY r.id DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+
+    def slowest(self, runs: int = 10, top: int = 20) -> List[Tuple[str, float, float, float, int]]:
+        """(nodeid, median s, max s, latest s, runs seen) over the last `runs` runs, slowest median first."""
+        rows = []
+        for nodeid, totals in self._per_run_totals(runs=runs).items():
+            values = [t for _, t in totals]
+            rows.append((nodeid, statistics.median(values), max(values), values[0], len(values)))
+        return sorted(rows, key=lambda r: -r[1])[:top]
+
+    def trend(self, pattern: str, runs: int = 20) -> Dict[str, List[Tuple[int, float]]]:
+        """Per-run totals (oldest first) for tests whose nodeid contains `pattern`."""
+        return {
+            nodeid: list(reversed(totals))
+            for nodeid, totals in self._per_run_totals(runs=runs).items()
+            if pattern in nodeid
+        }
+
+
+# ---------- scheduling ----------
+
+def lpt(durations: Dict[str, float], workers: Sequence[int]) -> Dict[str, int]:
+    """Longest processing time first: each test goes to the currently least-loaded worker."""
+    loads = [(0.0, w) for w in workers]
+    heapq.heapify(loads)
+    out = {}
+    for nodeid, seconds in sorted(durations.items(), key=lambda kv: (-kv[1], kv[0])):
+        load, w = heapq.heappop(loads)
+        out[nodeid] = w
+        heapq.heappush(loads, (load + seconds, w))
+    return out
+
+
+def with_defaults(nodeids: Iterable[str], known: Dict[str, float]) -> Dict[str, float]:
+    """Known durations plus the median of them for tests without history."""
+    default = statistics.median(known.values()) if known else 1.0
+    return {n: known.get(n, default) for n in nodeids}
+
+
+def write_schedule(path: Path, assignment: Dict[str, int], durations: Dict[str, float]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {n: {"worker": w, "expected_s": round(durations[n], 3)} for n, w in assignment.items()}
+    path.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+    return path
+
+
+def read_schedule(path: Path) -> Dict[str, dict]:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
+def balance_report(assignment: Dict[str, int], durations: Dict[str, float]) -> str:
+    loads: Dict[int, float] = {}
+    for nodeid, w in assignment.items():
+        loads[w] = loads.get(w, 0.0) + durations[nodeid]
+    longest = max(loads.values(), default=0.0)
+    total = sum(loads.values())
+    ideal = total / len(loads) if loads else 0.0
+    return (
+        "expected busy per worker " + ", ".join(f"w{w}={s:.1f}s" for w, s in sorted(loads.items()))
+        + f" (longest {longest:.1f}s vs ideal {ideal:.1f}s)"
+    )
+
+
+HISTORY = ResultsDB(ARTIFACTS_ROOT / "history.sqlite")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--db", default=str(HISTORY.path))
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    r = sub.add_parser("runs", help="recent runs")
+    r.add_argument("--limit", type=int, default=20)
+    s = sub.add_parser("slowest", help="slowest tests by median over recent runs")
+    s.add_argument("--runs", type=int, default=10)
+    s.add_argument("--top", type=int, default=20)
+    t = sub.add_parser("trend", help="per-run duration of tests matching a nodeid substring")
+    t.add_argument("pattern")
+    t.add_argument("--runs", type=int, default=20)
+    args = ap.parse_args()
+
+    db = ResultsDB(Path(args.db))
+    if args.cmd == "runs":
+        print(f"{'run':>5}  {'started':<19}{'workers':>8}{'tests':>7}{'failed':>8}{'wall s':>9}")
+        for rid, started, workers, tests, failed, wall in db.runs(args.limit):
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(started))
+            print(f"{rid:>5}  {stamp:<19}{workers:>8}{tests:>7}{failed or 0:>8}{wall or 0:>9.1f}")
+    elif args.cmd == "slowest":
+        print(f"{'median s':>9}{'max s':>8}{'last s':>8}{'runs':>6}  test")
+        for nodeid, med, mx, last, n in db.slowest(args.runs, args.top):
+            print(f"{med:>9.2f}{mx:>8.2f}{last:>8.2f}{n:>6}  {nodeid}")
+    else:
+        for nodeid, series in sorted(db.trend(args.pattern, args.runs).items()):
+            values = [s for _, s in series]
+            change = f"{(values[-1] - values[0]) / values[0]:+.0%}" if len(values) > 1 and values[0] else "-"
+            print(f"{nodeid}  ({change} first to last)")
+            print("    " + "  ".join(f"#{rid}:{s:.2f}s" for rid, s in series))
+
+
+if __name__ == "__main__":
+    main()
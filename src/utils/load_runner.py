@@ -0,0 +1,287 @@
+"""
+Virtual-user load runs built from the async page objects.
+
+    python -m src.utils.load_runner --standin --users 20 --ramp-up 30 --hold 60
+    python -m src.utils.load_runner --base-url http://staging:8080/selenium-playground/ \\
+        --users 50 --browsers 2 --journey input_form_submit --think-ms 500
+
+Every virtual user owns one context on one of `--browsers` shared browsers
+and loops over its journeys (src/pages/aio/scenarios.py) until the hold
+phase ends; users start evenly spread over the ramp-up. Each top-level
+page-object call of a journey is one step. Latency histograms and error
+rates per (journey, step) are streamed to a JSONL results file every
+`--interval` seconds, followed by one cumulative line per step.
+"""
+import argparse
+import asyncio
+import contextlib
+import contextvars
+import json
+import math
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Sequence, Tuple
+
+from playwright.async_api import Browser, Page
+
+from .artifacts import ARTIFACTS_ROOT
+from .logger import get_logger
+from .steps import STEPS, Span
+from .waits import WAIT_STATS
+
+logger = get_logger()
+
+# Same signature as src.pages.aio.scenarios.SCENARIOS entries
+Journey = Callable[[Page, str, int], Awaitable[None]]
+# Whole-iteration step recorded next to the page-object steps
+JOURNEY_STEP = "<journey>"
+
+_current_journey: contextvars.ContextVar = contextvars.ContextVar("load_journey", default=None)
+
+
+class LatencyHistogram:
+    """Log-bucketed latencies (~2% resolution): constant memory however many samples."""
+
+    GROWTH = 1.02
+
+    def __init__(self):
+        self.buckets: Counter = Counter()
+        self.n = 0
+        self.errors = 0
+        self.max_ms = 0.0
+
+    def add(self, ms: float, ok: bool = True) -> None:
+        self.buckets[int(math.log(max(ms, 1.0), self.GROWTH))] += 1
+        self.n += 1
+        self.errors += 0 if ok else 1
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile sample."""
+        if not self.n:
+            return 0.0
+        rank, seen = max(1, math.ceil(q / 100 * self.n)), 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self.GROWTH ** (bucket + 1), self.max_ms)
+        return self.max_ms
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.n if self.n else 0.0
+
+    def to_json(self) -> dict:
+        return {
+            "n": self.n,
+            "errors": self.errors,
+            "error_rate": round(self.error_rate, 4),
+            "p50": round(self.percentile(50), 1),
+            "p95": round(self.percentile(95), 1),
+            "p99": round(self.percentile(99), 1),
+            "max": round(self.max_ms, 1),
+        }
+
+
+@dataclass
+class LoadProfile:
+    users: int = 10
+    ramp_up_s: float = 10.0
+    hold_s: float = 30.0
+    think_ms: int = 0
+
+    @property
+    def duration_s(self) -> float:
+        return self.ramp_up_s + self.hold_s
+
+
+class LoadRunner:
+    """
+    Drives `profile.users` virtual users over `browsers` on the caller's event
+    loop: `await runner.run()` returns the cumulative histograms keyed by
+    (journey, step).
+    """
+
+    def __init__(
+        self,
+        browsers: Sequence[Browser],
+        journeys: Dict[str, Journey],
+        base_url: str,
+        profile: LoadProfile,
+        results_path: Path,
+        timeout_ms: int = 30000,
+        interval_s: float = 5.0,
+    ):
+        if not browsers or not journeys:
+            raise ValueError("LoadRunner needs at least one browser and one journey")
+        self.browsers = list(browsers)
+        self.journeys = journeys
+        self.base_url = base_url
+        self.profile = profile
+        self.results_path = Path(results_path)
+        self.timeout_ms = timeout_ms
+        self.interval_s = interval_s
+        self.totals: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._window: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self.active = 0
+        self.iterations = 0
+        self._t0 = 0.0
+
+    # ---------- samples ----------
+
+    def _add(self, journey: str, step: str, ms: float, ok: bool) -> None:
+        key = (journey, step)
+        self._window.setdefault(key, LatencyHistogram()).add(ms, ok)
+        self.totals.setdefault(key, LatencyHistogram()).add(ms, ok)
+
+    def _on_span(self, span: Span) -> None:
+        journey = _current_journey.get()
+        if journey is not None and span.depth == 0:
+            self._add(journey, span.step, span.ms, span.ok)
+
+    def _phase(self) -> str:
+        return "ramp-up" if time.perf_counter() - self._t0 < self.profile.ramp_up_s else "hold"
+
+    # ---------- virtual users ----------
+
+    async def _user(self, index: int, deadline: float) -> None:
+        names = list(self.journeys)
+        await asyncio.sleep(index * self.profile.ramp_up_s / max(1, self.profile.users))
+        context = await self.browsers[index % len(self.browsers)].new_context()
+        self.active += 1
+        try:
+            i = index
+            while time.perf_counter() < deadline:
+                name = names[i % len(names)]
+                i += 1
+                token = _current_journey.set(name)
+                t0, ok = time.perf_counter(), False
+                page = await context.new_page()
+                page.set_default_timeout(self.timeout_ms)
+                try:
+                    await self.journeys[name](page, self.base_url, self.timeout_ms)
+                    ok = True
+                except Exception as e:
+                    logger.debug(f"VU {index} {name} failed: {type(e).__name__}: {e}")
+                finally:
+                    _current_journey.reset(token)
+                    self._add(name, JOURNEY_STEP, (time.perf_counter() - t0) * 1000, ok)
+                    self.iterations += 1
+                    await page.close()
+                    await context.clear_cookies()
+                if self.profile.think_ms:
+                    await asyncio.sleep(self.profile.think_ms / 1000)
+        finally:
+            self.active -= 1
+            await context.close()
+
+    # ---------- results stream ----------
+
+    def _flush(self, fh, kind: str, hists: Dict[Tuple[str, str], LatencyHistogram]) -> None:
+        elapsed = round(time.perf_counter() - self._t0, 2)
+        for (journey, step), hist in sorted(hists.items()):
+            line = {"type": kind, "t": elapsed, "phase": self._phase(), "users": self.active,
+                    "journey": journey, "step": step, **hist.to_json()}
+            fh.write(json.dumps(line) + "\n")
+        fh.flush()
+
+    async def _reporter(self, fh) -> None:
+        while True:
+            await asyncio.sleep(self.interval_s)
+            window, self._window = self._window, {}
+            self._flush(fh, "interval", window)
+            WAIT_STATS.reset()
+
+    async def run(self) -> Dict[Tuple[str, str], LatencyHistogram]:
+        self.results_path.parent.mkdir(parents=True, exist_ok=True)
+        self._t0 = time.perf_counter()
+        deadline = self._t0 + self.profile.duration_s
+        keep, counters, wait_keep = STEPS.keep, STEPS.counters, WAIT_STATS.keep
+        # spans and wait records of a long run would pile up in memory, and the
+        # process-wide pw_calls / wait_ms deltas mix all virtual users, so skip them
+        STEPS.keep = STEPS.counters = WAIT_STATS.keep = False
+        WAIT_STATS.reset()
+        STEPS.listeners.append(self._on_span)
+        with self.results_path.open("w", encoding="utf-8") as fh:
+            reporter = asyncio.ensure_future(self._reporter(fh))
+            try:
+                # in-flight iterations finish after the deadline (bounded by the page timeouts)
+                await asyncio.gather(*(self._user(i, deadline) for i in range(self.profile.users)))
+            finally:
+                reporter.cancel()
+                STEPS.listeners.remove(self._on_span)
+                STEPS.keep, STEPS.counters, WAIT_STATS.keep = keep, counters, wait_keep
+                WAIT_STATS.reset()
+                self._flush(fh, "interval", self._window)
+                self._flush(fh, "total", self.totals)
+        return self.totals
+
+    def report(self) -> List[str]:
+        """Cumulative lines for the console, slowest p95 first."""
+        wall = time.perf_counter() - self._t0
+        lines = [f"{'n':>7}{'err %':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  journey / step"]
+        for (journey, step), h in sorted(self.totals.items(), key=lambda kv: (kv[0][0], -kv[1].percentile(95))):
+            lines.append(
+                f"{h.n:>7}{h.error_rate * 100:>7.1f}{h.percentile(50):>9.0f}{h.percentile(95):>9.0f}"
+                f"{h.percentile(99):>9.0f}  {journey} / {step}"
+            )
+        lines.append(
+            f"{self.iterations} journeys by {self.profile.users} users in {wall:.1f}s "
+            f"({self.iterations / wall if wall else 0.0:.2f}/s); results in {self.results_path}"
+        )
+        return lines
+
+
+async def _main(args) -> None:
+    from playwright.async_api import async_playwright
+
+    from ..pages.aio.scenarios import SCENARIOS
+    from .config import Settings
+    from .standin_server import StandinServer
+
+    settings = Settings.load()
+    journeys = {n: SCENARIOS[n] for n in (args.journey or SCENARIOS)}
+    profile = LoadProfile(args.users, args.ramp_up, args.hold, args.think_ms)
+    server = StandinServer(latency_ms=args.latency_ms, error_rate=args.error_rate) if args.standin else None
+    base_url = server.base_url if server is not None else (args.base_url or settings.base_url)
+    with server if server is not None else contextlib.nullcontext():
+        async with async_playwright() as pw:
+            engine = getattr(pw, settings.browsers[0])
+            browsers = [await engine.launch(headless=settings.headless) for _ in range(max(1, args.browsers))]
+            runner = LoadRunner(
+                browsers, journeys, base_url, profile,
+                Path(args.results), timeout_ms=settings.timeout_ms, interval_s=args.interval,
+            )
+            print(f"Load run: {profile.users} users on {len(browsers)} browsers against {base_url}")
+            try:
+                await runner.run()
+            finally:
+                for b in browsers:
+                    await b.close()
+            print("\n".join(runner.report()))
+    if server is not None:
+        print(server.summary())
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--users", type=int, default=10, help="Concurrent virtual users (default 10).")
+    ap.add_argument("--ramp-up", type=float, default=10.0, help="Seconds to start all users (default 10).")
+    ap.add_argument("--hold", type=float, default=30.0, help="Seconds at full load after ramp-up (default 30).")
+    ap.add_argument("--think-ms", type=int, default=0, help="Pause between a user's journeys.")
+    ap.add_argument("--browsers", type=int, default=1, help="Browsers shared by the users (default 1).")
+    ap.add_argument("--journey", action="append", choices=("simple_form_demo", "drag_drop_sliders", "input_form_submit"),
+                    help="Journey to run (repeatable; default all).")
+    ap.add_argument("--base-url", default=None, help="Target site (default BASE_URL).")
+    ap.add_argument("--standin", action="store_true", help="Start the local stand-in server and target it.")
+    ap.add_argument("--latency-ms", type=int, default=0, help="Stand-in API latency.")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="Stand-in API error rate.")
+    ap.add_argument("--interval", type=float, default=5.0, help="Seconds between streamed result lines (default 5).")
+    ap.add_argument("--results", default=str(ARTIFACTS_ROOT / "load" / f"load-{time.strftime('%Y%m%d_%H%M%S')}.jsonl"))
+    asyncio.run(_main(ap.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+import json
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlparse
+
+from playwright.sync_api import Locator, Page
+
+from .artifacts import ARTIFACTS_ROOT
+
+
+@dataclass(frozen=True)
+class Strategy:
+    """
+    One way of finding an element. `kind` is placeholder | label | role | css.
+    Evaluated in the page by _PROBE_JS and turned into the equivalent
+    Playwright locator once it wins.
+    """
+    name: str
+    kind: str
+    value: str
+    role: Optional[str] = None
+    text: Optional[str] = None          # css only: regex the element text must match
+    has: Optional["Strategy"] = None    # css only: descendant that must exist
+    exact: bool = False
+
+    def to_json(self) -> dict:
+        return {
+            "kind": self.kind,
+            "value": self.value,
+            "role": self.role,
+            "text": self.text,
+            "has": self.has.to_json() if self.has else None,
+            "exact": self.exact,
+        }
+
+    def locator(self, root: Union[Page, Locator]) -> Locator:
+        if self.kind == "placeholder":
+            return root.get_by_placeholder(self.value, exact=self.exact)
+        if self.kind == "label":
+            return root.get_by_label(self.value, exact=self.exact)
+        if self.kind == "role":
+            return root.get_by_role(self.role, name=re.compile(self.value, re.I))
+        loc = root.locator(self.value)
+        if self.text:
+            loc = loc.filter(has_text=re.compile(self.text, re.I))
+        if self.has:
+            # the inner locator is created from the page and evaluated relative to `loc`
+            page = root.page if hasattr(root, "page") else root
+            loc = loc.filter(has=self.has.locator(page))
+        return loc
+
+
+def placeholder(text: str, exact: bool = False) -> Strategy:
+    return Strategy(f"placeholder:{text}", "placeholder", text, exact=exact)
+
+
+def label(text: str, exact: bool = False) -> Strategy:
+    return Strategy(f"label:{text}", "label", text, exact=exact)
+
+
+def role(role_name: str, name_regex: str) -> Strategy:
+    return Strategy(f"role:{role_name}:{name_regex}", "role", name_regex, role=role_name)
+
+
+def css(selector: str, text: Optional[str] = None, has: Optional[Strategy] = None) -> Strategy:
+    name = f"css:{selector}" + (f"[text~{text}]" if text else "") + (f"[has {has.name}]" if has else "")
+    return Strategy(name, "css", selector, text=text, has=has)
+
+
+# In-page finder shared by the resolver probe and bulk fill:
+# find(root, candidate) -> matching elements under root
+FIND_JS = """
+function find(r, c) {
+  const norm = s => (s || '').replace(/\\s+/g, ' ').trim();
+  const textMatch = (s, value, exact) => exact ? norm(s) === value : norm(s).toLowerCase().includes(value.toLowerCase());
+  const visible = el => !el.closest('[aria-hidden=true]') && el.getClientRects().length > 0;
+  const ROLES = {
+    button: "button, input[type=button], input[type=submit], input[type=reset], [role=button]",
+    link: "a[href], [role=link]",
+    textbox: "input:not([type]), input[type=text], input[type=email], input[type=password], input[type=url], input[type=tel], input[type=search], textarea, [role=textbox]",
+    combobox: "select, [role=combobox]",
+    checkbox: "input[type=checkbox], [role=checkbox]",
+  };
+  const accName = el => {
+    if (el.getAttribute('aria-label')) return norm(el.getAttribute('aria-label'));
+    const ids = el.getAttribute('aria-labelledby');
+    if (ids) return norm(ids.split(/\\s+/).map(id => (document.getElementById(id) || {}).textContent || '').join(' '));
+    if (el.tagName === 'INPUT' && ['button', 'submit', 'reset'].includes(el.type)) return norm(el.value || el.type);
+    return norm(el.textContent);
+  };
+  switch (c.kind) {
+    case 'placeholder':
+      return [...r.querySelectorAll('[placeholder]')].filter(el => textMatch(el.getAttribute('placeholder'), c.value, c.exact));
+    case 'label': {
+      const out = new Set();
+      for (const lab of r.querySelectorAll('label'))
+        if (lab.control && textMatch(lab.textContent, c.value, c.exact)) out.add(lab.control);
+      for (const el of r.querySelectorAll('[aria-label]'))
+        if (textMatch(el.getAttribute('aria-label'), c.value, c.exact)) out.add(el);
+      return [...out].filter(el => r === document || r.contains(el));
+    }
+    case 'role': {
+      const re = new RegExp(c.value, 'i');
+      return [...r.querySelectorAll(ROLES[c.role] || `[role=${c.role}]`)].filter(el => visible(el) && re.test(accName(el)));
+    }
+    default: {
+      let els = [...r.querySelectorAll(c.value)];
+      if (c.text) { const re = new RegExp(c.text, 'i'); els = els.filter(el => re.test(norm(el.textContent))); }
+      if (c.has) els = els.filter(el => find(el, c.has).length > 0);
+      return els;
+    }
+  }
+}
+"""
+
+# Probes every candidate in one evaluation and returns the index of the first
+# one (in the order given) that matches at least one element under `root`
+_PROBE_JS = """
+([root, candidates]) => {
+  root = root || document;
+  const find = """ + FIND_JS + """;
+  for (let i = 0; i < candidates.length; i++) {
+    try { if (find(root, candidates[i]).length) return i; } catch (e) { /* bad selector: skip */ }
+  }
+  return -1;
+}
+"""
+_PROBE_ON_ELEMENT_JS = "(el, c) => (" + _PROBE_JS + ")([el, c])"
+
+
+class LocatorResolver:
+    """
+    Resolves an element from a chain of fallback strategies in a single
+    in-page evaluation, remembers which strategy won per
+    (page object, element, URL path) and persists that memory so later runs
+    try the winner first.
+    """
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = Path(cache_path)
+        self._cache: Optional[Dict[str, str]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        # (element key, strategy name, declared position) -> wins
+        self.stats: Counter = Counter()
+
+    def _load(self) -> Dict[str, str]:
+        if self._cache is None:
+            try:
+                self._cache = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            except Exception:
+                self._cache = {}
+        return self._cache
+
+    @staticmethod
+    def _key(owner: str, element: str, url: str) -> str:
+        return f"{owner}|{element}|{urlparse(url).path}"
+
+    def _order(self, key: str, candidates: Sequence[Strategy]) -> Tuple[Optional[str], List[Strategy]]:
+        cached = self._load().get(key)
+        ordered = sorted(candidates, key=lambda c: c.name != cached) if cached else list(candidates)
+        return cached, ordered
+
+    def _settle(self, key, cached, owner, element, candidates, ordered, idx, root):
+        if idx < 0:
+            # Nothing matched yet: hand back the last resort so the caller's
+            # action fails with Playwright's usual auto-wait/timeout
+            self.stats[(f"{owner}.{element}", "<none>", -1)] += 1
+            return ordered[-1].locator(root), None
+
+        winner = ordered[idx]
+        self.stats[(f"{owner}.{element}", winner.name, list(candidates).index(winner))] += 1
+        if cached != winner.name:
+            with self._lock:
+                self._cache[key] = winner.name
+                self._dirty = True
+        return winner.locator(root), winner
+
+    def resolve(
+        self,
+        page: Page,
+        owner: str,
+        element: str,
+        candidates: Sequence[Strategy],
+        root: Optional[Locator] = None,
+    ) -> Tuple[Locator, Optional[Strategy]]:
+        key = self._key(owner, element, page.url)
+        cached, ordered = self._order(key, candidates)
+        payload = [c.to_json() for c in ordered]
+        if root is not None:
+            idx = root.evaluate(_PROBE_ON_ELEMENT_JS, payload)
+        else:
+            idx = page.evaluate(_PROBE_JS, [None, payload])
+        return self._settle(key, cached, owner, element, candidates, ordered, idx, root or page)
+
+    async def resolve_async(self, page, owner: str, element: str, candidates: Sequence[Strategy], root=None):
+        """Same as resolve() for playwright.async_api pages/locators."""
+        key = self._key(owner, element, page.url)
+        cached, ordered = self._order(key, candidates)
+        payload = [c.to_json() for c in ordered]
+        if root is not None:
+            idx = await root.evaluate(_PROBE_ON_ELEMENT_JS, payload)
+        else:
+            idx = await page.evaluate(_PROBE_JS, [None, payload])
+        return self._settle(key, cached, owner, element, candidates, ordered, idx, root or page)
+
+    def save(self) -> None:
+        """Merge this process' winners into the cache file (workers share it)."""
+        if not self._dirty:
+            return
+        with self._lock:
+            try:
+                on_disk = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            except Exception:
+                on_disk = {}
+            on_disk.update(self._cache or {})
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(on_disk, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.cache_path)
+            self._dirty = False
+
+    def report(self) -> List[str]:
+        """One line per element/strategy; position > 0 means a fallback fired."""
+        lines = []
+        for (element, name, pos), n in sorted(self.stats.items()):
+            tag = "primary" if pos == 0 else ("no match" if pos < 0 else f"fallback #{pos}")
+            lines.append(f"{n:>5}x  {element:<45} {tag:<12} {name}")
+        return lines
+
+
+RESOLVER = LocatorResolver(ARTIFACTS_ROOT / "locator_cache.json")
@@ -1,5 +1,5 @@
 import logging
-from pathlib import Path
+from .artifacts import artifacts_dir, worker_id
 
 def get_logger(name: str = "tests") -> logging.Logger:
     logger = logging.getLogger(name)
@@ -7,16 +7,17 @@ def get_logger(name: str = "tests") -> logging.Logger:
         return logger
     logger.setLevel(logging.INFO)
 
-    artifacts = Path("artifacts")
-    artifacts.mkdir(parents=True, exist_ok=True)
-    log_file = artifacts / "test.log"
+    log_file = artifacts_dir() / "test.log"
 
     ch = logging.StreamHandler()
     ch.setLevel(logging.INFO)
     fh = logging.FileHandler(log_file, encoding="utf-8")
     fh.setLevel(logging.INFO)
 
-    formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+    # Tag records with the worker id so merged parallel output stays readable
+    wid = worker_id()
+    prefix = f"{wid} | " if wid else ""
+    formatter = logging.Formatter(f"%(asctime)s | %(levelname)s | {prefix}%(name)s | %(message)s")
     ch.setFormatter(formatter)
     fh.setFormatter(formatter)
 
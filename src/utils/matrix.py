@@ -0,0 +1,148 @@
+"""
+Cross-browser matrix mode (BROWSERS=chromium,firefox,webkit).
+
+Browser tests are parametrized with a session-scoped `browser_name`, so each
+process launches an engine once and only if it runs tests for it. In
+parallel mode workers are assigned to engines (see shard_by_engine), so the
+engines start and run side by side instead of one invocation after another.
+"""
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+ENGINES = ("chromium", "firefox", "webkit")
+
+
+def parse_browsers(value: Optional[str], default: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Comma-separated engine names (or 'all'); unknown names are ignored."""
+    if value is None:
+        return default
+    if value.strip().lower() == "all":
+        return ENGINES
+    names = []
+    for part in value.split(","):
+        name = part.strip().lower()
+        if name in ENGINES and name not in names:
+            names.append(name)
+    return tuple(names) or default
+
+
+def engine_of(item) -> Optional[str]:
+    callspec = getattr(item, "callspec", None)
+    return callspec.params.get("browser_name") if callspec is not None else None
+
+
+def engine_workers(engines: Sequence[str], count: int) -> Dict[str, List[int]]:
+    """
+    Worker indexes serving each engine. With at least as many workers as
+    engines every worker serves one engine (extra workers go round-robin);
+    otherwise workers take several engines each.
+    """
+    out: Dict[str, List[int]] = {e: [] for e in engines}
+    if count >= len(engines):
+        for i in range(count):
+            out[engines[i % len(engines)]].append(i)
+    else:
+        for j, e in enumerate(engines):
+            out[e].append(j % count)
+    return out
+
+
+def shard_by_engine(items: Sequence, engines: Sequence[str], index: int, count: int) -> list:
+    """Items that belong to worker `index`: its engines' items, round-robin among that engine's workers."""
+    serving = engine_workers(engines, count)
+    seen: Dict[Optional[str], int] = {}
+    keep = []
+    for it in items:
+        engine = engine_of(it)
+        workers = serving.get(engine) or list(range(count))  # engine-less tests spread over everyone
+        n = seen.get(engine, 0)
+        seen[engine] = n + 1
+        if workers[n % len(workers)] == index:
+            keep.append(it)
+    return keep
+
+
+@dataclass
+class EngineStats:
+    tests: int = 0
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    busy_s: float = 0.0
+    launch_s: float = 0.0
+    # first / last report timestamps (epoch s), comparable across workers
+    started: float = 0.0
+    ended: float = 0.0
+
+    def record(self, report) -> None:
+        now = time.time()
+        self.started = min(self.started or now, now - report.duration)
+        self.ended = now
+        self.busy_s += report.duration
+        if report.when == "call":
+            self.tests += 1
+            if report.passed:
+                self.passed += 1
+            elif report.failed:
+                self.failed += 1
+            else:
+                self.skipped += 1
+        elif report.failed:
+            self.failed += 1
+        elif report.skipped and report.when == "setup":
+            self.tests += 1
+            self.skipped += 1
+
+    def merge(self, other: "EngineStats") -> None:
+        for name in ("tests", "passed", "failed", "skipped", "busy_s", "launch_s"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        # workers of one engine run side by side: its wall time spans all of them
+        if other.started:
+            self.started = min(self.started or other.started, other.started)
+        self.ended = max(self.ended, other.ended)
+
+    @property
+    def wall_s(self) -> float:
+        return self.ended - self.started if self.started else 0.0
+
+    @property
+    def pass_rate(self) -> float:
+        ran = self.tests - self.skipped
+        return self.passed / ran if ran else 0.0
+
+
+def report_engine(report) -> Optional[str]:
+    """Engine of a TestReport (tagged through item.user_properties at collection)."""
+    for key, value in getattr(report, "user_properties", ()):
+        if key == "browser":
+            return value
+    return None
+
+
+def to_json(stats: Dict[str, EngineStats]) -> Dict[str, dict]:
+    return {e: asdict(s) for e, s in stats.items()}
+
+
+def merge_json(into: Dict[str, EngineStats], data: Iterable[Tuple[str, dict]]) -> None:
+    for engine, raw in data:
+        into.setdefault(engine, EngineStats()).merge(EngineStats(**raw))
+
+
+def matrix_report(stats: Dict[str, EngineStats], session_wall_s: float) -> List[str]:
+    """Lines for the pytest terminal summary."""
+    lines = [f"{'engine':<10}{'tests':>7}{'passed':>8}{'failed':>8}{'pass':>7}{'launch s':>10}{'busy s':>9}{'wall s':>9}"]
+    for engine in sorted(stats, key=lambda e: ENGINES.index(e) if e in ENGINES else len(ENGINES)):
+        s = stats[engine]
+        lines.append(
+            f"{engine:<10}{s.tests:>7}{s.passed:>8}{s.failed:>8}{s.pass_rate:>7.0%}"
+            f"{s.launch_s:>10.2f}{s.busy_s:>9.2f}{s.wall_s:>9.2f}"
+        )
+    # launches happen in the first test's setup, so busy_s already includes them
+    sequential = sum(s.busy_s for s in stats.values())
+    slowest = max((s.wall_s for s in stats.values()), default=0.0)
+    lines.append(
+        f"matrix wall {session_wall_s:.2f}s (slowest engine {slowest:.2f}s, "
+        f"engines back to back ~{sequential:.2f}s)"
+    )
+    return lines
@@ -0,0 +1,136 @@
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Callable, FrozenSet, Optional, Tuple
+from urllib.parse import urlparse
+
+from playwright.sync_api import BrowserContext, Route, Request
+
+# Analytics, tag managers, chat widgets and consent managers seen on the playground
+THIRD_PARTY_NOISE = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "facebook.net",
+    "facebook.com",
+    "hotjar.com",
+    "clarity.ms",
+    "hs-scripts.com",
+    "hs-analytics.net",
+    "hubspot.com",
+    "intercom.io",
+    "intercomcdn.com",
+    "zopim.com",
+    "zendesk.com",
+    "crisp.chat",
+    "drift.com",
+    "ads.linkedin.com",
+    "licdn.com",
+    "cookielaw.org",
+    "onetrust.com",
+    "cookiebot.com",
+)
+
+HEAVY_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+
+def _domain_matches(host: str, domains: Tuple[str, ...]) -> bool:
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+
+@dataclass(frozen=True)
+class NetworkPolicy:
+    """
+    Declarative allow/deny rules by resource type and domain.
+
+    Allow rules win over deny rules; anything matching neither is allowed.
+    Top-level documents are never blocked.
+    """
+    deny_resource_types: FrozenSet[str] = field(default_factory=frozenset)
+    deny_domains: Tuple[str, ...] = ()
+    allow_resource_types: FrozenSet[str] = field(default_factory=frozenset)
+    allow_domains: Tuple[str, ...] = ()
+
+    def merge(self, other: Optional["NetworkPolicy"]) -> "NetworkPolicy":
+        if other is None:
+            return self
+        return replace(
+            self,
+            deny_resource_types=self.deny_resource_types | other.deny_resource_types,
+            deny_domains=self.deny_domains + other.deny_domains,
+            allow_resource_types=self.allow_resource_types | other.allow_resource_types,
+            allow_domains=self.allow_domains + other.allow_domains,
+        )
+
+    def verdict(self, resource_type: str, url: str) -> Optional[str]:
+        """Return the reason a request is blocked, or None if it is allowed."""
+        if resource_type == "document":
+            return None
+        host = (urlparse(url).hostname or "").lower()
+        if resource_type in self.allow_resource_types or _domain_matches(host, self.allow_domains):
+            return None
+        if _domain_matches(host, self.deny_domains):
+            return f"domain:{host}"
+        if resource_type in self.deny_resource_types:
+            return f"type:{resource_type}"
+        return None
+
+
+# Shared by the playground page objects: none of the scenarios need media,
+# fonts or any of the analytics/chat/consent widgets
+PLAYGROUND_POLICY = NetworkPolicy(
+    deny_resource_types=HEAVY_RESOURCE_TYPES,
+    deny_domains=THIRD_PARTY_NOISE,
+)
+
+
+class NetworkFilter:
+    """
+    Route handler installed on a context. Page objects switch the active policy
+    when they are constructed (see BasePage.NETWORK_POLICY); allowed requests
+    fall through to any earlier route (e.g. HAR replay) or the network.
+    """
+
+    _registry: "weakref.WeakKeyDictionary[BrowserContext, NetworkFilter]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, context: BrowserContext, size_hint: Optional[Callable[[str, str], int]] = None):
+        self.context = context
+        self.policy: Optional[NetworkPolicy] = None
+        self.size_hint = size_hint
+        self.blocked = 0
+        # None without a size_hint: in live mode nothing tells us how big a blocked response would be
+        self.bytes_saved: Optional[int] = 0 if size_hint is not None else None
+        self.reasons: Counter = Counter()
+        context.route("**/*", self._handle)
+        NetworkFilter._registry[context] = self
+
+    @classmethod
+    def for_context(cls, context: BrowserContext) -> Optional["NetworkFilter"]:
+        return cls._registry.get(context)
+
+    def use(self, policy: Optional[NetworkPolicy]) -> None:
+        self.policy = policy
+
+    def _handle(self, route: Route, request: Request) -> None:
+        reason = self.policy.verdict(request.resource_type, request.url) if self.policy else None
+        if reason is None:
+            route.fallback()
+            return
+        self.blocked += 1
+        self.reasons[reason] += 1
+        if self.bytes_saved is not None:
+            self.bytes_saved += self.size_hint(request.method, request.url) or 0
+        route.abort("blockedbyclient")
+
+    def detach(self) -> None:
+        NetworkFilter._registry.pop(self.context, None)
+        try:
+            self.context.unroute("**/*", self._handle)
+        except Exception:
+            pass
+
+    def summary(self) -> str:
+        top = ", ".join(f"{k}={v}" for k, v in self.reasons.most_common(5))
+        saved = f", bytes_saved~{self.bytes_saved / 1024:.1f} KiB" if self.bytes_saved is not None else ""
+        return f"blocked={self.blocked}{saved} ({top or '-'})"
@@ -0,0 +1,228 @@
+"""
+Native parallel mode: fork N pytest worker processes and shard tests across them.
+
+The main pytest process collects as usual and then, instead of running the
+tests itself, starts one `python -m pytest` worker per shard. Every worker
+owns its own `sync_playwright()` + `browser` (the session fixtures simply run
+once per process), writes artifacts under `artifacts/<worker_id>/` and reports
+its utilization back through a small JSON file.
+"""
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .artifacts import ARTIFACTS_ROOT, WORKER_ID_ENV, artifacts_dir, worker_id
+
+WORKER_INDEX_ENV = "PW_WORKER_INDEX"
+WORKER_COUNT_ENV = "PW_WORKER_COUNT"
+STATS_FILE = "worker_stats.json"
+
+
+def is_worker() -> bool:
+    return worker_id() is not None
+
+
+def worker_index() -> int:
+    return int(os.getenv(WORKER_INDEX_ENV, "0"))
+
+
+def worker_count() -> int:
+    return int(os.getenv(WORKER_COUNT_ENV, "1"))
+
+
+def shard(items: Sequence, index: int, count: int) -> list:
+    """Round-robin slice of `items` that belongs to worker `index` of `count`."""
+    return [it for i, it in enumerate(items) if i % count == index]
+
+
+def strip_workers_arg(args: Sequence[str]) -> List[str]:
+    """Drop `--workers N` / `--workers=N` so workers don't fork again."""
+    out, skip = [], False
+    for a in args:
+        if skip:
+            skip = False
+            continue
+        if a == "--workers":
+            skip = True
+            continue
+        if a.startswith("--workers="):
+            continue
+        out.append(a)
+    return out
+
+
+@dataclass
+class WorkerStats:
+    worker: str
+    tests: int = 0
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    busy_s: float = 0.0
+    wall_s: float = 0.0
+    exit_code: Optional[int] = None
+    started: float = field(default_factory=time.time)
+    # BROWSERS matrix: engine -> EngineStats fields (see matrix.py)
+    engines: Dict[str, dict] = field(default_factory=dict)
+    # @pytest.mark.records tests: DataStats fields (see data_source.py)
+    data: Dict[str, float] = field(default_factory=dict)
+    # CHECKPOINTS: ResumeStats fields (see checkpoints.py)
+    checkpoints: Dict[str, float] = field(default_factory=dict)
+    # PERF_METRICS: trend_samples() of this worker; the parent saves the run's history
+    perf: List[dict] = field(default_factory=list)
+
+    def record(self, report) -> None:
+        """Feed a pytest TestReport (setup, call or teardown)."""
+        self.busy_s += report.duration
+        if report.when == "call":
+            self.tests += 1
+            if report.passed:
+                self.passed += 1
+            elif report.failed:
+                self.failed += 1
+            else:
+                self.skipped += 1
+        elif report.failed:
+            # errors in setup/teardown fail the run as well
+            self.failed += 1
+        elif report.skipped and report.when == "setup":
+            self.tests += 1
+            self.skipped += 1
+
+    @property
+    def utilization(self) -> float:
+        return self.busy_s / self.wall_s if self.wall_s else 0.0
+
+    def save(self) -> Path:
+        self.wall_s = time.time() - self.started
+        path = artifacts_dir() / STATS_FILE
+        path.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "WorkerStats":
+        return cls(**json.loads(path.read_text(encoding="utf-8")))
+
+
+class WorkerPool:
+    """
+    Spawn `count` pytest workers, stream their output line by line with a
+    `[wN]` prefix and collect their stats once they exit.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        args: Sequence[str],
+        cwd: Path,
+        write_line: Callable[[str], None],
+        env: Optional[Dict[str, str]] = None,
+    ):
+        self.count = count
+        self.args = strip_workers_arg(args)
+        self.cwd = Path(cwd)
+        self.write_line = write_line
+        self.env = dict(env or {})  # extra variables for every worker (run id, schedule)
+        self._lock = threading.Lock()
+
+    def _worker_ids(self) -> List[str]:
+        return [f"w{i}" for i in range(self.count)]
+
+    def _pump(self, wid: str, stream) -> None:
+        for line in iter(stream.readline, ""):
+            with self._lock:
+                self.write_line(f"[{wid}] {line.rstrip()}")
+        stream.close()
+
+    def run(self) -> List[WorkerStats]:
+        ids = self._worker_ids()
+        log_offsets = {}
+        for wid in ids:
+            stale = ARTIFACTS_ROOT / wid / STATS_FILE
+            if stale.exists():
+                stale.unlink()
+            log = ARTIFACTS_ROOT / wid / "test.log"
+            log_offsets[wid] = log.stat().st_size if log.exists() else 0
+
+        procs: Dict[str, subprocess.Popen] = {}
+        threads, started = [], {}
+        for i, wid in enumerate(ids):
+            env = dict(os.environ, **self.env)
+            env.update({WORKER_ID_ENV: wid, WORKER_INDEX_ENV: str(i), WORKER_COUNT_ENV: str(self.count)})
+            started[wid] = time.time()
+            proc = subprocess.Popen(
+                [sys.executable, "-m", "pytest", "--no-header", *self.args],
+                cwd=str(self.cwd),
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+            )
+            procs[wid] = proc
+            t = threading.Thread(target=self._pump, args=(wid, proc.stdout), daemon=True)
+            t.start()
+            threads.append(t)
+
+        results = []
+        for wid, proc in procs.items():
+            code = proc.wait()
+            wall = time.time() - started[wid]
+            stats_path = ARTIFACTS_ROOT / wid / STATS_FILE
+            stats = WorkerStats.load(stats_path) if stats_path.exists() else WorkerStats(worker=wid)
+            # Wall time as seen from the parent includes interpreter + browser startup
+            stats.wall_s = wall
+            stats.exit_code = code
+            results.append(stats)
+        for t in threads:
+            t.join()
+
+        merge_worker_logs(log_offsets)
+        return results
+
+
+def merge_worker_logs(offsets: Dict[str, int]) -> None:
+    """Append the lines each worker logged during this run to artifacts/test.log, ordered by time."""
+    records = []
+    for wid, offset in offsets.items():
+        log = ARTIFACTS_ROOT / wid / "test.log"
+        if not log.exists():
+            continue
+        with log.open("r", encoding="utf-8", errors="replace") as fh:
+            fh.seek(offset)
+            for line in fh:
+                # Continuation lines (tracebacks) stick to the record above them
+                if records and records[-1][1] == wid and not line[:4].isdigit():
+                    records[-1][2].append(line)
+                else:
+                    records.append((line[:23], wid, [line]))
+    if not records:
+        return
+    records.sort(key=lambda r: r[0])
+    ARTIFACTS_ROOT.mkdir(parents=True, exist_ok=True)
+    with (ARTIFACTS_ROOT / "test.log").open("a", encoding="utf-8") as out:
+        for _, _, lines in records:
+            out.writelines(lines)
+
+
+def utilization_report(results: List[WorkerStats]) -> List[str]:
+    """Lines for the pytest terminal summary."""
+    lines = [f"{'worker':<8}{'tests':>7}{'failed':>8}{'busy s':>10}{'wall s':>10}{'util':>8}"]
+    for s in results:
+        lines.append(
+            f"{s.worker:<8}{s.tests:>7}{s.failed:>8}{s.busy_s:>10.2f}{s.wall_s:>10.2f}{s.utilization:>7.0%}"
+        )
+    wall = max((s.wall_s for s in results), default=0.0)
+    busy = sum(s.busy_s for s in results)
+    overall = busy / (wall * len(results)) if wall and results else 0.0
+    lines.append(
+        f"overall utilization {overall:.0%} across {len(results)} workers "
+        f"(cpu_count={os.cpu_count()}, session wall {wall:.2f}s)"
+    )
+    return lines
@@ -0,0 +1,240 @@
+import json
+import os
+import statistics
+import weakref
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from playwright.sync_api import Page, TimeoutError as PWTimeout
+
+from .artifacts import ARTIFACTS_ROOT
+
+# PERF_BUDGETS modes
+OFF = "off"
+WARN = "warn"
+ENFORCE = "enforce"
+MODES = (OFF, WARN, ENFORCE)
+
+# Shared by the playground page objects; generous enough for the live site,
+# tight enough to flag a page that got several times slower
+PLAYGROUND_BUDGETS = {
+    "dom_content_loaded_ms": 5000,
+    "load_ms": 12000,
+    "first_contentful_paint_ms": 5000,
+    "long_task_ms": 2000,
+}
+
+# Metrics shown (median) in the summary and tracked across runs
+TREND_METRICS = ("dom_content_loaded_ms", "load_ms", "first_contentful_paint_ms", "long_task_ms", "js_heap_mb")
+
+_LONG_TASKS_KEY = "__pw_long_tasks"
+
+# Init script: sum the long tasks (> 50 ms main-thread blocks) of every document
+LONG_TASKS_JS = """
+(() => {
+  const acc = window.%s = {count: 0, ms: 0};
+  try {
+    new PerformanceObserver(list => {
+      for (const e of list.getEntries()) { acc.count += 1; acc.ms += e.duration; }
+    }).observe({type: 'longtask', buffered: true});
+  } catch (e) { acc.count = acc.ms = null; /* engine without Long Tasks API */ }
+})();
+""" % _LONG_TASKS_KEY
+
+# Navigation Timing + paint entries of the current document, in ms from navigation start
+_COLLECT_JS = """
+() => {
+  const nav = performance.getEntriesByType('navigation')[0];
+  const paint = Object.fromEntries(performance.getEntriesByType('paint').map(e => [e.name, e.startTime]));
+  const lt = window.%s || {count: null, ms: null};
+  const ms = v => (v ? Math.round(v) : null);
+  return {
+    url: location.href,
+    ttfb_ms: nav ? ms(nav.responseStart) : null,
+    dom_content_loaded_ms: nav ? ms(nav.domContentLoadedEventEnd) : null,
+    load_ms: nav ? ms(nav.loadEventEnd) : null,
+    transfer_kb: nav && nav.transferSize ? Math.round(nav.transferSize / 102.4) / 10 : null,
+    first_paint_ms: ms(paint['first-paint']),
+    first_contentful_paint_ms: ms(paint['first-contentful-paint']),
+    long_tasks: lt.count,
+    long_task_ms: lt.ms === null ? null : Math.round(lt.ms),
+  };
+}
+""" % _LONG_TASKS_KEY
+
+# CDP Performance.getMetrics names -> (metric, scale); counters are reported per navigation
+_CDP_METRICS = {
+    "JSHeapUsedSize": ("js_heap_mb", 1 / (1024 * 1024)),
+    "LayoutCount": ("layout_count", 1),
+    "RecalcStyleCount": ("recalc_style_count", 1),
+    "ScriptDuration": ("script_ms", 1000),
+}
+_CDP_ABSOLUTE = {"JSHeapUsedSize"}
+
+_budgets: Dict[str, Dict[str, float]] = {}
+
+
+def parse_mode(value: Optional[str], default: str) -> str:
+    if value is None:
+        return default
+    value = value.strip().lower()
+    return value if value in MODES else default
+
+
+def register_budgets(page_object: str, budgets: Optional[Dict[str, float]]) -> None:
+    """Called for every page-object class (BasePage.__init_subclass__)."""
+    if budgets:
+        _budgets[page_object] = dict(budgets)
+
+
+def violations(page_object: str, metrics: dict) -> List[str]:
+    out = []
+    for metric, limit in _budgets.get(page_object, {}).items():
+        value = metrics.get(metric)
+        if value is not None and value > limit:
+            out.append(f"{page_object}.{metric}={value:g} > {limit:g}")
+    return out
+
+
+class PerfCollector:
+    """
+    Page metrics per navigation for one test page. Page objects call
+    collect() after BasePage.goto and the home nav helpers; the `page` fixture
+    creates the collector (PERF_METRICS=true) and reads the samples at teardown.
+    CDP metrics are Chromium-only and skipped on other engines.
+    """
+
+    _registry: "weakref.WeakKeyDictionary[Page, PerfCollector]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: Page, mode: str = WARN, load_timeout_ms: int = 10000):
+        self.page = page
+        self.mode = mode
+        self.load_timeout_ms = load_timeout_ms
+        self.samples: List[dict] = []
+        self.violations: List[str] = []
+        self._cdp = None
+        self._cdp_last: Dict[str, float] = {}
+        page.add_init_script(LONG_TASKS_JS)
+        try:
+            self._cdp = page.context.new_cdp_session(page)
+            self._cdp.send("Performance.enable")
+        except Exception:
+            self._cdp = None
+        PerfCollector._registry[page] = self
+
+    @classmethod
+    def for_page(cls, page: Page) -> Optional["PerfCollector"]:
+        return cls._registry.get(page)
+
+    def _cdp_metrics(self) -> dict:
+        if self._cdp is None:
+            return {}
+        try:
+            raw = {m["name"]: m["value"] for m in self._cdp.send("Performance.getMetrics")["metrics"]}
+        except Exception:
+            return {}
+        out = {}
+        for name, (metric, scale) in _CDP_METRICS.items():
+            if name not in raw:
+                continue
+            value = raw[name] if name in _CDP_ABSOLUTE else raw[name] - self._cdp_last.get(name, 0.0)
+            self._cdp_last[name] = raw[name]
+            out[metric] = round(value * scale, 1)
+        return out
+
+    def collect(self, page_object: str) -> dict:
+        """Record the current document's metrics for `page_object` and check its budgets."""
+        try:
+            # after a click navigation the new document may still be loading
+            self.page.wait_for_load_state("load", timeout=self.load_timeout_ms)
+        except PWTimeout:
+            pass
+        metrics = self.page.evaluate(_COLLECT_JS)
+        metrics.update(self._cdp_metrics())
+        sample = {"page_object": page_object, **metrics}
+        self.samples.append(sample)
+        if self.mode == OFF:
+            return sample
+        found = violations(page_object, metrics)
+        self.violations.extend(found)
+        if found and self.mode == ENFORCE:
+            raise AssertionError(f"Performance budget exceeded at {metrics['url']}: {', '.join(found)}")
+        return sample
+
+    def detach(self) -> None:
+        PerfCollector._registry.pop(self.page, None)
+        if self._cdp is not None:
+            try:
+                self._cdp.detach()
+            except Exception:
+                pass
+
+
+def medians(samples: List[dict]) -> Dict[str, Dict[str, float]]:
+    """page object -> metric -> median over `samples` (TREND_METRICS only)."""
+    grouped: Dict[str, Dict[str, List[float]]] = {}
+    for s in samples:
+        for metric in TREND_METRICS:
+            if s.get(metric) is not None:
+                grouped.setdefault(s["page_object"], {}).setdefault(metric, []).append(s[metric])
+    return {po: {m: statistics.median(v) for m, v in ms.items()} for po, ms in grouped.items()}
+
+
+def trend_samples(samples: List[dict]) -> List[dict]:
+    """Samples cut down to what medians() reads, for handing them from a worker to the parent."""
+    return [{k: s[k] for k in ("page_object", *TREND_METRICS) if s.get(k) is not None} for s in samples]
+
+
+class PerfHistory:
+    """
+    Per-run medians per page object, last `keep` runs. Saved once per run by
+    the main process; in parallel mode from the samples of all workers.
+    """
+
+    def __init__(self, path: Path, keep: int = 20):
+        self.path = Path(path)
+        self.keep = keep
+
+    def load(self) -> Dict[str, Dict[str, List[float]]]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+
+    def save(self, run: Dict[str, Dict[str, float]]) -> None:
+        if not run:
+            return
+        data = self.load()
+        for po, metrics in run.items():
+            for metric, value in metrics.items():
+                series = data.setdefault(po, {}).setdefault(metric, [])
+                series.append(round(value, 1))
+                del series[:-self.keep]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def perf_report(samples: List[dict], history: Dict[str, Dict[str, List[float]]]) -> List[str]:
+    """Median per page object and metric, with the change against the median of earlier runs."""
+    lines = []
+    counts: Dict[str, int] = {}
+    for s in samples:
+        counts[s["page_object"]] = counts.get(s["page_object"], 0) + 1
+    for po, metrics in sorted(medians(samples).items()):
+        parts = []
+        for metric in TREND_METRICS:
+            if metric not in metrics:
+                continue
+            value, past = metrics[metric], history.get(po, {}).get(metric)
+            trend = ""
+            if past:
+                base = statistics.median(past)
+                trend = f" ({(value - base) / base:+.0%})" if base else ""
+            parts.append(f"{metric}={value:g}{trend}")
+        lines.append(f"{po:<24} n={counts[po]:<4} " + ", ".join(parts))
+    return lines
+
+
+PERF_HISTORY = PerfHistory(ARTIFACTS_ROOT / "perf_history.json")
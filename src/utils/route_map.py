@@ -0,0 +1,78 @@
+import json
+import os
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .artifacts import ARTIFACTS_ROOT
+
+
+class RouteMap:
+    """
+    Scenario target URLs learned from real nav clicks, per base URL, persisted
+    so later runs (and other workers) can deep-link straight to them.
+
+    `enabled` is switched per test by the `page` fixture: NAV_MODE=deep-link
+    and no @pytest.mark.nav_coverage. While disabled, routes are still learned.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.enabled = False
+        self._routes: Optional[Dict[str, str]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        # deep_link / click / stale -> count
+        self.stats: Counter = Counter()
+
+    def _load(self) -> Dict[str, str]:
+        if self._routes is None:
+            try:
+                self._routes = json.loads(self.path.read_text(encoding="utf-8"))
+            except Exception:
+                self._routes = {}
+        return self._routes
+
+    @staticmethod
+    def key(base_url: str, route: str) -> str:
+        return f"{base_url.rstrip('/')}|{route}"
+
+    def get(self, key: str) -> Optional[str]:
+        return self._load().get(key)
+
+    def learn(self, key: str, url: str) -> None:
+        routes = self._load()
+        if routes.get(key) != url:
+            with self._lock:
+                routes[key] = url
+                self._dirty = True
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Merge this process' routes into the map file (workers share it)."""
+        if not self._dirty:
+            return
+        with self._lock:
+            try:
+                on_disk = json.loads(self.path.read_text(encoding="utf-8"))
+            except Exception:
+                on_disk = {}
+            on_disk.update(self._routes or {})
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(on_disk, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._dirty = False
+
+    def report(self) -> List[str]:
+        if not self.stats:
+            return []
+        return [", ".join(f"{k}={v}" for k, v in sorted(self.stats.items()))]
+
+
+ROUTES = RouteMap(ARTIFACTS_ROOT / "route_map.json")
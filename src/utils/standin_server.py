@@ -0,0 +1,227 @@
+"""
+Local stand-in for the playground pages the page objects drive, backed by a
+tiny form API, for load runs without touching the live site:
+
+    python -m src.utils.standin_server --port 8765 --latency-ms 50 --error-rate 0.01
+
+Serves /selenium-playground/ (left nav), simple-form-demo (message echoed
+through POST /api/message), input-form-demo (POST /api/submit) and
+drag-drop-range-sliders-demo. --latency-ms / --error-rate are applied to the
+API calls only, so page loads stay cheap and the form backend is what is
+being measured.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+PREFIX = "/selenium-playground"
+
+_LAYOUT = """<!doctype html>
+<html lang="en"><head><meta charset="utf-8"><title>{title} | Selenium Playground (stand-in)</title></head>
+<body>
+<nav><ul>
+  <li><a href="{prefix}/simple-form-demo">Simple Form Demo</a></li>
+  <li><a href="{prefix}/input-form-demo">Input Form Submit</a></li>
+  <li><a href="{prefix}/drag-drop-range-sliders-demo">Drag &amp; Drop Sliders</a></li>
+</ul></nav>
+<main>{body}</main>
+</body></html>
+"""
+
+_HOME = "<h1>Selenium Playground</h1><p>Stand-in server for load runs.</p>"
+
+_SIMPLE_FORM = """
+<h1>Simple Form Demo</h1>
+<section id="get-input">
+  <label for="user-message">Enter Message</label>
+  <input type="text" id="user-message" placeholder="Please enter your Message">
+  <button type="button" id="showInput">Get Checked Value</button>
+  <p>Your Message: <span id="message"></span></p>
+</section>
+<script>
+document.getElementById('showInput').addEventListener('click', async () => {
+  const value = document.getElementById('user-message').value;
+  const resp = await fetch('/api/message', {method: 'POST', headers: {'Content-Type': 'application/json'},
+                                            body: JSON.stringify({message: value})});
+  if (resp.ok) document.getElementById('message').textContent = (await resp.json()).message;
+});
+</script>
+"""
+
+_INPUT_FORM = """
+<h1>Input Form Submit</h1>
+<form id="seleniumform">
+  <label for="name">Name</label><input id="name" name="name" required>
+  <label for="inputEmail4">Email</label><input id="inputEmail4" name="email" type="email" required>
+  <label for="inputPassword4">Password</label><input id="inputPassword4" name="password" type="password" required>
+  <label for="company">Company</label><input id="company" name="company" required>
+  <label for="websitename">Website</label><input id="websitename" name="website" required>
+  <label for="country">Country</label>
+  <select id="country" name="country" required>
+    <option value="">Select</option><option>United States</option><option>India</option>
+    <option>Germany</option><option>United Kingdom</option>
+  </select>
+  <label for="inputCity">City</label><input id="inputCity" name="city" required>
+  <label for="inputAddress1">Address 1</label><input id="inputAddress1" name="address_line1" required>
+  <label for="inputAddress2">Address 2</label><input id="inputAddress2" name="address_line2" required>
+  <label for="inputState">State</label><input id="inputState" name="state" required>
+  <label for="inputZip">Zip code</label><input id="inputZip" name="zip" required>
+  <button type="submit">Submit</button>
+</form>
+<p class="success-msg hidden" hidden></p>
+<script>
+document.getElementById('seleniumform').addEventListener('submit', async ev => {
+  ev.preventDefault();
+  const data = Object.fromEntries(new FormData(ev.target).entries());
+  const resp = await fetch('/api/submit', {method: 'POST', headers: {'Content-Type': 'application/json'},
+                                           body: JSON.stringify(data)});
+  if (!resp.ok) return;
+  const msg = document.querySelector('.success-msg');
+  msg.textContent = 'Thanks for contacting us, we will get back to you shortly.';
+  msg.hidden = false;
+  msg.classList.remove('hidden');
+});
+</script>
+"""
+
+_SLIDERS = """
+<h1>Slider Demo</h1>
+<section class="slider-container">
+  <h4>Default value 15</h4>
+  <div class="range-row">
+    <input type="range" min="0" max="100" value="15" step="1" id="slider1">
+    <output id="range">15</output>
+  </div>
+</section>
+<section class="slider-container">
+  <h4>Default value 50</h4>
+  <div class="range-row">
+    <input type="range" min="0" max="100" value="50" step="1" id="slider2">
+    <output id="range2">50</output>
+  </div>
+</section>
+<script>
+for (const input of document.querySelectorAll('input[type=range]'))
+  input.addEventListener('input', () => { input.nextElementSibling.textContent = input.value; });
+</script>
+"""
+
+_PAGES = {
+    "": ("Home", _HOME),
+    "/simple-form-demo": ("Simple Form Demo", _SIMPLE_FORM),
+    "/input-form-demo": ("Input Form Submit", _INPUT_FORM),
+    "/drag-drop-range-sliders-demo": ("Drag & Drop Sliders", _SLIDERS),
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "StandinServer"
+
+    def log_message(self, fmt, *args):  # keep load runs quiet
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        page = _PAGES.get(path[len(PREFIX):].rstrip("/")) if path.startswith(PREFIX) else None
+        if page is None:
+            self._send(404, b"not found", "text/plain")
+            return
+        title, body = page
+        html = _LAYOUT.format(title=title, prefix=PREFIX, body=body)
+        self.server.count("GET")
+        self._send(200, html.encode("utf-8"), "text/html; charset=utf-8")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            data = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send(400, b'{"error": "bad json"}', "application/json")
+            return
+        if self.path not in ("/api/message", "/api/submit"):
+            self._send(404, b'{"error": "not found"}', "application/json")
+            return
+        srv = self.server
+        if srv.latency_ms:
+            time.sleep(srv.latency_ms / 1000)
+        if srv.error_rate and random.random() < srv.error_rate:
+            srv.count("error")
+            self._send(503, b'{"error": "injected"}', "application/json")
+            return
+        srv.count("POST")
+        if self.path == "/api/message":
+            out = {"message": str(data.get("message", ""))}
+        else:
+            out = {"ok": True, "fields": len(data)}
+        self._send(200, json.dumps(out).encode("utf-8"), "application/json")
+
+
+class StandinServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server on 127.0.0.1 (port 0 = any free port), run in a
+    background thread while used as a context manager.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency_ms: int = 0, error_rate: float = 0.0):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.requests = {"GET": 0, "POST": 0, "error": 0}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{PREFIX}/"
+
+    def count(self, kind: str) -> None:
+        with self._lock:
+            self.requests[kind] += 1
+
+    def __enter__(self) -> "StandinServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="standin-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def summary(self) -> str:
+        r = self.requests
+        return f"stand-in served {r['GET']} pages, {r['POST']} API calls, {r['error']} injected errors"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency-ms", type=int, default=0, help="Delay added to every API call.")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="Share of API calls answered with 503.")
+    args = ap.parse_args()
+    server = StandinServer(args.port, args.latency_ms, args.error_rate)
+    print(f"Serving {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(server.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+import contextvars
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .waits import WAIT_STATS
+
+
+class _CallCounter:
+    """Playwright protocol messages sent by this process (all pages, all threads)."""
+
+    def __init__(self):
+        self.n = 0
+        self.installed = False
+
+    def install(self) -> None:
+        if self.installed:
+            return
+        try:
+            from playwright._impl._connection import Connection
+        except ImportError:
+            return
+        original = getattr(Connection, "_send_message_to_server", None)
+        if original is None:
+            return  # private API moved: spans still work, pw_calls stays 0
+
+        @functools.wraps(original)
+        def counted(conn, *args, **kwargs):
+            self.n += 1
+            return original(conn, *args, **kwargs)
+
+        Connection._send_message_to_server = counted
+        self.installed = True
+
+
+PW_CALLS = _CallCounter()
+
+
+@dataclass
+class Span:
+    id: int
+    parent: Optional[int]
+    depth: int
+    step: str
+    start_ms: float
+    ms: float = 0.0
+    pw_calls: int = 0
+    wait_ms: float = 0.0
+    ok: bool = True
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile, q in [0, 100]."""
+    s = sorted(values)
+    if not s:
+        return 0.0
+    return s[min(len(s) - 1, max(0, int(round(q / 100 * (len(s) - 1)))))]
+
+
+class StepRecorder:
+    """
+    Nested timing spans for page-object methods. The parent span is tracked in
+    a context variable, so async scenarios running concurrently on one loop
+    each get their own tree. pw_calls and wait_ms are process-wide deltas over
+    the span (inclusive of child spans).
+    """
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._parent: contextvars.ContextVar = contextvars.ContextVar("step_parent", default=None)
+        self._t0 = time.perf_counter()
+        self._ids = 0
+        self._lock = threading.Lock()
+        # Called with every span as it closes (the load runner aggregates from these);
+        # keep=False stops collecting spans in memory while listeners still see them
+        self.listeners: List[Callable[[Span], None]] = []
+        self.keep = True
+        # counters=False leaves pw_calls / wait_ms at 0: they are process-wide, so
+        # meaningless when many scenarios run at once (load runs)
+        self.counters = True
+
+    def reset(self) -> None:
+        self.spans = []
+        self._t0 = time.perf_counter()
+
+    def _open(self, step: str):
+        parent: Optional[Span] = self._parent.get()
+        with self._lock:
+            self._ids += 1
+            span = Span(
+                id=self._ids,
+                parent=parent.id if parent else None,
+                depth=parent.depth + 1 if parent else 0,
+                step=step,
+                start_ms=(time.perf_counter() - self._t0) * 1000,
+            )
+            if self.keep:
+                self.spans.append(span)
+        token = self._parent.set(span)
+        if not self.counters:
+            return span, token, time.perf_counter(), None, None
+        return span, token, time.perf_counter(), PW_CALLS.n, WAIT_STATS.total_ms
+
+    def _close(self, opened, ok: bool) -> None:
+        span, token, t0, calls0, wait0 = opened
+        span.ms = (time.perf_counter() - t0) * 1000
+        if calls0 is not None:
+            span.pw_calls = PW_CALLS.n - calls0
+            span.wait_ms = max(0.0, WAIT_STATS.total_ms - wait0)
+        span.ok = ok
+        self._parent.reset(token)
+        for listener in self.listeners:
+            listener(span)
+
+    def wrap(self, step: str, fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_step(*args, **kwargs):
+                opened = self._open(step)
+                ok = False
+                try:
+                    result = await fn(*args, **kwargs)
+                    ok = True
+                    return result
+                finally:
+                    self._close(opened, ok)
+            wrapper = async_step
+        else:
+            @functools.wraps(fn)
+            def step_fn(*args, **kwargs):
+                opened = self._open(step)
+                ok = False
+                try:
+                    result = fn(*args, **kwargs)
+                    ok = True
+                    return result
+                finally:
+                    self._close(opened, ok)
+            wrapper = step_fn
+        wrapper.__timed_step__ = True
+        return wrapper
+
+    def write(self, path: Path, test: str) -> None:
+        if not self.spans:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as fh:
+            for span in self.spans:
+                fh.write(json.dumps({"test": test, **asdict(span)}) + "\n")
+
+    def durations(self) -> Dict[str, List[float]]:
+        out: Dict[str, List[float]] = defaultdict(list)
+        for span in self.spans:
+            out[span.step].append(span.ms)
+        return out
+
+
+STEPS = StepRecorder()
+
+
+def instrument(cls):
+    """
+    Time every public method defined on `cls` as a span named 'Class.method'.
+    _helpers, dunder methods, properties and static/class methods are left
+    alone; their time shows up in the public step that calls them.
+    """
+    PW_CALLS.install()
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(attr) or getattr(attr, "__timed_step__", False):
+            continue
+        setattr(cls, name, STEPS.wrap(f"{cls.__name__}.{name}", attr))
+    return cls
+
+
+def slowest_steps(durations: Dict[str, List[float]], limit: int = 15) -> List[str]:
+    """Report lines sorted by p95, slowest first."""
+    rows = sorted(durations.items(), key=lambda kv: -percentile(kv[1], 95))[:limit]
+    lines = [f"{'p50 ms':>10}{'p95 ms':>10}{'total ms':>11}{'n':>6}  step"]
+    for step, ms in rows:
+        lines.append(f"{percentile(ms, 50):>10.0f}{percentile(ms, 95):>10.0f}{sum(ms):>11.0f}{len(ms):>6}  {step}")
+    return lines
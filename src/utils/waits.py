@@ -0,0 +1,277 @@
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from playwright.sync_api import Locator, Page, TimeoutError as PWTimeout
+
+# Resolves once the element's box is unchanged for `frames` animation frames
+_STABLE_JS = """
+(el, [frames, timeout]) => new Promise(resolve => {
+  let last = null, same = 0;
+  const hard = setTimeout(() => resolve(false), timeout);
+  const tick = () => {
+    const r = el.getBoundingClientRect();
+    const key = [r.x, r.y, r.width, r.height].join(',');
+    same = key === last ? same + 1 : 0;
+    last = key;
+    if (same >= frames) { clearTimeout(hard); resolve(true); }
+    else requestAnimationFrame(tick);
+  };
+  requestAnimationFrame(tick);
+})
+"""
+
+# Resolves once no DOM mutation happened for `quiet` ms
+_SETTLED_JS = """
+([quiet, timeout]) => new Promise(resolve => {
+  let timer = null, hard = null;
+  const obs = new MutationObserver(() => { clearTimeout(timer); timer = setTimeout(() => done(true), quiet); });
+  const done = ok => { obs.disconnect(); clearTimeout(timer); clearTimeout(hard); resolve(ok); };
+  obs.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+  timer = setTimeout(() => done(true), quiet);
+  hard = setTimeout(() => done(false), timeout);
+})
+"""
+
+_VALUE_JS = "el => ('value' in el ? String(el.value) : el.textContent || '').trim()"
+
+_CHANGED_JS = """
+([el, old]) => {
+  const v = ('value' in el ? String(el.value) : el.textContent || '').trim();
+  return v !== old ? {v} : false;
+}
+"""
+
+# The number shown by the element (input value / text, non-numeric characters dropped) equals `expected`
+_VALUE_IS_JS = """
+([el, expected]) => {
+  const v = ('value' in el ? String(el.value) : el.textContent || '').trim();
+  const n = parseFloat(v.replace(/[^0-9.\\-]/g, ''));
+  return Math.abs(n - expected) <= 1e-9 * Math.max(1, Math.abs(expected)) ? {v} : false;
+}
+"""
+
+
+@dataclass
+class WaitRecord:
+    step: str
+    condition: str
+    ms: float
+    ok: bool
+    fixed: bool = False
+
+
+class WaitStats:
+    """
+    Wait time per page-object step; reset by the `page` fixture for every test.
+    total_ms is a running sum; keep=False stops storing the records themselves
+    (long load runs), so per_step() / fixed_sleeps() are then empty.
+    """
+
+    def __init__(self):
+        self.records: List[WaitRecord] = []
+        self.keep = True
+        self._total_ms = 0.0
+
+    def add(self, record: WaitRecord) -> None:
+        self._total_ms += record.ms
+        if self.keep:
+            self.records.append(record)
+
+    def reset(self) -> None:
+        self.records = []
+        self._total_ms = 0.0
+
+    def per_step(self) -> Dict[str, float]:
+        totals: Dict[str, float] = defaultdict(float)
+        for r in self.records:
+            totals[r.step] += r.ms
+        return dict(totals)
+
+    def fixed_sleeps(self) -> List[WaitRecord]:
+        return [r for r in self.records if r.fixed]
+
+    @property
+    def total_ms(self) -> float:
+        return self._total_ms
+
+
+WAIT_STATS = WaitStats()
+
+
+def read_value(locator: Locator) -> str:
+    """Current input value (or text) of `locator`, trimmed."""
+    return locator.evaluate(_VALUE_JS)
+
+
+def _caller(depth: int = 2) -> str:
+    # 0 = _caller, 1 = WaitEngine method (or sleep wrapper), 2 = page-object step
+    return sys._getframe(depth).f_code.co_name
+
+
+class WaitEngine:
+    """
+    Named readiness conditions used by page objects instead of fixed sleeps.
+    Every wait is recorded in WAIT_STATS under the calling step's name.
+    Conditions return False (or None) on timeout instead of raising, so the
+    caller's own assertion decides whether that is fatal.
+    """
+
+    def __init__(self, page: Page, stats: WaitStats = WAIT_STATS):
+        self.page = page
+        self.stats = stats
+
+    def _record(self, step: str, condition: str, t0: float, ok: bool) -> None:
+        self.stats.add(WaitRecord(step, condition, (time.perf_counter() - t0) * 1000, ok))
+
+    def network_idle(self, timeout: int = 5000) -> bool:
+        step, t0 = _caller(), time.perf_counter()
+        try:
+            self.page.wait_for_load_state("networkidle", timeout=timeout)
+            ok = True
+        except PWTimeout:
+            ok = False
+        self._record(step, "network_idle", t0, ok)
+        return ok
+
+    def dom_settled(self, quiet_ms: int = 150, timeout: int = 5000) -> bool:
+        step, t0 = _caller(), time.perf_counter()
+        try:
+            self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+            ok = bool(self.page.evaluate(_SETTLED_JS, [quiet_ms, timeout]))
+        except PWTimeout:
+            ok = False
+        self._record(step, "dom_settled", t0, ok)
+        return ok
+
+    def element_stable(self, locator: Locator, frames: int = 2, timeout: int = 5000) -> bool:
+        step, t0 = _caller(), time.perf_counter()
+        try:
+            locator.wait_for(state="visible", timeout=timeout)
+            ok = bool(locator.evaluate(_STABLE_JS, [frames, timeout]))
+        except PWTimeout:
+            ok = False
+        self._record(step, "element_stable", t0, ok)
+        return ok
+
+    def value_changed(self, locator: Locator, old: Optional[str] = None, timeout: int = 5000) -> Optional[str]:
+        """Wait until the input value / text of `locator` differs from `old`; return the new value."""
+        step, t0 = _caller(), time.perf_counter()
+        handle = None
+        try:
+            # a missing element times out here as well, and counts as "no change"
+            handle = locator.element_handle(timeout=timeout)
+            if old is None:
+                old = handle.evaluate(_VALUE_JS)
+            new = self.page.wait_for_function(_CHANGED_JS, arg=[handle, old], timeout=timeout).json_value()["v"]
+        except PWTimeout:
+            new = None
+        finally:
+            if handle is not None:
+                handle.dispose()
+        self._record(step, "value_changed", t0, new is not None)
+        return new
+
+    def value_is(self, locator: Locator, expected: float, timeout: int = 5000) -> Optional[str]:
+        """Wait until the number shown by `locator` equals `expected`; return the shown text."""
+        step, t0 = _caller(), time.perf_counter()
+        handle = None
+        try:
+            handle = locator.element_handle(timeout=timeout)
+            shown = self.page.wait_for_function(_VALUE_IS_JS, arg=[handle, expected], timeout=timeout).json_value()["v"]
+        except PWTimeout:
+            shown = None
+        finally:
+            if handle is not None:
+                handle.dispose()
+        self._record(step, "value_is", t0, shown is not None)
+        return shown
+
+
+class AsyncWaitEngine:
+    """WaitEngine for playwright.async_api pages (same conditions, same stats)."""
+
+    def __init__(self, page, stats: WaitStats = WAIT_STATS):
+        self.page = page
+        self.stats = stats
+
+    def _record(self, step: str, condition: str, t0: float, ok: bool) -> None:
+        self.stats.add(WaitRecord(step, condition, (time.perf_counter() - t0) * 1000, ok))
+
+    async def network_idle(self, timeout: int = 5000) -> bool:
+        step, t0 = _caller(), time.perf_counter()
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=timeout)
+            ok = True
+        except PWTimeout:
+            ok = False
+        self._record(step, "network_idle", t0, ok)
+        return ok
+
+    async def dom_settled(self, quiet_ms: int = 150, timeout: int = 5000) -> bool:
+        step, t0 = _caller(), time.perf_counter()
+        try:
+            await self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+            ok = bool(await self.page.evaluate(_SETTLED_JS, [quiet_ms, timeout]))
+        except PWTimeout:
+            ok = False
+        self._record(step, "dom_settled", t0, ok)
+        return ok
+
+    async def element_stable(self, locator, frames: int = 2, timeout: int = 5000) -> bool:
+        step, t0 = _caller(), time.perf_counter()
+        try:
+            await locator.wait_for(state="visible", timeout=timeout)
+            ok = bool(await locator.evaluate(_STABLE_JS, [frames, timeout]))
+        except PWTimeout:
+            ok = False
+        self._record(step, "element_stable", t0, ok)
+        return ok
+
+    async def value_changed(self, locator, old: Optional[str] = None, timeout: int = 5000) -> Optional[str]:
+        step, t0 = _caller(), time.perf_counter()
+        handle = None
+        try:
+            handle = await locator.element_handle(timeout=timeout)
+            if old is None:
+                old = await handle.evaluate(_VALUE_JS)
+            res = await self.page.wait_for_function(_CHANGED_JS, arg=[handle, old], timeout=timeout)
+            new = (await res.json_value())["v"]
+        except PWTimeout:
+            new = None
+        finally:
+            if handle is not None:
+                await handle.dispose()
+        self._record(step, "value_changed", t0, new is not None)
+        return new
+
+    async def value_is(self, locator, expected: float, timeout: int = 5000) -> Optional[str]:
+        step, t0 = _caller(), time.perf_counter()
+        handle = None
+        try:
+            handle = await locator.element_handle(timeout=timeout)
+            res = await self.page.wait_for_function(_VALUE_IS_JS, arg=[handle, expected], timeout=timeout)
+            shown = (await res.json_value())["v"]
+        except PWTimeout:
+            shown = None
+        finally:
+            if handle is not None:
+                await handle.dispose()
+        self._record(step, "value_is", t0, shown is not None)
+        return shown
+
+
+def flag_fixed_sleeps(page: Page, stats: WaitStats = WAIT_STATS) -> None:
+    """Wrap page.wait_for_timeout so any remaining hard-coded sleep shows up in the wait report."""
+    original = page.wait_for_timeout
+
+    def wait_for_timeout(timeout: float) -> None:
+        step, t0 = _caller(), time.perf_counter()
+        try:
+            original(timeout)
+        finally:
+            stats.add(WaitRecord(step, f"fixed_sleep({timeout:g}ms)", (time.perf_counter() - t0) * 1000, True, fixed=True))
+
+    page.wait_for_timeout = wait_for_timeout
@@ -0,0 +1,132 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from playwright.sync_api import Browser, BrowserContext, Page
+
+from .logger import get_logger
+
+logger = get_logger()
+
+_FCP_KEY = "__pw_first_fcp"
+
+# Init script: remember the first-contentful-paint of the first document this
+# tab paints (sessionStorage survives same-origin navigations, and is not part
+# of storage_state, so it never leaks into the snapshot)
+FIRST_PAINT_JS = """
+(() => {
+  const KEY = '%s';
+  try { if (sessionStorage.getItem(KEY) !== null) return; } catch (e) { return; }
+  new PerformanceObserver((list, obs) => {
+    for (const e of list.getEntries()) {
+      if (e.name !== 'first-contentful-paint') continue;
+      try { if (sessionStorage.getItem(KEY) === null) sessionStorage.setItem(KEY, String(e.startTime)); } catch (err) {}
+      obs.disconnect();
+    }
+  }).observe({type: 'paint', buffered: true});
+})();
+""" % _FCP_KEY
+
+
+def first_paint_ms(page: Page) -> Optional[float]:
+    """First contentful paint of the first page this tab loaded, if it was recorded."""
+    try:
+        value = page.evaluate(f"() => sessionStorage.getItem('{_FCP_KEY}')")
+    except Exception:
+        return None
+    return float(value) if value is not None else None
+
+
+class WarmState:
+    """
+    Session snapshot (cookies + localStorage) taken after one warm-up visit,
+    shared by every worker through `root`. Rebuilt when BASE_URL changes or
+    the snapshot is older than `ttl_s` seconds.
+
+    The browser's HTTP cache is per context and is not part of the snapshot;
+    what carries over is the consent cookie and any first-visit state the
+    site keeps in cookies / localStorage.
+    """
+
+    def __init__(self, root: Path, base_url: str, ttl_s: int):
+        self.root = Path(root)
+        self.base_url = base_url
+        self.ttl_s = ttl_s
+        self.state_path = self.root / "storage_state.json"
+        self.meta_path = self.root / "meta.json"
+        self.state: Optional[dict] = None
+        # first contentful paint of one URL in a cold and in a seeded context, this session (see compare())
+        self.cold_first_paint_ms: Optional[float] = None
+        self.warm_first_paint_ms: Optional[float] = None
+
+    def _read_meta(self) -> dict:
+        try:
+            return json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def is_fresh(self) -> bool:
+        meta = self._read_meta()
+        return (
+            self.state_path.exists()
+            and meta.get("base_url") == self.base_url
+            and time.time() - meta.get("created", 0) < self.ttl_s
+        )
+
+    def ensure(
+        self,
+        browser: Browser,
+        warm_up: Callable[[Page], None],
+        prepare: Optional[Callable[[BrowserContext], None]] = None,
+    ) -> "WarmState":
+        """Load the snapshot, or visit the site once with `warm_up` and save a new one."""
+        if self.is_fresh():
+            self.state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            logger.info(f"Warm state: reusing snapshot from {self.state_path}")
+            return self
+
+        t0 = time.perf_counter()
+        ctx = browser.new_context()
+        try:
+            if prepare is not None:
+                prepare(ctx)
+            page = ctx.new_page()
+            warm_up(page)
+            self.state = ctx.storage_state()
+        finally:
+            ctx.close()
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        meta = {"base_url": self.base_url, "created": time.time()}
+        for path, data in ((self.state_path, self.state), (self.meta_path, meta)):
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, path)
+        logger.info(
+            f"Warm state: new snapshot ({len(self.state.get('cookies', []))} cookies) "
+            f"in {time.perf_counter() - t0:.1f}s"
+        )
+        return self
+
+    def compare(
+        self,
+        browser: Browser,
+        url: str,
+        prepare: Optional[Callable[[BrowserContext], None]] = None,
+    ) -> "WarmState":
+        """Load `url` once in a cold and once in a seeded context and record both first paints."""
+        for attr, state in (("cold_first_paint_ms", None), ("warm_first_paint_ms", self.state)):
+            ctx = browser.new_context(storage_state=state)
+            try:
+                if prepare is not None:
+                    prepare(ctx)
+                page = ctx.new_page()
+                page.add_init_script(FIRST_PAINT_JS)
+                page.goto(url, wait_until="load")
+                setattr(self, attr, first_paint_ms(page))
+            finally:
+                ctx.close()
+        logger.info(f"Warm state: first paint of {url} cold={self.cold_first_paint_ms} warm={self.warm_first_paint_ms}")
+        return self
@@ -0,0 +1,11 @@
+from src.pages.aio.scenarios import SCENARIOS
+from src.utils.aio_runner import failures
+
+def test_scenarios_concurrently(aio, settings):
+    # All three scenarios on one event loop, each in its own context
+    results = aio.run({
+        name: (lambda page, fn=fn: fn(page, settings.base_url, settings.timeout_ms))
+        for name, fn in SCENARIOS.items()
+    })
+    print(aio.summary())
+    assert not failures(results), failures(results)
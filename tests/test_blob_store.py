@@ -0,0 +1,56 @@
+import base64
+import json
+import zipfile
+
+from src.utils.blob_store import BlobStore, pack_har, pack_trace, rebuild
+
+def _har(path, tag):
+    entries = [
+        {"request": {"method": "GET", "url": f"https://example.test/{tag}.css"},
+         "response": {"status": 200, "content": {"size": 11, "mimeType": "text/css", "text": "body { } ü"}}},
+        {"request": {"method": "GET", "url": f"https://example.test/{tag}.png"},
+         "response": {"status": 200, "content": {"size": 4, "mimeType": "image/png", "encoding": "base64",
+                                                 "text": base64.b64encode(b"\x89PNG").decode("ascii")}}},
+        {"request": {"method": "GET", "url": f"https://example.test/{tag}/empty"},
+         "response": {"status": 204, "content": {"size": 0, "mimeType": "x-unknown"}}},
+    ]
+    # the layout Playwright uses: log.entries is the last key
+    har = {"log": {"version": "1.2", "creator": {"name": "Playwright"}, "pages": [], "entries": entries}}
+    path.write_text(json.dumps(har), encoding="utf-8")
+    return path.read_bytes()
+
+def _trace(path):
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("trace.trace", b'{"type":"before"}\n')
+        zf.writestr("resources/abc.css", b"body { }")
+    with zipfile.ZipFile(path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+def test_pack_then_rebuild_restores_the_har(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    original = _har(tmp_path / "a.har", "a")
+    ref, written = pack_har(tmp_path / "a.har", store)
+    assert not (tmp_path / "a.har").exists()
+    assert written == len("body { } ü".encode("utf-8")) + len(b"\x89PNG")
+    assert rebuild(ref, store).read_bytes() == original
+
+def test_second_har_with_the_same_bodies_writes_nothing(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    _har(tmp_path / "a.har", "a")
+    pack_har(tmp_path / "a.har", store)
+    original = _har(tmp_path / "b.har", "b")  # other URLs, same bodies
+    ref, written = pack_har(tmp_path / "b.har", store)
+    assert written == 0
+    assert rebuild(ref, store).read_bytes() == original
+
+def test_pack_then_rebuild_restores_the_trace(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    members = _trace(tmp_path / "a.zip")
+    ref, written = pack_trace(tmp_path / "a.zip", store)
+    assert not (tmp_path / "a.zip").exists()
+    assert written == sum(len(data) for data in members.values())
+    with zipfile.ZipFile(rebuild(ref, store)) as zf:
+        assert {name: zf.read(name) for name in zf.namelist()} == members
+
+    _trace(tmp_path / "b.zip")
+    assert pack_trace(tmp_path / "b.zip", store)[1] == 0
@@ -0,0 +1,36 @@
+from src.utils.data_source import DataSource
+
+def _ids(source, **kwargs):
+    return [ref.id for ref in source.refs(**kwargs)]
+
+def test_csv_with_bom_keeps_the_first_column_name(tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_bytes("\ufeffid,name\nanna,Anna\nravi,Ravi\n".encode("utf-8"))
+    source = DataSource(path)
+    assert _ids(source) == ["anna", "ravi"]
+    assert next(source.refs()).load() == {"id": "anna", "name": "Anna"}
+
+def test_ids_come_from_id_field_else_stem_and_line(tmp_path):
+    path = tmp_path / "messages.jsonl"
+    path.write_text('{"key": "welcome", "text": "hi"}\n{"text": "no key"}\n\n{"key": "", "text": "empty key"}\n',
+                    encoding="utf-8")
+    # the blank line 3 is skipped but still counted
+    assert _ids(DataSource(path, id_field="key")) == ["welcome", "messages-2", "messages-4"]
+    assert _ids(DataSource(path)) == ["messages-1", "messages-2", "messages-4"]
+
+def test_duplicate_ids_get_their_line(tmp_path):
+    path = tmp_path / "dupes.csv"
+    path.write_text("id,v\na,1\nb,2\na,3\n", encoding="utf-8")
+    refs = list(DataSource(path).refs())
+    assert [r.id for r in refs] == ["a", "b", "a-4"]
+    assert refs[2].load() == {"id": "a", "v": "3"}
+
+def test_limit_applies_before_sharding(tmp_path):
+    path = tmp_path / "rows.jsonl"
+    path.write_text("".join(f'{{"id": "r{i}"}}\n' for i in range(1, 8)), encoding="utf-8")
+    source = DataSource(path)
+    assert _ids(source, limit=5, index=0, count=2) == ["r1", "r3", "r5"]
+    assert _ids(source, limit=5, index=1, count=2) == ["r2", "r4"]
+    # the shards of all workers together are exactly the limited records
+    shards = [_ids(source, limit=5, index=i, count=3) for i in range(3)]
+    assert sorted(sum(shards, [])) == _ids(source, limit=5)
@@ -0,0 +1,56 @@
+import pytest
+
+from src.utils import history
+from src.utils.history import ResultsDB
+
+def _write_run(db, totals):
+    # one run: each test's total split over setup / call / teardown
+    for nodeid, seconds in totals.items():
+        for phase, share in (("setup", 0.25), ("call", 0.5), ("teardown", 0.25)):
+            db.add(nodeid, "main", phase, "passed", seconds * share)
+    db.flush()
+    run_id, db.run_id = db.run_id, None  # the next flush starts a new run
+    return run_id
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.delenv(history.RUN_ID_ENV, raising=False)
+    return ResultsDB(tmp_path / "history.sqlite", history_runs=3)
+
+def test_lpt_packs_longest_first_onto_least_loaded_worker():
+    durations = {"a": 5.0, "b": 4.0, "c": 3.0, "d": 3.0, "e": 2.0}
+    assignment = history.lpt(durations, [0, 1])
+    # a -> 0, b -> 1, c -> 1 (4 < 5), d -> 0 (5 < 7), e -> 1 (7 < 8)
+    assert assignment == {"a": 0, "b": 1, "c": 1, "d": 0, "e": 1}
+    assert history.balance_report(assignment, durations).endswith("(longest 9.0s vs ideal 8.5s)")
+
+def test_lpt_only_uses_the_given_workers():
+    assert set(history.lpt({"a": 1.0, "b": 1.0, "c": 1.0}, [2, 3]).values()) == {2, 3}
+
+def test_tests_without_history_get_the_median_duration():
+    assert history.with_defaults(["a", "b", "new"], {"a": 2.0, "b": 6.0, "x": 10.0}) == {"a": 2.0, "b": 6.0, "new": 6.0}
+    assert history.with_defaults(["new"], {}) == {"new": 1.0}
+
+def test_round_trip_through_the_db(db):
+    assert db.expected_durations(["t::a"]) == {}
+    run_id = _write_run(db, {"t::a": 2.0, "t::b": 4.0})
+    assert db.expected_durations(["t::a", "t::b", "t::new"]) == {"t::a": 2.0, "t::b": 4.0}
+    (rid, _, workers, tests, failed, _), = db.runs()
+    assert (rid, workers, tests, failed) == (run_id, 1, 2, 0)
+    assert [(n, med) for n, med, *_ in db.slowest()] == [("t::b", 4.0), ("t::a", 2.0)]
+
+def test_expected_duration_uses_each_tests_last_history_runs(db):
+    for seconds in (100.0, 1.0, 2.0, 3.0):
+        _write_run(db, {"t::a": seconds, "t::b": seconds})
+    _write_run(db, {"t::a": 4.0})
+    _write_run(db, {"t::a": 5.0})
+    # t::a: median of 3, 4, 5; t::b did not run lately, its own last three runs count: 1, 2, 3
+    assert db.expected_durations(["t::a", "t::b"]) == {"t::a": 4.0, "t::b": 2.0}
+
+def test_flush_prunes_runs_beyond_keep_runs(db):
+    db.keep_runs = 4
+    run_ids = [_write_run(db, {"t::a": float(i + 1)}) for i in range(6)]
+    assert [r[0] for r in db.runs()] == run_ids[::-1][:4]
+    slowest = db.slowest(runs=10)
+    assert slowest[0][4] == 4  # runs seen for t::a
+    assert db.trend("t::a", runs=10)["t::a"][0] == (run_ids[2], 3.0)
@@ -1,23 +1,18 @@
 # tests/test_input_form_submit.py
+import pytest
+
 from src.pages.selenium_playground_home import SeleniumPlaygroundHome
 from src.pages.input_form_submit_page import InputFormSubmitPage
 
-def test_input_form_submit(page, settings):
-    home = SeleniumPlaygroundHome(page, base_url=settings.base_url, default_timeout_ms=settings.timeout_ms).open()
-    home.open_input_form_submit()
+@pytest.mark.records("tests/data/input_form.csv")
+def test_input_form_submit(page, settings, record, checkpoints):
+    # With CHECKPOINTS=true a rerun resumes after the last step that passed
+    home = SeleniumPlaygroundHome(page, base_url=settings.base_url, default_timeout_ms=settings.timeout_ms)
+    checkpoints.step(home.open)
+    checkpoints.step(home.open_input_form_submit)
 
     form = InputFormSubmitPage(page, base_url=settings.base_url, default_timeout_ms=settings.timeout_ms)
-    form.submit_blank_and_assert_error()
-    form.fill_form_and_submit(
-        name="Madhira Sirisha",
-        email="sirisha@example.com",
-        password="Secure@1234",
-        company="Contoso QA",
-        website="https://example.com",
-        country_label="United States",
-        city="Hyderabad",
-        address1="Road No 1",
-        address2="Banjara Hills",
-        state="Telangana",
-        zipcode="500034",
-    )
\ No newline at end of file
+    checkpoints.step(form.submit_blank_and_assert_error)
+    # One row of tests/data/input_form.csv; the `id` column only names the test
+    fields = {k: v for k, v in record.items() if k != "id"}
+    checkpoints.step(form.fill_form_and_submit, **fields)
@@ -0,0 +1,56 @@
+import json
+
+from src.pages.aio.scenarios import SCENARIOS
+from src.utils.load_runner import JOURNEY_STEP, LatencyHistogram, LoadProfile, LoadRunner
+from src.utils.standin_server import StandinServer
+
+def test_load_run_against_standin(aio_loop, async_browser, settings, tmp_path):
+    # A short ramp-up + hold with two virtual users on the local stand-in
+    results = tmp_path / "load.jsonl"
+    with StandinServer() as server:
+        runner = LoadRunner(
+            [async_browser],
+            {"simple_form_demo": SCENARIOS["simple_form_demo"]},
+            server.base_url,
+            LoadProfile(users=2, ramp_up_s=1, hold_s=3),
+            results,
+            timeout_ms=settings.timeout_ms,
+            interval_s=1,
+        )
+        totals = aio_loop.run_until_complete(runner.run())
+    print("\n".join(runner.report()))
+
+    journey = totals[("simple_form_demo", JOURNEY_STEP)]
+    assert journey.n >= 2 and journey.errors == 0, journey.to_json()
+    assert ("simple_form_demo", "SimpleFormDemoPage.enter_message") in totals
+
+    lines = [json.loads(line) for line in results.read_text(encoding="utf-8").splitlines()]
+    assert {line["type"] for line in lines} == {"interval", "total"}
+    assert all({"p50", "p95", "p99", "error_rate"} <= set(line) for line in lines)
+
+def test_histogram_percentiles_within_bucket_resolution():
+    hist = LatencyHistogram()
+    for ms in range(1, 1001):
+        hist.add(float(ms))
+    for q, exact in ((50, 500), (95, 950), (99, 990)):
+        # the upper bound of the holding bucket: never below the exact value, at most ~2% above
+        assert exact <= hist.percentile(q) <= exact * LatencyHistogram.GROWTH, q
+    assert hist.percentile(100) == hist.max_ms == 1000.0
+
+def test_histogram_percentile_never_exceeds_max():
+    hist = LatencyHistogram()
+    for ms in (120.0, 121.0, 121.5):
+        hist.add(ms)
+    assert all(hist.percentile(q) <= 121.5 for q in (1, 50, 99, 100))
+
+def test_empty_histogram():
+    hist = LatencyHistogram()
+    assert (hist.percentile(50), hist.error_rate) == (0.0, 0.0)
+    assert hist.to_json() == {"n": 0, "errors": 0, "error_rate": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+def test_histogram_counts_errors():
+    hist = LatencyHistogram()
+    for i in range(8):
+        hist.add(10.0, ok=i % 4 != 0)
+    assert (hist.n, hist.errors, hist.error_rate) == (8, 2, 0.25)
+    assert hist.to_json()["error_rate"] == 0.25
@@ -0,0 +1,11 @@
+import pytest
+from src.pages.selenium_playground_home import SeleniumPlaygroundHome
+
+@pytest.mark.nav_coverage
+def test_left_nav_reaches_every_scenario(page, settings):
+    # Real clicks from the home page; also (re)learns the deep-link routes
+    home = SeleniumPlaygroundHome(page, base_url=settings.base_url, default_timeout_ms=settings.timeout_ms)
+    home.open().open_simple_form_demo()
+    home.open().open_drag_drop_sliders()
+    home.open().open_input_form_submit()
+    home.open().assert_on_home()
@@ -0,0 +1,36 @@
+from src.pages.range_slider import RangeSlider
+
+PERCENT = {"min": 0, "max": 100, "step": 1}
+
+def test_snap_clamps_to_the_bounds():
+    assert RangeSlider.snap(-20, PERCENT) == 0
+    assert RangeSlider.snap(150, PERCENT) == 100
+    # 5, 15, ... 95: max itself is not on a step
+    assert RangeSlider.snap(100, {"min": 5, "max": 100, "step": 10}) == 95
+
+def test_snap_rounds_to_the_nearest_step():
+    assert RangeSlider.snap(42.4, PERCENT) == 42
+    assert RangeSlider.snap(22, {"min": 5, "max": 100, "step": 10}) == 25
+    assert RangeSlider.snap(25, {"min": 0, "max": 100, "step": 10}) == 30  # halves go up
+    assert isinstance(RangeSlider.snap(40.0, PERCENT), int)
+
+def test_snap_non_integer_steps():
+    tenths = {"min": 0, "max": 1, "step": 0.1}
+    assert RangeSlider.snap(0.34, tenths) == 0.3
+    assert RangeSlider.snap(0.96, tenths) == 1
+    assert RangeSlider.snap(2.6, {"min": 0, "max": 10, "step": 0.25}) == 2.5
+
+def test_key_plan_uses_arrows_for_short_moves():
+    assert RangeSlider.key_plan(15, 17, PERCENT) == ["ArrowRight"] * 2
+    assert RangeSlider.key_plan(50, 47, PERCENT) == ["ArrowLeft"] * 3
+    assert RangeSlider.key_plan(50, 50, PERCENT) == []
+
+def test_key_plan_jumps_with_home_and_end():
+    assert RangeSlider.key_plan(15, 95, PERCENT) == ["End"] + ["ArrowLeft"] * 5
+    assert RangeSlider.key_plan(60, 2, PERCENT) == ["Home"] + ["ArrowRight"] * 2
+    assert RangeSlider.key_plan(50, 100, PERCENT) == ["End"]
+
+def test_key_plan_counts_presses_in_steps():
+    assert RangeSlider.key_plan(1.0, 2.0, {"min": 0, "max": 10, "step": 0.5}) == ["ArrowRight"] * 2
+    # a tie with Home + ArrowRight keeps the plain arrows
+    assert RangeSlider.key_plan(0.3, 0.1, {"min": 0, "max": 1, "step": 0.1}) == ["ArrowLeft"] * 2
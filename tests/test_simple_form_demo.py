@@ -1,7 +1,10 @@
+import pytest
+
 from src.pages.selenium_playground_home import SeleniumPlaygroundHome
 from src.pages.simple_form_demo_page import SimpleFormDemoPage
 
-def test_simple_form_demo_steps_2_to_7(page, settings):
+@pytest.mark.records("tests/data/messages.jsonl")
+def test_simple_form_demo_steps_2_to_7(page, settings, record):
     # 1) Open base URL
     home = SeleniumPlaygroundHome(page, base_url=settings.base_url, default_timeout_ms=settings.timeout_ms).open()
 
@@ -13,8 +16,8 @@ def test_simple_form_demo_steps_2_to_7(page, settings):
     simple = SimpleFormDemoPage(page, base_url=settings.base_url, default_timeout_ms=settings.timeout_ms)
     simple.assert_url_contains()
 
-    # 4) Create variable for message
-    message = "Welcome to TestMu AI"
+    # 4) Create variable for message (one line of tests/data/messages.jsonl)
+    message = record["message"]
 
     # 5) Enter message in the textbox
     simple.enter_message(message)